@@ -0,0 +1,73 @@
+"""
+Custos de lotes em centavos int64 (``nucleo.centavos``) contra
+``decimal.Decimal`` e float: calcula comissão, ITBI e registro de cada lote
+(arredondados para o centavo), soma o custo total e formata todos os
+valores. Confere que centavos e Decimal dão o mesmo total e mostra quanto o
+total em float se afasta.
+
+Uso: python -m benchmarks.bench_centavos [lotes]
+"""
+import sys
+import time
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+
+from nucleo import centavos
+from nucleo.custos import calcular_custos
+from nucleo.formatacao import format_brl, format_brl_array
+
+PERC_ITBI, PERC_REGISTRO = 2.5, 1.2
+
+
+def com_decimal(lances: list) -> tuple:
+    centavo = Decimal("0.01")
+    taxas = [Decimal("0.05"), Decimal(str(PERC_ITBI)) / 100, Decimal(str(PERC_REGISTRO)) / 100]
+    totais = [v + sum((v * t).quantize(centavo, ROUND_HALF_UP) for t in taxas) for v in lances]
+    textos = [format_brl(v) for v in totais]
+    return sum(totais), textos
+
+
+def com_centavos(lances: np.ndarray) -> tuple:
+    custos = centavos.calcular_custos_centavos(lances, PERC_ITBI, PERC_REGISTRO)
+    return centavos.somar(custos.custo_total_avancado), centavos.formatar(custos.custo_total_avancado)
+
+
+def com_float(lances: np.ndarray) -> tuple:
+    custos = calcular_custos(lances, PERC_ITBI, PERC_REGISTRO)
+    return float(custos.custo_total_avancado.sum()), format_brl_array(custos.custo_total_avancado)
+
+
+def main(lotes: int = 1_000_000):
+    rng = np.random.default_rng(42)
+    lances_reais = np.round(rng.lognormal(mean=12.0, sigma=0.8, size=lotes), 2)
+    lances_centavos = centavos.de_reais(lances_reais)
+    lances_decimal = [Decimal(texto) for texto in np.char.mod("%.2f", lances_reais).tolist()]
+
+    inicio = time.perf_counter()
+    total_decimal, textos_decimal = com_decimal(lances_decimal)
+    tempo_decimal = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    total_centavos, textos_centavos = com_centavos(lances_centavos)
+    tempo_centavos = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    total_float, _ = com_float(lances_reais)
+    tempo_float = time.perf_counter() - inicio
+
+    if Decimal(total_centavos) / 100 != total_decimal or textos_centavos != textos_decimal:
+        raise SystemExit("ERRO: centavos e Decimal diferem")
+
+    print(f"Lotes: {lotes:,}".replace(",", "."))
+    print(f"Decimal:  {tempo_decimal:.3f} s  total R$ {format_brl(total_decimal)}")
+    print(f"Centavos: {tempo_centavos:.3f} s  total R$ {centavos.formatar([total_centavos])[0]} "
+          f"({tempo_decimal / tempo_centavos:.1f}x mais rápido, mesmo total e mesmo texto)")
+    diferenca = round(abs(total_float * 100 - total_centavos))
+    print(f"Float:    {tempo_float:.3f} s  total R$ {format_brl(total_float)} "
+          f"(diferença de {diferenca} centavos em relação às taxas arredondadas por lote)")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:2]]
+    main(*argumentos)
@@ -0,0 +1,75 @@
+"""
+Edição de uma célula na comparação de lotes: recálculo incremental
+(``Comparacao.alterar``, só o lote e os derivados afetados, resumo ajustado)
+contra recalcular todos os lotes e refazer o resumo a cada edição, como uma
+página sem estado faria.
+
+Uso: python -m benchmarks.bench_comparacao [lotes] [edicoes]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from nucleo.comparacao import CAMPOS_ENTRADA, PADROES_ENTRADA, Comparacao
+from nucleo.portfolio import calcular_portfolio, calcular_retorno_portfolio, normalizar_portfolio
+
+
+def lotes_aleatorios(quantidade: int, rng) -> list:
+    return [{
+        "valor_lance": round(float(rng.uniform(80_000, 600_000)), 2),
+        "debitos_passados": round(float(rng.uniform(0, 20_000)), 2),
+        "custo_reforma": round(float(rng.uniform(0, 60_000)), 2),
+        "honorarios_adv": 3_000.0,
+        "seguro_imovel": 800.0,
+        "valor_mercado": round(float(rng.uniform(100_000, 900_000)), 2),
+    } for _ in range(quantidade)]
+
+
+def edicoes_aleatorias(quantidade: int, lotes: int, rng) -> list:
+    campos = rng.choice(CAMPOS_ENTRADA, quantidade)
+    return [(int(rng.integers(lotes)), str(campo),
+             float(rng.choice([2.0, 2.5, 3.0])) if campo.startswith("perc_") else round(float(rng.uniform(0, 6e5)), 2))
+            for campo in campos]
+
+
+def recalcular_tudo(entradas: pd.DataFrame) -> pd.DataFrame:
+    resultado = calcular_retorno_portfolio(calcular_portfolio(normalizar_portfolio(entradas)))
+    resultado.agg(["sum", "min", "max"], numeric_only=True)
+    return resultado
+
+
+def main(lotes: int = 50, edicoes: int = 500):
+    rng = np.random.default_rng(42)
+    iniciais = lotes_aleatorios(lotes, rng)
+    sequencia = edicoes_aleatorias(edicoes, lotes, rng)
+
+    comparacao = Comparacao(iniciais)
+    recalculos = comparacao.recalculos
+    inicio = time.perf_counter()
+    for indice, campo, valor in sequencia:
+        comparacao.alterar(indice, campo, valor)
+    incremental_ms = (time.perf_counter() - inicio) / edicoes * 1000
+    recalculos = comparacao.recalculos - recalculos
+
+    entradas = pd.DataFrame(iniciais)
+    for campo in CAMPOS_ENTRADA:
+        if campo not in entradas:
+            entradas[campo] = PADROES_ENTRADA.get(campo, 0.0)
+    inicio = time.perf_counter()
+    for indice, campo, valor in sequencia:
+        entradas.loc[indice, campo] = valor
+        resultado = recalcular_tudo(entradas)
+    completo_ms = (time.perf_counter() - inicio) / edicoes * 1000
+
+    divergencia = np.abs(comparacao.derivados["custo_total_avancado"] - resultado["custo_total_avancado"]).max()
+    print(f"{lotes} lotes, {edicoes} edições de uma célula")
+    print(f"Recálculo incremental: {incremental_ms:.3f} ms por edição ({recalculos} recálculos de lote)")
+    print(f"Recalcular todos:      {completo_ms:.3f} ms por edição ({lotes * edicoes} recálculos de lote)")
+    print(f"Ganho: {completo_ms / incremental_ms:.1f}x; maior diferença no custo total: R$ {divergencia:.6f}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:3]]
+    main(*argumentos)
@@ -0,0 +1,84 @@
+"""
+Gravação e restauração de checklists salvos (``nucleo.estado``): tamanho do
+BLOB comprimido por checklist, tempo para retomar um lote (uma leitura pela
+chave) e tempo para carregar todos os checklists de um painel.
+
+Uso: python -m benchmarks.bench_estado [checklists]
+"""
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from nucleo.estado import BancoChecklists, codificar
+
+
+def checklist_aleatorio(rng) -> dict:
+    """
+    Checklist preenchido com os campos e tipos de ``paginas/completo.py``.
+    """
+    estado = {
+        "nome_comprador": "Maria da Silva",
+        "objetivo": str(rng.choice(["Moradia Própria", "Investimento (Revenda)", "Investimento (Locação)"])),
+        "local_imovel": str(rng.choice(["Goiânia - Setor Bueno", "Anápolis - Jundiaí", "Aparecida de Goiânia"])),
+        "tipo_imovel": str(rng.choice(["Casa", "Apartamento", "Lote/Terreno"])),
+        "tipo_leilao": str(rng.choice(["Judicial", "Extrajudicial"])),
+        "ocupado": str(rng.choice(["Desocupado", "Ocupado"])),
+        "forma_pagamento": str(rng.choice(["À Vista", "Financiamento Caixa", "Parcelamento Judicial (CPC 895)"])),
+        "sistema_amortizacao": "SAC",
+        "prazo_financiamento": 360, "n_parcelas": 30, "prazo_venda": 12,
+        "perc_itbi": 2.5, "perc_registro": 1.2, "perc_entrada_financiamento": 25.0,
+        "taxa_juros_anual": 11.5, "taxa_desconto_anual": 10.0, "tr_mensal": 0.0,
+        "taxa_seguro_mensal": 0.03, "tarifa_mensal": 25.0, "perc_custos_venda": 6.0,
+    }
+    for campo in ("valor_orcamento_max", "valor_mercado", "valor_lance", "debitos_passados", "custo_reforma",
+                  "honorarios_adv", "seguro_imovel", "custo_mensal_manutencao"):
+        estado[campo] = round(float(rng.uniform(0, 600_000)), 2)
+    for campo in ("verificou_financiamento", "visitou", "conversou_corretores", "verificou_averbacoes",
+                  "edital_lido", "matricula_conf", "check_notif", "verificou_processos", "verificou_locacao",
+                  "cadastro_feito", "verifica_data_leilao", "depositou_valor", "pagou_comissao",
+                  "judicial_homologacao", "extrajudicial_assinou", "pagou_itbi", "registrou_imovel", "acao_posse"):
+        estado[campo] = bool(rng.integers(2))
+    return estado
+
+
+def main(checklists: int = 1000):
+    rng = np.random.default_rng(42)
+    estados = [checklist_aleatorio(rng) for _ in range(checklists)]
+    json_bytes = statistics.mean(len(json.dumps(e).encode("utf-8")) for e in estados)
+    blob_bytes = statistics.mean(len(codificar(e)) for e in estados)
+
+    with tempfile.TemporaryDirectory() as pasta, BancoChecklists(str(Path(pasta) / "checklists.sqlite3")) as banco:
+        inicio = time.perf_counter()
+        for i, estado in enumerate(estados):
+            banco.salvar(f"analista{i % 10}", f"lote{i}", estado)
+        gravacao_ms = (time.perf_counter() - inicio) / checklists * 1000
+
+        tempos = []
+        for i in range(0, checklists, max(1, checklists // 200)):
+            inicio = time.perf_counter()
+            banco.carregar(f"analista{i % 10}", f"lote{i}")
+            tempos.append((time.perf_counter() - inicio) * 1000)
+        retomar_ms = statistics.median(tempos)
+
+        tempos = []
+        for _ in range(5):
+            inicio = time.perf_counter()
+            tabela = banco.carregar_todos()
+            tempos.append((time.perf_counter() - inicio) * 1000)
+        painel_ms = statistics.median(tempos)
+
+    print(f"{checklists} checklists de {len(estados[0])} campos")
+    print(f"Tamanho por checklist: {blob_bytes:.0f} bytes (JSON sem compressão: {json_bytes:.0f} bytes)")
+    print(f"Gravar um checklist: {gravacao_ms:.3f} ms")
+    print(f"Retomar um lote: {retomar_ms:.3f} ms")
+    print(f"Carregar todos ({len(tabela)} linhas) para o painel: {painel_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:2]]
+    main(*argumentos)
@@ -0,0 +1,38 @@
+"""
+Compara ``format_brl`` (um valor por chamada) com ``format_brl_array``
+(coluna inteira) em 1 milhão de valores e confere se o texto é idêntico.
+
+Uso: python -m benchmarks.bench_format_brl [quantidade]
+"""
+import sys
+import time
+
+import numpy as np
+
+from nucleo.formatacao import format_brl, format_brl_array
+
+
+def main(quantidade: int = 1_000_000):
+    rng = np.random.default_rng(42)
+    valores = np.round(rng.lognormal(mean=11.5, sigma=1.2, size=quantidade), 2)
+    valores[::97] *= -1
+
+    inicio = time.perf_counter()
+    por_valor = [format_brl(v) for v in valores.tolist()]
+    tempo_por_valor = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    em_lote = format_brl_array(valores)
+    tempo_em_lote = time.perf_counter() - inicio
+
+    if por_valor != em_lote:
+        raise SystemExit("ERRO: format_brl_array difere de format_brl")
+
+    print(f"Valores formatados: {quantidade:,}".replace(",", "."))
+    print(f"format_brl (por valor): {tempo_por_valor:.3f} s")
+    print(f"format_brl_array (lote): {tempo_em_lote:.3f} s")
+    print(f"Ganho: {tempo_por_valor / tempo_em_lote:.2f}x (saída idêntica)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,143 @@
+"""
+Mede o ganho do fragmento dos PASSOS 6 a 10 do checklist ultra completo
+(``paginas/completo.py``): latência de cada
+reexecução e quantidade de mensagens (deltas) enviadas ao navegador quando
+um slider da seção de custos muda, em várias sessões simultâneas.
+
+- "antes": a mudança reexecuta o script inteiro (comportamento sem fragmento);
+- "depois": a mudança reexecuta só o fragmento, como faz o navegador.
+
+As sessões são conduzidas pelo AppTest do Streamlit, cada uma em uma thread,
+como no servidor; a latência é o tempo de execução do script em cada uma.
+O AppTest sempre faz reexecuções completas, então a reexecução do fragmento
+é pedida diretamente ao executor de scripts.
+
+Uso: python -m benchmarks.bench_fragmento [sessoes] [interacoes]
+"""
+import dataclasses
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from streamlit.runtime.runtime import Runtime
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import app_test as modulo_app_test
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+# A página, como o app.py a executa: módulo importado uma vez, main() a cada reexecução
+SCRIPT = "from paginas.completo import main\nmain()\n"
+_sessao = threading.local()
+# Como no servidor, o bytecode do script é compilado uma vez e compartilhado
+_CACHE_SCRIPTS = ScriptCache()
+
+
+class _ExecutorMedido(LocalScriptRunner):
+    """
+    Executor do AppTest que pode limitar a reexecução a um fragmento e
+    registra a duração e quantas mensagens de elementos cada execução enviou.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # O executor nasce com um pedido de reexecução completa pendente, que
+        # absorveria o pedido do fragmento; começa sem pedido algum
+        self._requests = ScriptRequests()
+        self._script_cache = _CACHE_SCRIPTS
+
+    def request_rerun(self, rerun_data):
+        fragmento = getattr(_sessao, "fragmento", None)
+        if fragmento:
+            rerun_data = dataclasses.replace(rerun_data, fragment_id_queue=[fragmento])
+        return super().request_rerun(rerun_data)
+
+    def _run_script(self, rerun_data):
+        # Mede só a execução do script (sem a espera do AppTest pelo resultado)
+        inicio = time.perf_counter()
+        super()._run_script(rerun_data)
+        self.duracao = time.perf_counter() - inicio
+
+    def run(self, *args, **kwargs):
+        arvore = super().run(*args, **kwargs)
+        _sessao.duracao = self.duracao
+        deltas = [m for m in self.forward_msgs() if m.HasField("delta")]
+        _sessao.mensagens = len(deltas)
+        _sessao.bytes = sum(m.ByteSize() for m in deltas)
+        return arvore
+
+
+def _runtime_compartilhado(cls):
+    """
+    Cada execução do AppTest instala um Runtime falso global e o remove ao
+    terminar, o que quebra as outras sessões simultâneas; aqui a última
+    instância vista continua valendo para todas.
+    """
+    if cls._instance is not None:
+        _runtime_compartilhado.ultimo = cls._instance
+    return _runtime_compartilhado.ultimo
+
+
+def _widget(lista, rotulo):
+    return next(w for w in lista if w.label.startswith(rotulo))
+
+
+def _sessao_usuario(interacoes: int, modo: str) -> list:
+    """
+    Preenche o lance, depois move o slider de ITBI ``interacoes`` vezes.
+    Devolve (segundos, mensagens, bytes) de cada movimento.
+    """
+    _sessao.fragmento = None
+    at = AppTest.from_string(SCRIPT, default_timeout=120).run()
+    _widget(at.number_input, "Valor estimado de arrematação").set_value(350_000.0)
+    at.run()
+    if modo == "depois":
+        _sessao.fragmento = next(iter(at._fragment_storage._fragments))
+
+    medidas = []
+    for i in range(interacoes):
+        _widget(at.slider, "Taxa de ITBI").set_value(1.0 + 0.5 * (i % 9))
+        at.run()
+        medidas.append((_sessao.duracao, _sessao.mensagens, _sessao.bytes))
+        if at.exception:
+            raise SystemExit(f"ERRO na sessão ({modo}): {at.exception[0].message}")
+    return medidas
+
+
+def _percentil(valores, p):
+    return statistics.quantiles(valores, n=100, method="inclusive")[p - 1]
+
+
+def medir(sessoes: int, interacoes: int, modo: str) -> dict:
+    with ThreadPoolExecutor(max_workers=sessoes) as executor:
+        resultados = executor.map(_sessao_usuario, [interacoes] * sessoes, [modo] * sessoes)
+        medidas = [m for sessao in resultados for m in sessao]
+    tempos = [m[0] for m in medidas]
+    return {
+        "p50_ms": _percentil(tempos, 50) * 1000,
+        "p95_ms": _percentil(tempos, 95) * 1000,
+        "mensagens": statistics.mean(m[1] for m in medidas),
+        "kb": statistics.mean(m[2] for m in medidas) / 1024,
+    }
+
+
+def main(sessoes: int = 50, interacoes: int = 5):
+    with mock.patch.object(modulo_app_test, "LocalScriptRunner", _ExecutorMedido), \
+            mock.patch.object(Runtime, "instance", classmethod(_runtime_compartilhado)):
+        antes = medir(sessoes, interacoes, "antes")
+        depois = medir(sessoes, interacoes, "depois")
+
+    print(f"{sessoes} sessões simultâneas, {interacoes} movimentos do slider de ITBI cada")
+    print(f"{'':8} {'p50 (ms)':>10} {'p95 (ms)':>10} {'mensagens':>10} {'KB':>8}")
+    for nome, r in (("antes", antes), ("depois", depois)):
+        print(f"{nome:8} {r['p50_ms']:10.1f} {r['p95_ms']:10.1f} {r['mensagens']:10.0f} {r['kb']:8.1f}")
+    print(f"Ganho p50: {antes['p50_ms'] / depois['p50_ms']:.2f}x; "
+          f"mensagens: {antes['mensagens'] / depois['mensagens']:.2f}x menos")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:3]]
+    main(*argumentos)
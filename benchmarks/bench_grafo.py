@@ -0,0 +1,73 @@
+"""
+Modelo de custos como grafo de dependências (``nucleo.custos.modelo_custos``)
+contra recalcular tudo, para um portfólio de lotes em arrays: tempo para
+refletir a mudança de uma entrada e quantos derivados foram recalculados.
+
+"Tudo" é o que a página fazia a cada reexecução: custos, lance máximo e
+retorno (com a TIR) de todos os lotes.
+
+Uso: python -m benchmarks.bench_grafo [lotes] [repeticoes]
+"""
+import sys
+import time
+
+import numpy as np
+
+from nucleo.custos import calcular_custos, lance_maximo, modelo_custos
+from nucleo.retorno import calcular_retorno
+
+DERIVADOS = ["comissao_leiloeiro", "itbi", "registro_cartorio", "custo_aquisicao_bruto", "investimento_total",
+             "custo_total_avancado", "lance_max_orcamento", "retorno"]
+
+
+def entradas_aleatorias(lotes: int) -> dict:
+    rng = np.random.default_rng(42)
+    valor_lance = np.round(rng.uniform(80_000, 600_000, lotes), 2)
+    return {
+        "valor_lance": valor_lance,
+        "valor_pago": valor_lance,
+        "debitos_passados": np.round(rng.uniform(0, 20_000, lotes), 2),
+        "custo_reforma": np.round(rng.uniform(0, 60_000, lotes), 2),
+        "valor_mercado": np.round(rng.uniform(100_000, 900_000, lotes), 2),
+        "valor_orcamento_max": np.full(lotes, 700_000.0),
+    }
+
+
+def recalcular_tudo(e: dict):
+    custos = calcular_custos(e["valor_lance"], e["perc_itbi"], 1.2, debitos_passados=e["debitos_passados"],
+                             custo_reforma=e["custo_reforma"])
+    lance_maximo(e["valor_orcamento_max"], e["perc_itbi"], 1.2, debitos_passados=e["debitos_passados"],
+                 custo_reforma=e["custo_reforma"])
+    calcular_retorno(custos.custo_total_avancado, e["valor_mercado"])
+
+
+def main(lotes: int = 10_000, repeticoes: int = 20):
+    entradas = entradas_aleatorias(lotes)
+    modelo = modelo_custos()
+    modelo.definir(**entradas)
+    modelo.valores(*DERIVADOS)
+
+    print(f"{lotes} lotes; média de {repeticoes} mudanças")
+    print(f"{'entrada alterada':22} {'grafo (ms)':>11} {'tudo (ms)':>10} {'derivados recalculados':>24}")
+    for nome, valores in (("perc_itbi", [2.0, 3.0]), ("custo_reforma", None), ("valor_mercado", None),
+                          ("valor_orcamento_max", None)):
+        antes = sum(modelo.recalculos.values())
+        inicio = time.perf_counter()
+        for i in range(repeticoes):
+            novo = valores[i % 2] if valores else entradas[nome] * (1.01 if i % 2 else 0.99)
+            modelo.definir(**{nome: novo})
+            modelo.valores(*DERIVADOS)
+        grafo_ms = (time.perf_counter() - inicio) / repeticoes * 1000
+        recalculados = (sum(modelo.recalculos.values()) - antes) / repeticoes
+
+        completas = {**entradas, "perc_itbi": 2.5}
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            recalcular_tudo(completas)
+        tudo_ms = (time.perf_counter() - inicio) / repeticoes * 1000
+        print(f"{nome:22} {grafo_ms:11.2f} {tudo_ms:10.2f} {recalculados:17.0f} de {len(DERIVADOS)}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:3]]
+    main(*argumentos)
@@ -0,0 +1,84 @@
+"""
+Latência por tecla do autocompletar de cidade/bairro (``nucleo.localidades``):
+digita vários textos letra a letra (com e sem acentos, com erros de
+digitação) e mede cada ``sugerir``, na lista que acompanha o projeto e numa
+lista sintética maior (todos os municípios com milhares de bairros).
+
+Uso: python -m benchmarks.bench_localidades [nomes_sinteticos]
+"""
+import statistics
+import sys
+import time
+
+from nucleo.localidades import Localidades, carregar_localidades
+
+ORCAMENTO_MS = 1.0
+
+TEXTOS = [
+    "Goiânia - Setor Bueno",
+    "goiania setor marista",
+    "aparecida garavelo",
+    "anapolis jundiai",
+    "goiana bueno",
+    "aparesida de goiania",
+    "pirenopols",
+    "jardim goias",
+    "vila nova",
+    "caldas novas centro",
+]
+
+TIPOS = ["Setor", "Jardim", "Vila", "Residencial", "Parque", "Conjunto"]
+
+
+def lista_sintetica(base: Localidades, nomes: int) -> list:
+    """
+    Nomes "Município - Tipo Palavra N" até completar ``nomes``.
+    """
+    municipios = [nome for nome in base.nomes if " - " not in nome]
+    palavras = sorted({nome.split(" - ")[1].split()[-1] for nome in base.nomes if " - " in nome})
+    resultado = list(base.nomes)
+    i = 0
+    while len(resultado) < nomes:
+        resultado.append(f"{municipios[i % len(municipios)]} - {TIPOS[i % len(TIPOS)]} "
+                         f"{palavras[i % len(palavras)]} {i // len(palavras) + 1}")
+        i += 1
+    return resultado
+
+
+def medir(indice: Localidades) -> list:
+    tempos = []
+    for texto in TEXTOS:
+        for fim in range(1, len(texto) + 1):
+            inicio = time.perf_counter()
+            indice.sugerir(texto[:fim])
+            tempos.append((time.perf_counter() - inicio) * 1000)
+    return tempos
+
+
+def main(nomes_sinteticos: int = 20_000):
+    inicio = time.perf_counter()
+    base = carregar_localidades()
+    carga_ms = (time.perf_counter() - inicio) * 1000
+
+    nomes = lista_sintetica(base, nomes_sinteticos)
+    inicio = time.perf_counter()
+    grande = Localidades(nomes)
+    montagem_ms = (time.perf_counter() - inicio) * 1000
+
+    acima = False
+    for rotulo, indice in (("lista do projeto", base), ("lista sintética", grande)):
+        tempos = sorted(medir(indice))
+        p99 = tempos[int(len(tempos) * 0.99) - 1]
+        acima |= p99 > ORCAMENTO_MS
+        print(f"{rotulo} ({len(indice)} nomes): {len(tempos)} teclas, "
+              f"p50 {statistics.median(tempos):.3f} ms, p99 {p99:.3f} ms, máx {tempos[-1]:.3f} ms")
+    print(f"Carga do CSV + índice: {carga_ms:.1f} ms; índice sintético: {montagem_ms:.0f} ms (uma vez por processo)")
+    print(f"Exemplo: 'goiana bueno' -> {base.sugerir('goiana bueno', 3)}")
+    if acima:
+        print(f"ACIMA DO ORÇAMENTO de {ORCAMENTO_MS} ms por tecla (p99)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:2]]
+    main(*argumentos)
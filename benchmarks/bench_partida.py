@@ -0,0 +1,153 @@
+"""
+Orçamento de partida a frio: quanto um processo novo do servidor leva para
+importar o Streamlit e as páginas e quanto custa a primeira renderização de
+cada página, com e sem o aquecimento de ``servidor.py``.
+
+Cada medida roda em um processo Python novo (nada em ``sys.modules``), com a
+página conduzida pelo AppTest do Streamlit. "frio" é a primeira renderização
+em um processo que só importou o Streamlit (como ``streamlit run app.py``);
+"aquecida" é a mesma renderização depois de ``servidor.aquecer()`` (como
+``python servidor.py``). O aquecimento em si acontece antes de o servidor
+abrir a porta e aparece à parte.
+
+Com --salvar, o resultado vira o orçamento (benchmarks/base_partida.json);
+com --comparar, o comando termina com erro se alguma medida passar do
+orçamento além da tolerância. Os tempos do orçamento são gravados relativos
+à medida de referência da máquina (ver ``benchmarks.calibracao``), então o
+orçamento do repositório serve em qualquer máquina; regrave-o com --salvar
+ao trocar o Python, o Streamlit ou as dependências.
+
+Uso: python -m benchmarks.bench_partida [--repeticoes N] [--salvar | --comparar] [--tolerancia 0.25]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.calibracao import carregar_base, gravar_base, referencia_ms
+
+RAIZ = Path(__file__).resolve().parent.parent
+BASE = Path(__file__).resolve().parent / "base_partida.json"
+
+PAGINAS = {
+    "simples": "paginas.simples",
+    "completo": "paginas.completo",
+    "portfolio": "paginas.portfolio",
+    "comparacao": "paginas.comparacao",
+}
+
+# Roda em um processo novo; argv: módulo da página, "1" para aquecer antes
+_FILHO = """
+import json, logging, sys, time
+
+inicio = time.perf_counter()
+import streamlit
+importacao_ms = (time.perf_counter() - inicio) * 1000
+from streamlit.testing.v1 import AppTest
+
+modulo, aquecer = sys.argv[1], sys.argv[2] == "1"
+logging.disable(logging.WARNING)
+aquecimento = {}
+if aquecer:
+    import servidor
+    aquecimento = servidor.aquecer()
+
+at = AppTest.from_string(f"import importlib\\nimportlib.import_module({modulo!r}).main()\\n", default_timeout=120)
+inicio = time.perf_counter()
+at.run()
+primeira_ms = (time.perf_counter() - inicio) * 1000
+if at.exception:
+    raise SystemExit(f"ERRO em {modulo}: {at.exception[0].message}")
+print(json.dumps({"importacao_ms": importacao_ms, "primeira_ms": primeira_ms, "aquecimento": aquecimento}))
+"""
+
+
+def _rodar(modulo: str, aquecer: bool) -> dict:
+    saida = subprocess.run(
+        [sys.executable, "-c", _FILHO, modulo, "1" if aquecer else "0"],
+        cwd=RAIZ, capture_output=True, text=True, check=False,
+    )
+    if saida.returncode != 0:
+        raise SystemExit(saida.stderr.strip() or saida.stdout.strip())
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def medir(repeticoes: int) -> dict:
+    """
+    Medianas de ``repeticoes`` processos para cada página e modo.
+    """
+    resultados = {}
+    processo = {"importacao_streamlit_ms": [], "importacao_paginas_ms": [], "aquecimento_ms": []}
+    for pagina, modulo in PAGINAS.items():
+        frio, aquecida = [], []
+        for _ in range(repeticoes):
+            r = _rodar(modulo, aquecer=False)
+            frio.append(r["primeira_ms"])
+            processo["importacao_streamlit_ms"].append(r["importacao_ms"])
+            r = _rodar(modulo, aquecer=True)
+            aquecida.append(r["primeira_ms"])
+            processo["importacao_paginas_ms"].append(r["aquecimento"]["importacao_ms"])
+            processo["aquecimento_ms"].append(r["aquecimento"]["total_ms"])
+        resultados[pagina] = {
+            "frio_ms": round(statistics.median(frio), 1),
+            "aquecida_ms": round(statistics.median(aquecida), 1),
+        }
+    resultados["processo"] = {nome: round(statistics.median(v), 1) for nome, v in processo.items()}
+    return resultados
+
+
+def comparar(resultados: dict, base: dict, tolerancia: float) -> list:
+    """
+    Medidas que passaram do orçamento além da tolerância.
+    """
+    estouros = []
+    for grupo, medidas in base.items():
+        for nome, limite in medidas.items():
+            atual = resultados.get(grupo, {}).get(nome)
+            if atual is not None and atual > limite * (1 + tolerancia):
+                estouros.append(f"{grupo}.{nome}: {atual:.1f} ms (orçamento {limite:.1f} ms)")
+    return estouros
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Orçamento de partida a frio do servidor.")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    modo = parser.add_mutually_exclusive_group()
+    modo.add_argument("--salvar", action="store_true", help="grava o resultado como orçamento")
+    modo.add_argument("--comparar", action="store_true", help="falha se passar do orçamento")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    referencia = referencia_ms()
+    resultados = medir(args.repeticoes)
+
+    # Orçamento convertido para ms desta máquina
+    base = carregar_base(BASE, referencia)
+    print(f"Referência da máquina: {referencia:.1f} ms")
+    print(f"{'':10} {'frio (ms)':>10} {'aquecida (ms)':>14} {'orçamento':>10}")
+    for pagina in PAGINAS:
+        r = resultados[pagina]
+        limite = f"{base[pagina]['frio_ms']:10.1f}" if pagina in base else f"{'-':>10}"
+        print(f"{pagina:10} {r['frio_ms']:10.1f} {r['aquecida_ms']:14.1f} {limite}")
+    for nome, valor in resultados["processo"].items():
+        print(f"{nome:24} {valor:8.1f} ms")
+
+    if args.salvar:
+        gravar_base(BASE, resultados, referencia)
+        print(f"Orçamento gravado em {BASE}")
+    elif args.comparar:
+        if not base:
+            raise SystemExit(f"ERRO: orçamento não encontrado em {BASE} (rode com --salvar)")
+        estouros = comparar(resultados, base, args.tolerancia)
+        if estouros:
+            print(f"REGRESSÃO NA PARTIDA (tolerância de {args.tolerancia:.0%}):")
+            for linha in estouros:
+                print(f"  {linha}")
+            sys.exit(1)
+        print(f"Dentro do orçamento (tolerância de {args.tolerancia:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Tempo e pico de memória do relatório de portfólio em PDF (``pdf_portfolio``)
+gravado em um arquivo temporário, para portfólios de tamanhos crescentes.
+
+Como as páginas vão para o arquivo conforme ficam prontas, o pico de memória
+da geração (tracemalloc, sem contar o DataFrame de entrada) deve ficar quase
+constante enquanto o arquivo cresce com o número de lotes.
+
+Uso: python -m benchmarks.bench_pdf [lotes]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from nucleo.pdf import pdf_portfolio
+from nucleo.portfolio import calcular_portfolio, calcular_retorno_portfolio, normalizar_portfolio
+
+
+def portfolio_aleatorio(quantidade: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    lotes = pd.DataFrame({
+        "cidade": rng.choice(["Goiânia - Setor Bueno", "Anápolis - Jundiaí", "Aparecida de Goiânia"], quantidade),
+        "tipo": rng.choice(["Casa", "Apartamento", "Lote/Terreno"], quantidade),
+        "lance": np.round(rng.uniform(80_000, 600_000, quantidade), 2),
+        "debitos": np.round(rng.uniform(0, 20_000, quantidade), 2),
+        "reforma": np.round(rng.uniform(0, 60_000, quantidade), 2),
+        "honorarios": 3_000.0,
+        "seguro": 800.0,
+        "mercado": np.round(rng.uniform(100_000, 900_000, quantidade), 2),
+    })
+    return calcular_retorno_portfolio(calcular_portfolio(normalizar_portfolio(lotes)))
+
+
+def medir(resultado: pd.DataFrame) -> dict:
+    with tempfile.TemporaryFile() as destino:
+        inicio = time.perf_counter()
+        paginas = pdf_portfolio(resultado, destino)
+        segundos = time.perf_counter() - inicio
+        tamanho = destino.tell()
+
+    # Passada separada: o tracemalloc deixa a geração várias vezes mais lenta
+    with tempfile.TemporaryFile() as destino:
+        tracemalloc.start()
+        pdf_portfolio(resultado, destino)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"paginas": paginas, "kb": tamanho / 1024, "segundos": segundos, "pico_mb": pico / 2 ** 20}
+
+
+def main(lotes: int = 500):
+    print(f"{'lotes':>7} {'páginas':>8} {'KB':>9} {'segundos':>9} {'pico (MB)':>10}")
+    for quantidade in (lotes, lotes * 10):
+        r = medir(portfolio_aleatorio(quantidade))
+        print(f"{quantidade:7d} {r['paginas']:8d} {r['kb']:9.1f} {r['segundos']:9.2f} {r['pico_mb']:10.2f}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:2]]
+    main(*argumentos)
@@ -0,0 +1,129 @@
+"""
+Compara o envio do relatório final do checklist ultra completo linha a linha (um
+``st.write`` por linha, como antes) com o documento único de
+``nucleo.relatorio`` em um só ``st.markdown``: mensagens enviadas ao
+navegador, bytes e tempo estimado de transferência em um link lento.
+
+O tempo no link soma a latência (uma ida) aos bytes transmitidos, contando
+para cada mensagem o cabeçalho do WebSocket, o registro TLS e o segmento
+TCP/IP em que ela viaja. Também mede o tempo de montar o documento com e sem
+o cache da página (acerto no cache = serializar os valores em JSON e
+consultar o ``st.cache_data``).
+
+Uso: python -m benchmarks.bench_relatorio [kbps] [latencia_ms]
+"""
+import json
+import sys
+import time
+from unittest import mock
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import app_test as modulo_app_test
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+from nucleo.relatorio import montar_relatorio
+
+# WebSocket (4) + registro TLS (29) + cabeçalhos TCP/IPv4 (40), por mensagem
+_SOBRECARGA_POR_MENSAGEM = 73
+
+DADOS = {
+    "data_atual": "18/10/2026", "nome_comprador": "Maria da Silva",
+    "objetivo": "Investimento (Revenda)", "valor_orcamento_max": 500_000.0,
+    "lance_max_orcamento": 402_118.64, "verificou_financiamento": True,
+    "local_imovel": "Goiânia - Setor Bueno", "tipo_imovel": "Apartamento", "visitou": True,
+    "conversou_corretores": True, "valor_mercado": 450_000.0, "verificou_averbacoes": False,
+    "tipo_leilao": "Extrajudicial", "edital_lido": True, "matricula_conf": True,
+    "notificacao_ok": "Sim", "verificou_processos": True,
+    "ocupado": "Ocupado", "acordo_amigavel": "Sim", "valor_acordo": 10_000.0, "verificou_locacao": True,
+    "cadastro_feito": True, "verifica_data_leilao": True,
+    "valor_lance": 320_000.0, "forma_pagamento": "Financiamento Caixa",
+    "perc_entrada": 20, "valor_entrada": 64_000.0, "valor_financiado": 256_000.0,
+    "financiamento": {"sistema": "SAC", "taxa_juros_anual": 11.0, "prazo": 360,
+                      "primeira_prestacao": 3_033.21, "ultima_prestacao": 718.76, "total_pago": 669_384.12},
+    "parcelamento": None, "taxa_desconto_anual": 10.0, "valor_pago": 301_550.37,
+    "perc_comissao": 5.0, "comissao_leiloeiro": 16_000.0, "perc_itbi": 2.0, "itbi": 6_400.0,
+    "perc_registro": 1.5, "emolumentos": 0.0, "registro_cartorio": 4_800.0,
+    "debitos_passados": 12_000.0, "custo_aquisicao_bruto": 350_750.37,
+    "depositou_valor": True, "pagou_comissao": True, "judicial_homologacao": False,
+    "extrajudicial_assinou": True, "pagou_itbi": True, "registrou_imovel": False, "acao_posse": True,
+    "custo_reforma": 40_000.0, "investimento_total": 390_750.37,
+    "prazo_venda": 12, "retorno": {"lucro": 12_249.63, "roi": 0.0313, "tir_anual": 0.0318, "vpl": -10_930.52},
+    "honorarios_adv": 8_000.0, "seguro_imovel": 1_500.0, "total_geral_avancado": 400_250.37,
+}
+
+
+def _relatorio_por_linha(documento):
+    import streamlit as st
+
+    for linha in documento.splitlines():
+        if linha.strip():
+            st.write(linha)
+
+
+def _relatorio_documento(documento):
+    import streamlit as st
+
+    st.markdown(documento)
+
+
+class _ExecutorContado(LocalScriptRunner):
+    """
+    Executor do AppTest que guarda quantas mensagens de elementos foram
+    enviadas e quantos bytes elas somam.
+    """
+
+    def run(self, *args, **kwargs):
+        arvore = super().run(*args, **kwargs)
+        deltas = [m for m in self.forward_msgs() if m.HasField("delta")]
+        _ExecutorContado.mensagens = len(deltas)
+        _ExecutorContado.bytes = sum(m.ByteSize() for m in deltas)
+        return arvore
+
+
+def medir(script, documento: str, kbps: float, latencia_ms: float) -> dict:
+    at = AppTest.from_function(script, args=(documento,), default_timeout=60).run()
+    if at.exception:
+        raise SystemExit(f"ERRO: {at.exception[0].message}")
+    mensagens, tamanho = _ExecutorContado.mensagens, _ExecutorContado.bytes
+    no_fio = tamanho + mensagens * _SOBRECARGA_POR_MENSAGEM
+    return {
+        "mensagens": mensagens,
+        "kb": tamanho / 1024,
+        "link_ms": latencia_ms + no_fio * 8 / kbps,
+    }
+
+
+def main(kbps: int = 256, latencia_ms: int = 300):
+    documento = montar_relatorio(DADOS)
+
+    repeticoes = 1000
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        montar_relatorio(DADOS)
+    montagem_ms = (time.perf_counter() - inicio) / repeticoes * 1000
+
+    # Mesmo caminho da página: o documento em cache pelo JSON dos valores
+    relatorio_cache = st.cache_data(show_spinner=False)(lambda dados_json: montar_relatorio(json.loads(dados_json)))
+    relatorio_cache(json.dumps(DADOS))
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        relatorio_cache(json.dumps(DADOS))
+    cache_ms = (time.perf_counter() - inicio) / repeticoes * 1000
+
+    with mock.patch.object(modulo_app_test, "LocalScriptRunner", _ExecutorContado):
+        antes = medir(_relatorio_por_linha, documento, kbps, latencia_ms)
+        depois = medir(_relatorio_documento, documento, kbps, latencia_ms)
+
+    print(f"Relatório de {len(documento.splitlines())} linhas; link de {kbps} kbit/s e {latencia_ms} ms")
+    print(f"{'':12} {'mensagens':>10} {'KB':>8} {'link (ms)':>10}")
+    for nome, r in (("por linha", antes), ("documento", depois)):
+        print(f"{nome:12} {r['mensagens']:10d} {r['kb']:8.1f} {r['link_ms']:10.1f}")
+    print(f"Mensagens: {antes['mensagens'] / depois['mensagens']:.0f}x menos; "
+          f"link: {antes['link_ms'] / depois['link_ms']:.2f}x mais rápido")
+    print(f"Montagem do documento: {montagem_ms:.3f} ms; acerto no cache: {cache_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:3]]
+    main(*argumentos)
@@ -0,0 +1,211 @@
+"""
+Latência das reexecuções e pico de memória das páginas de checklist
+(``paginas/simples.py`` e ``paginas/completo.py``) em
+sequências de interação realistas: preencher os PASSOS 1 a 10, mover os
+sliders de ITBI e registro e clicar em "Gerar Relatório Completo".
+
+As páginas são conduzidas sem navegador pelo AppTest do Streamlit; a
+latência de cada passo é só o tempo de execução da página (sem a espera do
+AppTest pelo resultado) e o pico de memória é medido com tracemalloc em uma
+passada separada, para não distorcer os tempos.
+
+Com --salvar, o resultado vira a linha de base (benchmarks/base_reruns.json);
+com --comparar, o resultado é comparado com ela e o comando termina com erro
+se algum p50, p95 ou pico de memória piorar além da tolerância. Os tempos
+da linha de base são gravados relativos à medida de referência da máquina
+(ver ``benchmarks.calibracao``), então a base do repositório serve em
+qualquer máquina; regrave-a com --salvar ao trocar o Python ou o Streamlit.
+
+Uso: python -m benchmarks.bench_reruns [--repeticoes N] [--salvar | --comparar] [--tolerancia 0.25]
+"""
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from unittest import mock
+
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import app_test as modulo_app_test
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+from benchmarks.calibracao import carregar_base, gravar_base, referencia_ms
+
+BASE = Path(__file__).resolve().parent / "base_reruns.json"
+METRICAS = ("p50_ms", "p95_ms", "pico_mb")
+
+# Cada passo: (tipo do widget, início do rótulo, valor); "clicar" aperta o botão
+CENARIOS = {
+    "simples": [
+        ("text_input", "Seu nome", "Maria da Silva"),
+        ("number_input", "Orçamento máximo total", 500_000.0),
+        ("selectbox", "1.1 Qual seu principal objetivo", "Investimento (Revenda/Locação)"),
+        ("checkbox", "Verifiquei se tenho aprovação prévia", True),
+        ("text_input", "2.1 Cidade/Bairro", "Goiânia - Setor Bueno"),
+        ("number_input", "2.5 Valor de mercado estimado", 450_000.0),
+        ("checkbox", "2.3 Visitei", True),
+        ("checkbox", "3.2 Li o edital", True),
+        ("checkbox", "3.3 Conferi a matrícula", True),
+        ("checkbox", "Fiz (ou vou fazer) o cadastro", True),
+        ("radio", "5.1 Forma de Pagamento", "Financiamento Caixa"),
+        ("number_input", "Informe o valor do lance", 300_000.0),
+        ("slider", "Percentual de ITBI", 3.0),
+        ("slider", "Percentual de ITBI", 2.0),
+        ("slider", "Percentual de registro", 1.5),
+        ("radio", "O imóvel está ocupado", "Sim"),
+        ("number_input", "Custo previsto da reforma", 40_000.0),
+        ("clicar", "Gerar Relatório Completo", None),
+    ],
+    "completo": [
+        ("text_input", "Seu nome", "Maria da Silva"),
+        ("selectbox", "Qual seu principal objetivo", "Investimento (Revenda)"),
+        ("number_input", "Orçamento máximo global", 500_000.0),
+        ("checkbox", "Consultei a instituição financeira", True),
+        ("text_input", "Cidade/Bairro do imóvel", "Goiânia - Setor Bueno"),
+        ("number_input", "Valor de mercado estimado", 450_000.0),
+        ("checkbox", "Realizei (ou vou realizar) a visita", True),
+        ("checkbox", "Li e compreendi o edital", True),
+        ("checkbox", "Verifiquei a matrícula atualizada", True),
+        ("radio", "Situação de ocupação", "Ocupado"),
+        ("checkbox", "Fiz ou vou fazer o cadastro", True),
+        ("number_input", "Valor estimado de arrematação", 320_000.0),
+        ("radio", "Escolha a forma de pagamento", "Financiamento Caixa"),
+        ("number_input", "Valor estimado de dívidas", 12_000.0),
+        ("slider", "Taxa de ITBI", 3.0),
+        ("slider", "Taxa de ITBI", 2.0),
+        ("slider", "Porcentagem de registro", 1.5),
+        ("checkbox", "Já paguei o ITBI", True),
+        ("number_input", "Custo estimado da reforma", 40_000.0),
+        ("number_input", "Honorários advocatícios", 8_000.0),
+        ("number_input", "Custo estimado de seguro", 1_500.0),
+        ("clicar", "Gerar Relatório Completo", None),
+    ],
+}
+
+# Como no servidor, o bytecode do script é compilado uma vez e compartilhado
+_CACHE_SCRIPTS = ScriptCache()
+
+
+class _ExecutorMedido(LocalScriptRunner):
+    """
+    Executor do AppTest que registra a duração de cada execução do script.
+    """
+
+    ultima_duracao = 0.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._script_cache = _CACHE_SCRIPTS
+
+    def _run_script(self, rerun_data):
+        inicio = time.perf_counter()
+        super()._run_script(rerun_data)
+        _ExecutorMedido.ultima_duracao = time.perf_counter() - inicio
+
+
+def _executar(at):
+    at.run()
+    if at.exception:
+        raise SystemExit(f"ERRO em {at._script_path}: {at.exception[0].message}")
+    return _ExecutorMedido.ultima_duracao
+
+
+def _interagir(pagina: str) -> list:
+    """
+    Roda o cenário da página do início ao fim e devolve a duração (s) de
+    cada reexecução, inclusive a primeira.
+    """
+    at = AppTest.from_string(f"from paginas.{pagina} import main\nmain()\n", default_timeout=120)
+    duracoes = [_executar(at)]
+    for tipo, rotulo, valor in CENARIOS[pagina]:
+        lista = at.button if tipo == "clicar" else getattr(at, tipo)
+        widget = next(w for w in lista if w.label.startswith(rotulo))
+        if tipo == "clicar":
+            widget.click()
+        else:
+            widget.set_value(valor)
+        duracoes.append(_executar(at))
+    return duracoes
+
+
+def _percentil(valores, p):
+    return statistics.quantiles(valores, n=100, method="inclusive")[p - 1]
+
+
+def medir(pagina: str, repeticoes: int) -> dict:
+    _interagir(pagina)  # aquecimento: import da página e caches
+
+    duracoes = [d for _ in range(repeticoes) for d in _interagir(pagina)]
+
+    tracemalloc.start()
+    try:
+        _interagir(pagina)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "reexecucoes": len(duracoes),
+        "p50_ms": round(_percentil(duracoes, 50) * 1000, 3),
+        "p95_ms": round(_percentil(duracoes, 95) * 1000, 3),
+        "pico_mb": round(pico / 2 ** 20, 3),
+    }
+
+
+def comparar(resultados: dict, base: dict, tolerancia: float) -> list:
+    """
+    Métricas que pioraram mais que ``tolerancia`` (fração) em relação à base.
+    """
+    regressoes = []
+    for pagina, atual in resultados.items():
+        if pagina not in base:
+            continue
+        for metrica in METRICAS:
+            limite = base[pagina][metrica] * (1.0 + tolerancia)
+            if atual[metrica] > limite:
+                regressoes.append(f"{pagina} {metrica}: {atual[metrica]:.1f} > {limite:.1f} "
+                                  f"(base {base[pagina][metrica]:.1f})")
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latência das reexecuções das páginas de checklist.")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    modo = parser.add_mutually_exclusive_group()
+    modo.add_argument("--salvar", action="store_true", help="grava o resultado como linha de base")
+    modo.add_argument("--comparar", action="store_true", help="falha se houver regressão sobre a base")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    referencia = referencia_ms()
+    with mock.patch.object(modulo_app_test, "LocalScriptRunner", _ExecutorMedido):
+        resultados = {pagina: medir(pagina, args.repeticoes) for pagina in CENARIOS}
+
+    # Base convertida para ms desta máquina
+    base = carregar_base(BASE, referencia)
+    print(f"Referência da máquina: {referencia:.1f} ms")
+    print(f"{'':10} {'reexec.':>8} {'p50 (ms)':>10} {'p95 (ms)':>10} {'pico (MB)':>10} {'base p50':>10}")
+    for pagina, r in resultados.items():
+        base_p50 = f"{base[pagina]['p50_ms']:10.1f}" if pagina in base else f"{'-':>10}"
+        print(f"{pagina:10} {r['reexecucoes']:8d} {r['p50_ms']:10.1f} {r['p95_ms']:10.1f} "
+              f"{r['pico_mb']:10.1f} {base_p50}")
+
+    if args.salvar:
+        gravar_base(BASE, resultados, referencia)
+        print(f"Linha de base gravada em {BASE}")
+    elif args.comparar:
+        if not base:
+            raise SystemExit(f"ERRO: linha de base não encontrada em {BASE} (rode com --salvar)")
+        regressoes = comparar(resultados, base, args.tolerancia)
+        if regressoes:
+            print(f"REGRESSÃO (tolerância de {args.tolerancia:.0%}):")
+            for linha in regressoes:
+                print(f"  {linha}")
+            sys.exit(1)
+        print(f"Sem regressões (tolerância de {args.tolerancia:.0%})")
+
+
+if __name__ == "__main__":
+    main()
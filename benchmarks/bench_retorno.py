@@ -0,0 +1,43 @@
+"""
+Compara a TIR de um portfólio resolvida lote a lote (uma busca de raiz
+escalar por lote) com a resolução vetorizada de ``tir_mensal`` (todos os
+lotes nas mesmas iterações de Newton) e confere se os resultados coincidem.
+
+Uso: python -m benchmarks.bench_retorno [quantidade]
+"""
+import sys
+import time
+
+import numpy as np
+
+from nucleo.retorno import tir_mensal
+
+
+def main(quantidade: int = 10_000):
+    rng = np.random.default_rng(42)
+    custo_total = rng.uniform(80_000, 600_000, quantidade)
+    receita_liquida = custo_total * rng.uniform(0.7, 1.8, quantidade)
+    meses = rng.integers(3, 61, quantidade)
+    custo_mensal = rng.uniform(0, 2_500, quantidade)
+
+    inicio = time.perf_counter()
+    por_lote = np.concatenate([
+        tir_mensal(c, r, m, h) for c, r, m, h in zip(custo_total, receita_liquida, meses, custo_mensal)
+    ])
+    tempo_por_lote = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    em_lote = tir_mensal(custo_total, receita_liquida, meses, custo_mensal)
+    tempo_em_lote = time.perf_counter() - inicio
+
+    if not np.allclose(por_lote, em_lote, rtol=1e-8, atol=1e-12, equal_nan=True):
+        raise SystemExit("ERRO: a TIR vetorizada difere da calculada lote a lote")
+
+    print(f"Lotes: {quantidade:,}".replace(",", "."))
+    print(f"TIR lote a lote: {tempo_por_lote:.3f} s")
+    print(f"TIR vetorizada: {tempo_em_lote:.3f} s")
+    print(f"Ganho: {tempo_por_lote / tempo_em_lote:.1f}x (mesmas taxas)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,61 @@
+"""
+Tabela de tarifas (``nucleo.tarifas``) aplicada a um portfólio grande: faixa
+de emolumentos por ``bisect`` lote a lote contra um único ``np.searchsorted``,
+e o tempo de ``aplicar_tarifas`` + ``calcular_portfolio`` para todos os lotes.
+
+Uso: python -m benchmarks.bench_tarifas [lotes]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from nucleo.formatacao import format_brl
+from nucleo.portfolio import calcular_portfolio, normalizar_portfolio
+from nucleo.tarifas import TAXAS_DA_TABELA, aplicar_tarifas, carregar_tarifas
+
+LOCAIS = ["Goiânia - Setor Bueno", "Aparecida de Goiânia - Centro", "Anápolis - Jundiaí",
+          "Caldas Novas", "Rio Verde, Centro", "Município fora da tabela"]
+
+
+def main(lotes: int = 1_000_000):
+    inicio = time.perf_counter()
+    tarifas = carregar_tarifas()
+    carga_ms = (time.perf_counter() - inicio) * 1000
+
+    rng = np.random.default_rng(42)
+    portfolio = normalizar_portfolio(pd.DataFrame({
+        "cidade": rng.choice(LOCAIS, lotes),
+        "lance": np.round(rng.lognormal(mean=12.0, sigma=0.8, size=lotes), 2),
+        "leiloeiro": rng.choice(["Leiloeiro Exemplo A", "Leiloeiro Exemplo B", ""], lotes),
+    }), TAXAS_DA_TABELA)
+    valores = portfolio["valor_lance"].to_numpy()
+
+    inicio = time.perf_counter()
+    por_lote = np.array([tarifas.emolumento(v) for v in valores.tolist()])
+    tempo_bisect = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    vetorizado = tarifas.emolumentos_lotes(valores)
+    tempo_searchsorted = time.perf_counter() - inicio
+
+    if not np.array_equal(por_lote, vetorizado):
+        raise SystemExit("ERRO: bisect e searchsorted escolheram faixas diferentes")
+
+    inicio = time.perf_counter()
+    resultado = calcular_portfolio(aplicar_tarifas(portfolio, tarifas))
+    tempo_portfolio = time.perf_counter() - inicio
+
+    print(f"Lotes: {lotes:,}".replace(",", "."))
+    print(f"Carga das tabelas: {carga_ms:.1f} ms (uma vez por processo)")
+    print(f"Emolumentos por bisect (lote a lote): {tempo_bisect:.3f} s")
+    print(f"Emolumentos por searchsorted: {tempo_searchsorted:.3f} s "
+          f"({tempo_bisect / tempo_searchsorted:.0f}x, mesmas faixas)")
+    print(f"aplicar_tarifas + calcular_portfolio: {tempo_portfolio:.3f} s "
+          f"(registro médio R$ {format_brl(resultado['registro_cartorio'].mean())})")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:2]]
+    main(*argumentos)
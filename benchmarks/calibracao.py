@@ -0,0 +1,86 @@
+"""
+Medida de referência da máquina para as linhas de base dos benchmarks
+(``base_reruns.json`` e ``base_partida.json``).
+
+Os tempos das linhas de base não são gravados em milissegundos, que só valem
+para a máquina que os mediu, e sim como múltiplos (``*_ref``) do tempo de
+uma carga fixa de Python puro medida na mesma execução. Ao comparar, a base
+é convertida de volta para milissegundos pela referência da máquina atual:
+uma base gravada num notebook continua valendo num servidor de CI mais
+rápido ou mais lento. A proporção é aproximada (E/S e cache de disco não
+escalam como a CPU), por isso as comparações têm tolerância; trocar de
+versão do Python ou do Streamlit pede regravar a base com --salvar.
+
+Uso: python -m benchmarks.calibracao
+"""
+import json
+import statistics
+import time
+
+SUFIXO_MS = "_ms"
+SUFIXO_REF = "_ref"
+
+
+def _carga():
+    # Dicionários, textos e ordenação: o mesmo tipo de trabalho de uma reexecução
+    valores = {f"chave_{i}": str(i * 7919 % 100_003) for i in range(50_000)}
+    return sorted(valores.values())[len(valores) // 2]
+
+
+def referencia_ms(repeticoes: int = 7) -> float:
+    """
+    Mediana do tempo (ms) da carga fixa, depois de uma passada de aquecimento.
+    """
+    _carga()
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        _carga()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+def para_referencia(medidas: dict, referencia: float) -> dict:
+    """
+    Troca cada medida ``*_ms`` por ``*_ref`` (múltiplos de ``referencia``);
+    as demais (contagens, memória) passam como estão.
+    """
+    return {
+        (nome[:-len(SUFIXO_MS)] + SUFIXO_REF if nome.endswith(SUFIXO_MS) else nome):
+            (round(valor / referencia, 3) if nome.endswith(SUFIXO_MS) else valor)
+        for nome, valor in medidas.items()
+    }
+
+
+def em_ms(medidas: dict, referencia: float) -> dict:
+    """
+    Inverso de ``para_referencia``, pela referência da máquina atual.
+    """
+    return {
+        (nome[:-len(SUFIXO_REF)] + SUFIXO_MS if nome.endswith(SUFIXO_REF) else nome):
+            (valor * referencia if nome.endswith(SUFIXO_REF) else valor)
+        for nome, valor in medidas.items()
+    }
+
+
+def gravar_base(caminho, resultados: dict, referencia: float):
+    """
+    Grava ``{grupo: {medida: valor}}`` com os tempos relativos à referência.
+    """
+    base = {grupo: para_referencia(medidas, referencia) for grupo, medidas in resultados.items()}
+    caminho.write_text(json.dumps(base, indent=2) + "\n", encoding="utf-8")
+
+
+def carregar_base(caminho, referencia: float) -> dict:
+    """
+    Base gravada por ``gravar_base``, com os tempos em ms desta máquina
+    (vazia se o arquivo não existir).
+    """
+    if not caminho.exists():
+        return {}
+    base = json.loads(caminho.read_text(encoding="utf-8"))
+    return {grupo: em_ms(medidas, referencia) for grupo, medidas in base.items()}
+
+
+if __name__ == "__main__":
+    print(f"Referência desta máquina: {referencia_ms():.1f} ms")
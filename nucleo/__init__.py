@@ -0,0 +1,6 @@
+"""
+Núcleo de cálculo dos checklists de leilão, sem dependência do Streamlit.
+
+Os módulos deste pacote podem ser importados e avaliados fora da interface
+(scripts, notebooks, processamento em lote de listas de imóveis).
+"""
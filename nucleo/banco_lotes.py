@@ -0,0 +1,259 @@
+"""
+Banco local de lotes (SQLite) com índices para consultas filtradas rápidas.
+
+Guarda o histórico de lotes importados (CSV de portfólio ou lista da Caixa)
+e devolve, para filtros como "Goiânia, Apartamento, Extrajudicial,
+desocupado, lance < 200 mil", um DataFrame pronto para o motor de custos.
+
+Uso em linha de comando (importa uma lista da Caixa em fluxo):
+    python -m nucleo.banco_lotes Lista_imoveis_GO.csv [lotes.sqlite3]
+"""
+import os
+import sqlite3
+import sys
+import threading
+from typing import Iterable
+
+import pandas as pd
+
+from nucleo.portfolio import calcular_portfolio, normalizar_portfolio
+from nucleo.tarifas import TAXAS_DA_TABELA
+from nucleo.texto import remover_acentos
+
+CAMINHO_PADRAO = "lotes.sqlite3"
+
+# Colunas gravadas (na ordem da tabela), além de id e das chaves de busca
+COLUNAS = [
+    "numero_imovel",
+    "uf",
+    "cidade",
+    "bairro",
+    "local_imovel",
+    "tipo_imovel",
+    "tipo_leilao",
+    "ocupado",
+    "valor_lance",
+    "valor_mercado",
+    "perc_itbi",
+    "perc_registro",
+    "debitos_passados",
+    "valor_acordo",
+    "custo_reforma",
+    "honorarios_adv",
+    "seguro_imovel",
+]
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS lotes (
+    id INTEGER PRIMARY KEY,
+    numero_imovel TEXT,
+    uf TEXT,
+    cidade TEXT,
+    bairro TEXT,
+    local_imovel TEXT,
+    tipo_imovel TEXT,
+    tipo_leilao TEXT,
+    ocupado TEXT,
+    valor_lance REAL NOT NULL,
+    valor_mercado REAL,
+    perc_itbi REAL,
+    perc_registro REAL,
+    debitos_passados REAL,
+    valor_acordo REAL,
+    custo_reforma REAL,
+    honorarios_adv REAL,
+    seguro_imovel REAL,
+    cidade_chave TEXT NOT NULL DEFAULT '',
+    chave TEXT NOT NULL DEFAULT '',
+    importado_em TEXT NOT NULL DEFAULT (datetime('now'))
+);
+-- Um registro por lote: importar de novo atualiza em vez de duplicar
+CREATE UNIQUE INDEX IF NOT EXISTS uq_lotes_chave ON lotes (chave);
+-- Filtro completo do checklist: igualdade nos campos de texto + faixa de lance
+CREATE INDEX IF NOT EXISTS idx_lotes_filtro
+    ON lotes (cidade_chave, tipo_imovel, tipo_leilao, ocupado, valor_lance);
+-- Filtros sem cidade
+CREATE INDEX IF NOT EXISTS idx_lotes_tipo
+    ON lotes (tipo_imovel, tipo_leilao, ocupado, valor_lance);
+-- Apenas faixa de preço
+CREATE INDEX IF NOT EXISTS idx_lotes_valor_lance ON lotes (valor_lance);
+"""
+
+_INSERIR = (
+    f"INSERT INTO lotes ({', '.join(COLUNAS)}, cidade_chave, chave) "
+    f"VALUES ({', '.join('?' * (len(COLUNAS) + 2))}) "
+    f"ON CONFLICT (chave) DO UPDATE SET "
+    f"{', '.join(f'{coluna} = excluded.{coluna}' for coluna in COLUNAS + ['cidade_chave'])}, "
+    f"importado_em = datetime('now')"
+)
+
+
+def chave_cidade(cidade: str) -> str:
+    """
+    Chave de busca da cidade: sem acentos e sem diferença de maiúsculas.
+    """
+    return " ".join(remover_acentos(cidade).casefold().split())
+
+
+def chaves_lotes(lotes: pd.DataFrame, origem: str, primeira_linha: int = 1) -> pd.Series:
+    """
+    Chave única de cada lote no banco: o número do imóvel (lista da Caixa)
+    ou, para lotes sem número (CSV de portfólio), o arquivo de origem e a
+    linha do lote nele (``primeira_linha`` é a do primeiro lote de
+    ``lotes``). Lance, ocupação etc. não entram na chave: reimportar o
+    arquivo corrigido atualiza os lotes em vez de duplicá-los.
+    """
+    numeros = lotes["numero_imovel"].astype(object).fillna("").astype(str).str.strip()
+    linhas = pd.Series(range(primeira_linha, primeira_linha + len(lotes)), index=lotes.index).astype(str)
+    return numeros.where(numeros != "", f"{origem}#" + linhas)
+
+
+class BancoLotes:
+    """
+    Acesso ao banco SQLite de lotes. Use ":memory:" para um banco temporário.
+
+    Uma instância é compartilhada entre as sessões (threads) do servidor; o
+    ``sqlite3`` não serializa o uso de uma mesma conexão, então todo acesso
+    passa por ``_trava``.
+    """
+
+    def __init__(self, caminho: str = CAMINHO_PADRAO):
+        self.caminho = caminho
+        self._trava = threading.RLock()
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.executescript(_ESQUEMA)
+
+    def fechar(self):
+        with self._trava:
+            self.conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def inserir(self, lotes: pd.DataFrame, origem: str, primeira_linha: int = 1) -> int:
+        """
+        Grava um DataFrame de lotes (formato do portfólio) em uma transação.
+        Um lote que já está no banco (mesma ``chaves_lotes``, com ``origem``
+        e ``primeira_linha``) é atualizado, não duplicado.
+
+        Quando não há coluna ``cidade``, ela é extraída de ``local_imovel``
+        ("Goiânia - Setor Bueno" -> "Goiânia"). Retorna a quantidade gravada.
+        """
+        # ITBI e registro não informados ficam em branco (ver nucleo.tarifas.aplicar_tarifas)
+        lotes = normalizar_portfolio(lotes, TAXAS_DA_TABELA)
+        if "cidade" not in lotes:
+            lotes["cidade"] = lotes["local_imovel"].str.split(" - ", n=1).str[0].str.strip()
+        for coluna in COLUNAS:
+            if coluna not in lotes:
+                lotes[coluna] = None
+        cidades = lotes["cidade"].fillna("")
+        lotes["cidade_chave"] = cidades.map({c: chave_cidade(c) for c in cidades.unique()})
+        lotes["chave"] = chaves_lotes(lotes, origem, primeira_linha)
+
+        registros = lotes[COLUNAS + ["cidade_chave", "chave"]].astype(object)
+        registros = registros.where(registros.notna(), None).itertuples(index=False, name=None)
+        with self._trava, self.conexao:
+            self.conexao.executemany(_INSERIR, registros)
+        return len(lotes)
+
+    def importar(self, blocos: Iterable[pd.DataFrame], origem: str, reindexar: bool = True) -> int:
+        """
+        Grava uma sequência de blocos (ex.: ``ler_lista_caixa``) do arquivo
+        ``origem``, com as linhas contadas através dos blocos, e atualiza as
+        estatísticas do planejador de consultas ao final.
+
+        Com ``reindexar`` (padrão), os índices são removidos durante a carga e
+        recriados no fim, o que é bem mais rápido para cargas grandes do que
+        atualizá-los linha a linha. Para acrescentar poucos lotes a um banco
+        grande, use ``reindexar=False``. O índice único de ``chave`` fica,
+        porque a atualização de lotes repetidos depende dele.
+        """
+        with self._trava:
+            if reindexar:
+                for (nome,) in self.conexao.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'lotes' "
+                        "AND name LIKE 'idx_lotes_%'").fetchall():
+                    self.conexao.execute(f"DROP INDEX {nome}")
+            try:
+                total = 0
+                for bloco in blocos:
+                    total += self.inserir(bloco, origem, total + 1)
+            finally:
+                if reindexar:
+                    self.conexao.executescript(_ESQUEMA)
+            self.conexao.execute("ANALYZE")
+        return total
+
+    def consultar(self, cidade: str = None, tipo_imovel: str = None, tipo_leilao: str = None,
+                  ocupado: str = None, lance_min: float = None, lance_max: float = None,
+                  limite: int = None) -> pd.DataFrame:
+        """
+        Devolve os lotes que atendem aos filtros informados (None = sem filtro).
+
+        ``lance_max`` é exclusivo ("lance < 200 mil"); ``lance_min`` é inclusivo.
+        """
+        condicoes = []
+        parametros = []
+        if cidade:
+            condicoes.append("cidade_chave = ?")
+            parametros.append(chave_cidade(cidade))
+        for coluna, valor in (("tipo_imovel", tipo_imovel), ("tipo_leilao", tipo_leilao),
+                              ("ocupado", ocupado)):
+            if valor:
+                condicoes.append(f"{coluna} = ?")
+                parametros.append(valor)
+        if lance_min is not None:
+            condicoes.append("valor_lance >= ?")
+            parametros.append(lance_min)
+        if lance_max is not None:
+            condicoes.append("valor_lance < ?")
+            parametros.append(lance_max)
+
+        sql = f"SELECT id, {', '.join(COLUNAS)} FROM lotes"
+        if condicoes:
+            sql += " WHERE " + " AND ".join(condicoes)
+        if limite:
+            sql += f" LIMIT {int(limite)}"
+
+        with self._trava:
+            linhas = self.conexao.execute(sql, parametros).fetchall()
+        return pd.DataFrame.from_records(linhas, columns=["id"] + COLUNAS)
+
+    def custear(self, **filtros) -> pd.DataFrame:
+        """
+        Consulta com os mesmos filtros de ``consultar`` e já calcula os custos.
+        """
+        return calcular_portfolio(normalizar_portfolio(self.consultar(**filtros)))
+
+    def valores_distintos(self, coluna: str) -> list:
+        """
+        Valores existentes de uma coluna de texto (para montar filtros na tela).
+        """
+        if coluna not in ("uf", "cidade", "tipo_imovel", "tipo_leilao", "ocupado"):
+            raise ValueError(f"Coluna não permitida: {coluna}")
+        with self._trava:
+            linhas = self.conexao.execute(
+                f"SELECT DISTINCT {coluna} FROM lotes WHERE {coluna} <> '' ORDER BY {coluna}"
+            ).fetchall()
+        return [linha[0] for linha in linhas]
+
+
+def main(argv=None):
+    from nucleo.importador_caixa import ler_lista_caixa
+
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        raise SystemExit("Uso: python -m nucleo.banco_lotes <Lista_imoveis_UF.csv> [banco.sqlite3]")
+
+    with BancoLotes(argv[1] if len(argv) > 1 else CAMINHO_PADRAO) as banco:
+        total = banco.importar(ler_lista_caixa(argv[0]), os.path.basename(argv[0]))
+    print(f"Lotes importados: {total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Valores monetários exatos em centavos inteiros (arrays NumPy int64).
+
+Com float, cada taxa do lote carrega frações de centavo que o
+``format_brl`` só arredonda na exibição; somados milhares de lotes, o total
+se afasta em centavos da soma das guias (cada guia já vem arredondada).
+Aqui cada taxa é calculada e arredondada para o centavo uma única vez, por
+uma regra explícita, com aritmética inteira; somas e formatação são exatas
+e bem mais rápidas que ``decimal.Decimal``.
+
+Percentuais continuam informados como no app (2.5 para 2,5%) e são
+convertidos para inteiros com quatro casas (2,5% -> 25000), o que cobre
+alíquotas como 0,35% sem erro de representação.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from nucleo.custos import PERC_COMISSAO_LEILOEIRO
+from nucleo.formatacao import format_brl_array, parse_brl_array
+
+# Regras de arredondamento para o centavo
+MEIO_PARA_CIMA = "meio_para_cima"  # 0,5 centavo arredonda para cima (padrão das guias e notas)
+MEIO_PAR = "meio_par"  # 0,5 centavo vai para o centavo par (arredondamento bancário)
+TRUNCAR = "truncar"  # descarta a fração de centavo
+
+# Regra de cada taxa calculada sobre o lance; mude aqui (ou passe ``regras``)
+# se a prefeitura, o cartório ou o leiloeiro usar outra.
+REGRAS = {
+    "comissao_leiloeiro": MEIO_PARA_CIMA,
+    "itbi": MEIO_PARA_CIMA,
+    "registro_cartorio": MEIO_PARA_CIMA,
+}
+
+# Percentual em inteiros: 1% = 10.000 (quatro casas decimais do percentual)
+_ESCALA_PERCENTUAL = 10_000
+_DIVISOR_PERCENTUAL = 100 * _ESCALA_PERCENTUAL
+
+# Até 10 trilhões de reais a formatação pelo float é exata (ver ``formatar``)
+_LIMITE_FORMATO_FLOAT = 10 ** 15
+
+# Separador de milhar "," vira "." e o decimal "." vira ","
+_TROCA_SEPARADORES = str.maketrans(",.", ".,")
+
+
+class CustosCentavos(NamedTuple):
+    """
+    Valores derivados de um ou mais lotes, em centavos (arrays int64).
+    """
+    comissao_leiloeiro: np.ndarray
+    itbi: np.ndarray
+    registro_cartorio: np.ndarray
+    custo_aquisicao_bruto: np.ndarray
+    investimento_total: np.ndarray
+    custo_total_avancado: np.ndarray
+
+
+def de_reais(valores) -> np.ndarray:
+    """
+    Converte reais (float, escalar ou array) para centavos, no centavo mais
+    próximo do valor informado.
+    """
+    return np.rint(np.asarray(valores, dtype=np.float64) * 100).astype(np.int64)
+
+
+def de_texto(textos) -> np.ndarray:
+    """
+    Converte textos no formato brasileiro ("R$ 1.234,56") para centavos.
+    Textos vazios ou inválidos levantam ValueError.
+    """
+    reais = parse_brl_array(textos)
+    if np.isnan(reais).any():
+        raise ValueError("Há valores vazios ou inválidos na coluna.")
+    return de_reais(reais)
+
+
+def para_reais(centavos) -> np.ndarray:
+    return np.asarray(centavos, dtype=np.int64) / 100
+
+
+def dividir(numerador, divisor: int, regra: str = MEIO_PARA_CIMA) -> np.ndarray:
+    """
+    Divisão inteira com arredondamento pela ``regra`` (sinal tratado à
+    parte, então -0,5 centavo arredonda como 0,5).
+    """
+    numerador = np.asarray(numerador, dtype=np.int64)
+    sinal = np.where(numerador < 0, -1, 1)
+    quociente, resto = np.divmod(np.abs(numerador), divisor)
+    if regra == MEIO_PARA_CIMA:
+        quociente += 2 * resto >= divisor
+    elif regra == MEIO_PAR:
+        quociente += (2 * resto > divisor) | ((2 * resto == divisor) & (quociente % 2 == 1))
+    elif regra != TRUNCAR:
+        raise ValueError(f"Regra de arredondamento desconhecida: {regra}")
+    return sinal * quociente
+
+
+def percentual(base, perc, regra: str = MEIO_PARA_CIMA) -> np.ndarray:
+    """
+    ``perc``% de ``base`` (centavos), arredondado para o centavo pela regra.
+    """
+    perc_inteiro = np.rint(np.asarray(perc, dtype=np.float64) * _ESCALA_PERCENTUAL).astype(np.int64)
+    return dividir(np.asarray(base, dtype=np.int64) * perc_inteiro, _DIVISOR_PERCENTUAL, regra)
+
+
+def somar(centavos) -> int:
+    """
+    Soma exata, devolvida como int do Python. O int64 comporta totais de
+    até ~92 quatrilhões de reais, longe de qualquer carteira real.
+    """
+    return int(np.asarray(centavos, dtype=np.int64).sum())
+
+
+def formatar(centavos) -> list:
+    """
+    Formata centavos no estilo brasileiro (123456 -> "1.234,56"), exato.
+
+    Abaixo de ``_LIMITE_FORMATO_FLOAT`` o float mais próximo de centavos/100
+    sempre arredonda de volta para o mesmo centavo com duas casas, então a
+    coluna passa pelo ``format_brl_array`` (mais rápido); acima, separa reais
+    e centavos com aritmética inteira.
+    """
+    centavos = np.asarray(centavos, dtype=np.int64).ravel()
+    if not centavos.size:
+        return []
+    absolutos = np.abs(centavos)
+    if absolutos.max() < _LIMITE_FORMATO_FLOAT:
+        return format_brl_array(centavos / 100)
+    sinais = np.where(centavos < 0, "-", "").tolist()
+    reais = (absolutos // 100).tolist()
+    fracoes = (absolutos % 100).tolist()
+    texto = ("{}{:,}.{:02d}\n" * len(reais)).format(*(v for trio in zip(sinais, reais, fracoes) for v in trio))
+    return texto[:-1].translate(_TROCA_SEPARADORES).split("\n")
+
+
+def calcular_custos_centavos(
+    valor_lance,
+    perc_itbi,
+    perc_registro,
+    debitos_passados=0,
+    valor_acordo=0,
+    custo_reforma=0,
+    honorarios_adv=0,
+    seguro_imovel=0,
+    perc_comissao=PERC_COMISSAO_LEILOEIRO,
+    valor_pago=None,
+    regras: dict = None,
+    emolumentos=0,
+) -> CustosCentavos:
+    """
+    Mesmas contas de ``nucleo.custos.calcular_custos``, com os valores em
+    centavos (int64) e cada taxa arredondada para o centavo pela sua regra
+    (``REGRAS``, sobrescritas por ``regras``). Os totais são somas exatas
+    das taxas já arredondadas, como nas guias.
+
+    ``emolumentos`` (centavos) é a parte fixa do registro, somada ao
+    percentual, como em ``nucleo.custos.calcular_custos``.
+    """
+    regras = {**REGRAS, **(regras or {})}
+    valor_lance = np.asarray(valor_lance, dtype=np.int64)
+    if valor_pago is None:
+        valor_pago = valor_lance
+
+    comissao_leiloeiro = percentual(valor_lance, perc_comissao, regras["comissao_leiloeiro"])
+    itbi = percentual(valor_lance, perc_itbi, regras["itbi"])
+    registro_cartorio = (percentual(valor_lance, perc_registro, regras["registro_cartorio"])
+                         + np.asarray(emolumentos, dtype=np.int64))
+
+    custo_aquisicao_bruto = (np.asarray(valor_pago, dtype=np.int64) + comissao_leiloeiro + itbi
+                             + registro_cartorio + debitos_passados + valor_acordo)
+    investimento_total = custo_aquisicao_bruto + custo_reforma
+    custo_total_avancado = investimento_total + honorarios_adv + seguro_imovel
+
+    return CustosCentavos(
+        comissao_leiloeiro=comissao_leiloeiro,
+        itbi=itbi,
+        registro_cartorio=registro_cartorio,
+        custo_aquisicao_bruto=custo_aquisicao_bruto,
+        investimento_total=investimento_total,
+        custo_total_avancado=custo_total_avancado,
+    )
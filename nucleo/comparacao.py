@@ -0,0 +1,185 @@
+"""
+Comparação lado a lado de vários lotes com recálculo incremental.
+
+A ``Comparacao`` guarda as entradas e os valores derivados de até
+``LOTES_MAXIMOS`` lotes em arrays NumPy (um por campo) e um resumo por
+campo derivado (soma, menor, maior e melhor lote). Alterar um campo de um
+lote recalcula só aquele lote e só os derivados que dependem do campo
+(mudar o valor de mercado não recalcula comissão, ITBI nem registro), e o
+resumo é atualizado apenas nas linhas afetadas, com a soma ajustada pela
+diferença em vez de refeita.
+"""
+import numpy as np
+import pandas as pd
+
+from nucleo.custos import PERC_COMISSAO_LEILOEIRO, calcular_custos
+from nucleo.portfolio import COLUNAS_CUSTOS, PADROES
+from nucleo.retorno import PERC_CUSTOS_VENDA, PRAZO_VENDA_MESES, TAXA_DESCONTO_ANUAL, calcular_retorno
+
+LOTES_MAXIMOS = 50
+
+CAMPOS_ENTRADA = [
+    "valor_lance",
+    "perc_comissao",
+    "perc_itbi",
+    "perc_registro",
+    "debitos_passados",
+    "valor_acordo",
+    "custo_reforma",
+    "honorarios_adv",
+    "seguro_imovel",
+    "valor_mercado",
+]
+
+# Valores dos campos ausentes de um lote
+PADROES_ENTRADA = {**PADROES, "perc_comissao": PERC_COMISSAO_LEILOEIRO}
+
+CAMPOS_RETORNO = ["lucro_revenda", "roi", "vpl", "tir_anual"]
+CAMPOS_DERIVADOS = COLUNAS_CUSTOS + ["margem_mercado"] + CAMPOS_RETORNO
+
+# Derivados que dependem de cada entrada; as demais entradas afetam todos
+_DEPENDENTES = {
+    "valor_mercado": ["margem_mercado"] + CAMPOS_RETORNO,
+}
+
+# No resumo, o melhor lote é o de menor valor nestes campos e o de maior nos demais
+_MENOR_E_MELHOR = set(COLUNAS_CUSTOS)
+
+
+class Comparacao:
+    """
+    Lotes de uma comparação, com entradas, derivados e resumo sempre em dia.
+
+    ``lotes`` é uma lista de dicionários com os campos de ``CAMPOS_ENTRADA``
+    (os ausentes usam ``PADROES_ENTRADA``); ``nomes`` identifica as
+    colunas. ``recalculos`` conta quantos lotes foram recalculados desde a
+    criação (útil para conferir que uma edição não recalcula os demais).
+    """
+
+    def __init__(self, lotes: list, nomes: list = None, meses=PRAZO_VENDA_MESES,
+                 perc_custos_venda=PERC_CUSTOS_VENDA, custo_mensal=0.0, taxa_desconto_anual=TAXA_DESCONTO_ANUAL):
+        if len(lotes) > LOTES_MAXIMOS:
+            raise ValueError(f"A comparação aceita até {LOTES_MAXIMOS} lotes.")
+        self.nomes = list(nomes) if nomes is not None else [f"Lote {i + 1}" for i in range(len(lotes))]
+        self.entradas = {
+            campo: np.array([lote.get(campo, PADROES_ENTRADA.get(campo, 0.0)) for lote in lotes], dtype=np.float64)
+            for campo in CAMPOS_ENTRADA
+        }
+        self.parametros = {"meses": meses, "perc_custos_venda": perc_custos_venda,
+                           "custo_mensal": custo_mensal, "taxa_desconto_anual": taxa_desconto_anual}
+        self.derivados = {campo: np.zeros(len(lotes)) for campo in CAMPOS_DERIVADOS}
+        self.resumo = {}
+        self.recalculos = 0
+        self._recalcular(slice(None), CAMPOS_DERIVADOS)
+        for campo in CAMPOS_DERIVADOS:
+            self._resumir(campo)
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def _recalcular(self, lotes, campos):
+        """
+        Recalcula ``campos`` (derivados) para os lotes indicados (índice ou
+        fatia), chamando o motor de custos só quando algum custo é afetado.
+        """
+        e = {campo: valores[lotes] for campo, valores in self.entradas.items()}
+        if any(campo in COLUNAS_CUSTOS for campo in campos):
+            custos = calcular_custos(
+                e["valor_lance"], e["perc_itbi"], e["perc_registro"],
+                debitos_passados=e["debitos_passados"],
+                valor_acordo=e["valor_acordo"],
+                custo_reforma=e["custo_reforma"],
+                honorarios_adv=e["honorarios_adv"],
+                seguro_imovel=e["seguro_imovel"],
+                perc_comissao=e["perc_comissao"],
+            )
+            for campo, valores in custos._asdict().items():
+                self.derivados[campo][lotes] = valores
+        custo_total = self.derivados["custo_total_avancado"][lotes]
+        self.derivados["margem_mercado"][lotes] = e["valor_mercado"] - custo_total
+        if any(campo in CAMPOS_RETORNO for campo in campos):
+            retorno = calcular_retorno(custo_total, e["valor_mercado"], **self.parametros)
+            self.derivados["lucro_revenda"][lotes] = retorno.lucro
+            self.derivados["roi"][lotes] = retorno.roi
+            self.derivados["vpl"][lotes] = retorno.vpl
+            self.derivados["tir_anual"][lotes] = retorno.tir_anual
+        self.recalculos += len(self) if isinstance(lotes, slice) else 1
+
+    def _resumir(self, campo, anterior=None, indice=None):
+        """
+        Atualiza a linha do resumo de um campo derivado. Com o valor
+        ``anterior`` do lote ``indice``, a soma é ajustada pela diferença.
+        """
+        valores = self.derivados[campo]
+        if not len(valores):
+            self.resumo[campo] = {"soma": 0.0, "menor": np.nan, "maior": np.nan, "melhor": None}
+            return
+        linha = self.resumo.get(campo)
+        if linha is not None and anterior is not None:
+            soma = linha["soma"] + np.nan_to_num(valores[indice]) - np.nan_to_num(anterior)
+        else:
+            soma = float(np.nansum(valores))
+        escolha = np.nanargmin if campo in _MENOR_E_MELHOR else np.nanargmax
+        validos = not np.isnan(valores).all()
+        self.resumo[campo] = {
+            "soma": soma,
+            "menor": float(np.nanmin(valores)) if validos else np.nan,
+            "maior": float(np.nanmax(valores)) if validos else np.nan,
+            "melhor": self.nomes[escolha(valores)] if validos else None,
+        }
+
+    def alterar(self, indice: int, campo: str, valor: float) -> list:
+        """
+        Muda uma entrada de um lote e recalcula só o que depende dela.
+        Devolve os campos derivados afetados (vazio se o valor não mudou).
+        """
+        if campo not in self.entradas:
+            raise ValueError(f"Campo desconhecido: {campo}")
+        valor = float(valor)
+        if self.entradas[campo][indice] == valor:
+            return []
+        self.entradas[campo][indice] = valor
+        afetados = _DEPENDENTES.get(campo, CAMPOS_DERIVADOS)
+        anteriores = {c: self.derivados[c][indice] for c in afetados}
+        self._recalcular(indice, afetados)
+        for c in afetados:
+            if self.derivados[c][indice] != anteriores[c]:
+                self._resumir(c, anteriores[c], indice)
+        return afetados
+
+    def definir_parametros(self, **parametros) -> bool:
+        """
+        Muda os parâmetros da revenda (comuns a todos os lotes); só o
+        retorno é recalculado, de uma vez para todos. Devolve se algo mudou.
+        """
+        novos = {**self.parametros, **parametros}
+        if novos == self.parametros:
+            return False
+        self.parametros = novos
+        self._recalcular(slice(None), CAMPOS_RETORNO)
+        for campo in CAMPOS_RETORNO:
+            self._resumir(campo)
+        return True
+
+    def tabela_entradas(self) -> pd.DataFrame:
+        """
+        Entradas com um lote por coluna e um campo por linha.
+        """
+        return pd.DataFrame(self.entradas, index=self.nomes).T
+
+    def tabela_derivados(self) -> pd.DataFrame:
+        return pd.DataFrame(self.derivados, index=self.nomes).T
+
+    def tabela_resumo(self) -> pd.DataFrame:
+        return pd.DataFrame.from_dict(self.resumo, orient="index")[["soma", "menor", "maior", "melhor"]]
+
+
+def alteracoes(anterior: pd.DataFrame, atual: pd.DataFrame) -> list:
+    """
+    Células diferentes entre duas tabelas de entradas (mesmo formato de
+    ``Comparacao.tabela_entradas``): lista de (índice do lote, campo, valor).
+    """
+    a, b = anterior.to_numpy(dtype=np.float64), atual.to_numpy(dtype=np.float64)
+    diferente = (a != b) & ~(np.isnan(a) & np.isnan(b))
+    linhas, colunas = np.nonzero(diferente)
+    return [(int(c), anterior.index[l], float(atual.iat[l, c])) for l, c in zip(linhas, colunas)]
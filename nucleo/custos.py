@@ -0,0 +1,228 @@
+"""
+Motor de custos de aquisição de imóveis em leilão.
+
+Reproduz, sem Streamlit, as contas do PASSO 6 ao PASSO 10 do checklist
+(comissão, ITBI, registro, subtotal de aquisição, investimento total e total
+com honorários e seguro). Todas as entradas aceitam escalares ou arrays e são
+avaliadas em uma única passada vetorizada do NumPy, o que permite custear
+milhares de lotes de uma vez.
+
+``modelo_custos`` monta as mesmas contas como grafo de dependências
+(``nucleo.grafo``), para quem muda poucas entradas por vez e quer recalcular
+só o que depende delas.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from nucleo.financiamento import calcular_entrada_financiamento
+from nucleo.grafo import Grafo
+from nucleo.retorno import PERC_CUSTOS_VENDA, PRAZO_VENDA_MESES, TAXA_DESCONTO_ANUAL, calcular_retorno
+
+# Comissão padrão do leiloeiro, em % do lance
+PERC_COMISSAO_LEILOEIRO = 5.0
+
+
+class CustosLote(NamedTuple):
+    """
+    Valores derivados de um ou mais lotes (cada campo é um array NumPy).
+    """
+    comissao_leiloeiro: np.ndarray
+    itbi: np.ndarray
+    registro_cartorio: np.ndarray
+    custo_aquisicao_bruto: np.ndarray
+    investimento_total: np.ndarray
+    custo_total_avancado: np.ndarray
+
+
+# ---------------------------------------------------------------------------
+# Fórmulas de cada valor derivado. Os nomes dos parâmetros são os nomes das
+# entradas e dos outros derivados: as mesmas funções servem ao cálculo
+# vetorizado (calcular_custos) e ao grafo de dependências (modelo_custos).
+# ---------------------------------------------------------------------------
+def _comissao_leiloeiro(valor_lance, perc_comissao):
+    return valor_lance * (perc_comissao / 100.0)
+
+
+def _itbi(valor_lance, perc_itbi):
+    return valor_lance * (perc_itbi / 100.0)
+
+
+def _registro_cartorio(valor_lance, perc_registro, emolumentos):
+    return valor_lance * (perc_registro / 100.0) + emolumentos
+
+
+def _custo_aquisicao_bruto(valor_pago, comissao_leiloeiro, itbi, registro_cartorio, debitos_passados, valor_acordo):
+    return valor_pago + comissao_leiloeiro + itbi + registro_cartorio + debitos_passados + valor_acordo
+
+
+def _investimento_total(custo_aquisicao_bruto, custo_reforma):
+    return custo_aquisicao_bruto + custo_reforma
+
+
+def _custo_total_avancado(investimento_total, honorarios_adv, seguro_imovel):
+    return investimento_total + honorarios_adv + seguro_imovel
+
+
+def calcular_custos(
+    valor_lance,
+    perc_itbi,
+    perc_registro,
+    debitos_passados=0.0,
+    valor_acordo=0.0,
+    custo_reforma=0.0,
+    honorarios_adv=0.0,
+    seguro_imovel=0.0,
+    perc_comissao=PERC_COMISSAO_LEILOEIRO,
+    valor_pago=None,
+    emolumentos=0.0,
+) -> CustosLote:
+    """
+    Calcula todos os custos derivados a partir das entradas do checklist.
+
+    Percentuais são informados como no app (ex.: 2.5 para 2,5%). As entradas
+    são combinadas por broadcasting, então é possível passar um array de
+    lances com taxas escalares, ou arrays do mesmo tamanho para cada lote.
+
+    ``valor_pago`` substitui o lance na soma da aquisição quando o pagamento
+    é a prazo (ex.: valor presente do parcelamento CPC 895 ou do
+    financiamento); comissão, ITBI e registro continuam sobre o lance.
+
+    ``emolumentos`` (R$) é a parte fixa do registro, somada ao percentual:
+    com a tabela de emolumentos por faixa (``nucleo.tarifas``), o registro é
+    só esse valor e ``perc_registro`` fica em zero.
+    """
+    valor_lance = np.asarray(valor_lance, dtype=np.float64)
+    if valor_pago is None:
+        valor_pago = valor_lance
+
+    comissao_leiloeiro = _comissao_leiloeiro(valor_lance, np.asarray(perc_comissao, dtype=np.float64))
+    itbi = _itbi(valor_lance, np.asarray(perc_itbi, dtype=np.float64))
+    registro_cartorio = _registro_cartorio(valor_lance, np.asarray(perc_registro, dtype=np.float64),
+                                           np.asarray(emolumentos, dtype=np.float64))
+
+    custo_aquisicao_bruto = _custo_aquisicao_bruto(valor_pago, comissao_leiloeiro, itbi, registro_cartorio,
+                                                   debitos_passados, valor_acordo)
+    investimento_total = _investimento_total(custo_aquisicao_bruto, custo_reforma)
+    custo_total_avancado = _custo_total_avancado(investimento_total, honorarios_adv, seguro_imovel)
+
+    return CustosLote(
+        comissao_leiloeiro=comissao_leiloeiro,
+        itbi=itbi,
+        registro_cartorio=registro_cartorio,
+        custo_aquisicao_bruto=custo_aquisicao_bruto,
+        investimento_total=investimento_total,
+        custo_total_avancado=custo_total_avancado,
+    )
+
+
+def lance_maximo(
+    valor_orcamento_max,
+    perc_itbi,
+    perc_registro,
+    debitos_passados=0.0,
+    valor_acordo=0.0,
+    custo_reforma=0.0,
+    honorarios_adv=0.0,
+    seguro_imovel=0.0,
+    perc_comissao=PERC_COMISSAO_LEILOEIRO,
+    emolumentos=0.0,
+    faixas_registro=None,
+) -> np.ndarray:
+    """
+    Maior lance que cabe no orçamento (inverso de ``calcular_custos``).
+
+    O custo total é ``lance * (1 + comissão + ITBI + registro) + custos fixos``
+    (``emolumentos`` entre eles), então o lance máximo sai em forma fechada:
+    ``(orçamento - custos fixos) / (1 + soma das taxas)``, nunca negativo.
+    Aceita escalares ou arrays, como ``calcular_custos``.
+
+    Com ``faixas_registro`` (``limites`` e ``emolumentos`` por faixa, como em
+    ``nucleo.tarifas.Tarifas``), o emolumento é o da faixa do próprio lance,
+    no lugar de ``emolumentos``: o lance é resolvido com o emolumento de cada
+    faixa, limitado à faixa, e vale o maior. O custo cresce com o lance, então
+    esse é o maior lance que cabe no orçamento.
+    """
+    taxas = (np.asarray(perc_comissao, dtype=np.float64)
+             + np.asarray(perc_itbi, dtype=np.float64)
+             + np.asarray(perc_registro, dtype=np.float64)) / 100.0
+    custos_fixos = (np.asarray(debitos_passados, dtype=np.float64) + valor_acordo
+                    + custo_reforma + honorarios_adv + seguro_imovel)
+    disponivel = np.asarray(valor_orcamento_max, dtype=np.float64) - custos_fixos
+    if faixas_registro is None:
+        return np.maximum((disponivel - emolumentos) / (1.0 + taxas), 0.0)
+
+    disponivel, taxas = np.broadcast_arrays(disponivel, taxas)
+    limites = np.asarray(faixas_registro.limites, dtype=np.float64)
+    # Faixa i: lances acima de limites[i - 1] e até limites[i]; a última não tem teto
+    pisos = np.concatenate(([0.0], limites[:-1]))
+    tetos = np.concatenate((limites[:-1], [np.inf]))
+    candidatos = (disponivel[..., None] - np.asarray(faixas_registro.emolumentos, dtype=np.float64)) \
+        / (1.0 + taxas[..., None])
+    lances = np.where(candidatos >= pisos, np.minimum(candidatos, tetos), 0.0)
+    return lances.max(axis=-1)
+
+
+def _valor_entrada(valor_lance, perc_entrada):
+    return calcular_entrada_financiamento(valor_lance, perc_entrada)[0]
+
+
+def _valor_financiado(valor_lance, perc_entrada):
+    return calcular_entrada_financiamento(valor_lance, perc_entrada)[1]
+
+
+def _retorno(custo_total_avancado, valor_mercado, prazo_venda, perc_custos_venda, custo_mensal_manutencao,
+             taxa_desconto_anual):
+    return calcular_retorno(custo_total_avancado, valor_mercado, prazo_venda, perc_custos_venda,
+                            custo_mensal_manutencao, taxa_desconto_anual)
+
+
+# Entradas do modelo e seus valores iniciais (os mesmos do checklist)
+ENTRADAS_MODELO = {
+    "valor_lance": 0.0,
+    "perc_comissao": PERC_COMISSAO_LEILOEIRO,
+    "perc_itbi": 2.5,
+    "perc_registro": 1.2,
+    "emolumentos": 0.0,
+    "faixas_registro": None,
+    "debitos_passados": 0.0,
+    "valor_acordo": 0.0,
+    "custo_reforma": 0.0,
+    "honorarios_adv": 0.0,
+    "seguro_imovel": 0.0,
+    "valor_pago": 0.0,
+    "perc_entrada": 0.0,
+    "valor_orcamento_max": 0.0,
+    "valor_mercado": 0.0,
+    "prazo_venda": PRAZO_VENDA_MESES,
+    "perc_custos_venda": PERC_CUSTOS_VENDA,
+    "custo_mensal_manutencao": 0.0,
+    "taxa_desconto_anual": TAXA_DESCONTO_ANUAL,
+}
+
+
+def modelo_custos() -> Grafo:
+    """
+    Modelo de custos do checklist como grafo de dependências.
+
+    Mudar uma entrada com ``definir`` suja só os derivados que dependem
+    dela (ex.: ``perc_itbi`` recalcula ``itbi``, os totais, o lance máximo e
+    o retorno, mas não a comissão nem o registro). Derivados: os campos de
+    ``CustosLote``, ``valor_entrada``/``valor_financiado`` (financiamento
+    sobre ``perc_entrada``), ``lance_max_orcamento`` e ``retorno``
+    (``nucleo.retorno.Retorno``).
+    """
+    grafo = Grafo()
+    for nome, valor in ENTRADAS_MODELO.items():
+        grafo.entrada(nome, valor)
+    grafo.derivado("comissao_leiloeiro", _comissao_leiloeiro)
+    grafo.derivado("itbi", _itbi)
+    grafo.derivado("registro_cartorio", _registro_cartorio)
+    grafo.derivado("custo_aquisicao_bruto", _custo_aquisicao_bruto)
+    grafo.derivado("investimento_total", _investimento_total)
+    grafo.derivado("custo_total_avancado", _custo_total_avancado)
+    grafo.derivado("valor_entrada", _valor_entrada)
+    grafo.derivado("valor_financiado", _valor_financiado)
+    grafo.derivado("lance_max_orcamento", lance_maximo)
+    grafo.derivado("retorno", _retorno)
+    return grafo
@@ -0,0 +1,140 @@
+"""
+Respostas salvas do checklist (SQLite), por analista e lote.
+
+Cada checklist é gravado como um único BLOB: o JSON compacto dos valores dos
+widgets comprimido com zlib (algumas centenas de bytes por lote). Retomar um
+lote é uma leitura pela chave primária; montar um painel com todos os
+checklists salvos é uma única consulta seguida da descompressão de cada
+BLOB, sem tabelas auxiliares.
+
+Uso em linha de comando (lista os checklists salvos):
+    python -m nucleo.estado [checklists.sqlite3]
+"""
+import json
+import sqlite3
+import sys
+import threading
+import zlib
+
+import pandas as pd
+
+CAMINHO_PADRAO = "checklists.sqlite3"
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS checklists (
+    analista TEXT NOT NULL,
+    lote TEXT NOT NULL,
+    estado BLOB NOT NULL,
+    atualizado_em TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (analista, lote)
+) WITHOUT ROWID;
+"""
+
+_SALVAR = """
+INSERT INTO checklists (analista, lote, estado) VALUES (?, ?, ?)
+ON CONFLICT (analista, lote) DO UPDATE SET estado = excluded.estado, atualizado_em = datetime('now')
+"""
+
+
+def codificar(estado: dict) -> bytes:
+    """
+    Forma compacta de um checklist: JSON sem espaços, comprimido com zlib.
+    """
+    return zlib.compress(json.dumps(estado, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def decodificar(dados: bytes) -> dict:
+    return json.loads(zlib.decompress(dados))
+
+
+class BancoChecklists:
+    """
+    Acesso ao banco SQLite de checklists salvos. Use ":memory:" para um banco
+    temporário.
+
+    Uma instância é compartilhada entre as sessões (threads) do servidor,
+    então todo acesso à conexão passa por ``_trava``.
+    """
+
+    def __init__(self, caminho: str = CAMINHO_PADRAO):
+        self.caminho = caminho
+        self._trava = threading.Lock()
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.executescript(_ESQUEMA)
+
+    def fechar(self):
+        with self._trava:
+            self.conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def salvar(self, analista: str, lote: str, estado: dict):
+        """
+        Grava (ou substitui) o checklist do lote.
+        """
+        with self._trava, self.conexao:
+            self.conexao.execute(_SALVAR, (analista, lote, codificar(estado)))
+
+    def carregar(self, analista: str, lote: str) -> dict:
+        """
+        Checklist salvo do lote, ou None se não houver.
+        """
+        with self._trava:
+            linha = self.conexao.execute(
+                "SELECT estado FROM checklists WHERE analista = ? AND lote = ?", (analista, lote)
+            ).fetchone()
+        return decodificar(linha[0]) if linha else None
+
+    def remover(self, analista: str, lote: str):
+        with self._trava, self.conexao:
+            self.conexao.execute("DELETE FROM checklists WHERE analista = ? AND lote = ?", (analista, lote))
+
+    def lotes(self, analista: str) -> list:
+        """
+        Lotes salvos do analista, do mais recente para o mais antigo.
+        """
+        with self._trava:
+            linhas = self.conexao.execute(
+                "SELECT lote FROM checklists WHERE analista = ? ORDER BY atualizado_em DESC, lote", (analista,)
+            ).fetchall()
+        return [linha[0] for linha in linhas]
+
+    def carregar_todos(self, analista: str = None) -> pd.DataFrame:
+        """
+        Todos os checklists salvos (do analista, se informado) em uma tabela:
+        analista, lote, atualizado_em e uma coluna por campo do checklist.
+        """
+        sql = "SELECT analista, lote, atualizado_em, estado FROM checklists"
+        parametros = ()
+        if analista:
+            sql += " WHERE analista = ?"
+            parametros = (analista,)
+        with self._trava:
+            linhas = self.conexao.execute(sql, parametros).fetchall()
+        registros = [
+            {"analista": a, "lote": l, "atualizado_em": em, **decodificar(estado)}
+            for a, l, em, estado in linhas
+        ]
+        if not registros:
+            return pd.DataFrame(columns=["analista", "lote", "atualizado_em"])
+        return pd.DataFrame.from_records(registros)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    with BancoChecklists(argv[0] if argv else CAMINHO_PADRAO) as banco:
+        tabela = banco.carregar_todos()
+    if tabela.empty:
+        print("Nenhum checklist salvo.")
+        return
+    print(tabela[["analista", "lote", "atualizado_em"]].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Exportação dos valores calculados (um lote ou um portfólio inteiro) em CSV,
+JSON ou XLSX.
+
+Cada formato é um gerador de pedaços de bytes: o arquivo é produzido em
+blocos de linhas e pode ir direto para um arquivo ou resposta HTTP, sem
+montar o conteúdo inteiro como uma única string em memória. O XLSX é escrito
+com ``zipfile`` em modo fluxo (planilha com strings embutidas e sem tabela
+de strings compartilhadas), sem dependência externa.
+"""
+import math
+import tempfile
+import zipfile
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+# Campos exportados, na ordem do checklist: (coluna, rótulo na planilha)
+CAMPOS_EXPORTACAO = [
+    ("local_imovel", "Local"),
+    ("tipo_imovel", "Tipo de imóvel"),
+    ("tipo_leilao", "Tipo de leilão"),
+    ("ocupado", "Ocupação"),
+    ("forma_pagamento", "Forma de pagamento"),
+    ("valor_lance", "Lance (R$)"),
+    ("perc_comissao", "Comissão (%)"),
+    ("comissao_leiloeiro", "Comissão do leiloeiro (R$)"),
+    ("perc_itbi", "ITBI (%)"),
+    ("itbi", "ITBI (R$)"),
+    ("perc_registro", "Registro (%)"),
+    ("registro_cartorio", "Registro em cartório (R$)"),
+    ("debitos_passados", "Dívidas passadas (R$)"),
+    ("valor_acordo", "Acordo com ocupante (R$)"),
+    ("custo_aquisicao_bruto", "Subtotal de aquisição (R$)"),
+    ("custo_reforma", "Reforma (R$)"),
+    ("investimento_total", "Investimento total (R$)"),
+    ("honorarios_adv", "Honorários advocatícios (R$)"),
+    ("seguro_imovel", "Seguro (R$)"),
+    ("custo_total_avancado", "Total geral (R$)"),
+    ("perc_entrada", "Entrada (%)"),
+    ("valor_entrada", "Valor de entrada (R$)"),
+    ("valor_financiado", "Valor financiado (R$)"),
+    ("valor_pago", "Valor presente do pagamento (R$)"),
+    ("valor_orcamento_max", "Orçamento máximo (R$)"),
+    ("lance_maximo", "Lance máximo no orçamento (R$)"),
+    ("folga_lance", "Folga sobre o lance máximo (R$)"),
+    ("valor_mercado", "Valor de mercado (R$)"),
+    ("margem_mercado", "Margem sobre o mercado (R$)"),
+    ("lucro_revenda", "Lucro na revenda (R$)"),
+    ("roi", "ROI"),
+    ("vpl", "VPL da revenda (R$)"),
+    ("tir_anual", "TIR ao ano"),
+]
+_ROTULOS = dict(CAMPOS_EXPORTACAO)
+_COLUNAS_FRACAO = {"roi", "tir_anual"}
+
+FORMATOS = {
+    "CSV": ("csv", "text/csv"),
+    "JSON": ("json", "application/json"),
+    "XLSX": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+LINHAS_POR_BLOCO = 5000
+
+
+def colunas_exportadas(df: pd.DataFrame) -> list:
+    """
+    Colunas de ``CAMPOS_EXPORTACAO`` presentes no DataFrame, na ordem padrão.
+    """
+    return [coluna for coluna, _ in CAMPOS_EXPORTACAO if coluna in df.columns]
+
+
+def _blocos(df: pd.DataFrame, colunas: list):
+    for inicio in range(0, len(df), LINHAS_POR_BLOCO):
+        yield df[colunas].iloc[inicio:inicio + LINHAS_POR_BLOCO]
+
+
+def gerar_csv(df: pd.DataFrame):
+    """
+    CSV com ";" e vírgula decimal (abre direto no Excel em português e volta
+    para o portfólio pelo importador), com BOM para o Excel reconhecer UTF-8.
+    """
+    colunas = colunas_exportadas(df)
+    yield ("\ufeff" + ";".join(colunas) + "\n").encode("utf-8")
+    for bloco in _blocos(df, colunas):
+        yield bloco.to_csv(sep=";", decimal=",", header=False, index=False, lineterminator="\n").encode("utf-8")
+
+
+def gerar_json(df: pd.DataFrame):
+    """
+    Lista JSON com um objeto por lote (NaN vira ``null``).
+    """
+    colunas = colunas_exportadas(df)
+    yield b"["
+    primeiro = True
+    for bloco in _blocos(df, colunas):
+        registros = bloco.to_json(orient="records", force_ascii=False, double_precision=10)[1:-1]
+        if registros:
+            yield (("" if primeiro else ",") + registros).encode("utf-8")
+            primeiro = False
+    yield b"]\n"
+
+
+class _Vazao:
+    """
+    Destino de escrita do ``zipfile`` que apenas acumula os bytes até o
+    gerador repassá-los (o ZIP é escrito em modo fluxo, sem ``seek``).
+    """
+
+    def __init__(self):
+        self.partes = []
+
+    def write(self, dados) -> int:
+        self.partes.append(bytes(dados))
+        return len(dados)
+
+    def flush(self):
+        pass
+
+    def drenar(self) -> bytes:
+        dados, self.partes = b"".join(self.partes), []
+        return dados
+
+
+_XLSX_FIXOS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Custos" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    # Estilos: 0 padrão, 1 cabeçalho em negrito, 2 moeda (#,##0.00), 3 percentual (0.00%)
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="4"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+        '<xf numFmtId="4" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+        '<xf numFmtId="10" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    ),
+}
+
+
+def _celula_texto(valor, estilo: int = 0) -> str:
+    texto = "" if valor is None or (isinstance(valor, float) and not math.isfinite(valor)) else str(valor)
+    atributo = f' s="{estilo}"' if estilo else ""
+    return f'<c t="inlineStr"{atributo}><is><t>{escape(texto)}</t></is></c>'
+
+
+def gerar_xlsx(df: pd.DataFrame):
+    """
+    Planilha XLSX com uma linha por lote: valores em R$ com separador de
+    milhar e ROI/TIR em percentual, com NaN e infinito em branco. As linhas
+    são comprimidas e repassadas bloco a bloco.
+    """
+    colunas = colunas_exportadas(df)
+    numericas = [pd.api.types.is_numeric_dtype(df[coluna]) for coluna in colunas]
+    estilos = [3 if coluna in _COLUNAS_FRACAO else 2 for coluna in colunas]
+
+    vazao = _Vazao()
+    with zipfile.ZipFile(vazao, "w", compression=zipfile.ZIP_DEFLATED) as arquivo:
+        for nome, conteudo in _XLSX_FIXOS.items():
+            arquivo.writestr(nome, conteudo)
+        yield vazao.drenar()
+
+        with arquivo.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as planilha:
+            planilha.write(
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                '<sheetData><row>'.encode("utf-8")
+                + "".join(_celula_texto(_ROTULOS[coluna], 1) for coluna in colunas).encode("utf-8")
+                + b"</row>"
+            )
+            for bloco in _blocos(df, colunas):
+                valores = [bloco[coluna].to_numpy(dtype=np.float64 if numerica else object).tolist()
+                           for coluna, numerica in zip(colunas, numericas)]
+                linhas = []
+                for linha in zip(*valores):
+                    celulas = []
+                    for valor, numerica, estilo in zip(linha, numericas, estilos):
+                        if not numerica:
+                            celulas.append(_celula_texto(valor))
+                        elif not math.isfinite(valor):
+                            # "inf" não é número válido no XML da planilha: a célula fica vazia
+                            celulas.append("<c/>")
+                        else:
+                            celulas.append(f'<c s="{estilo}"><v>{valor!r}</v></c>')
+                    linhas.append("<row>" + "".join(celulas) + "</row>")
+                planilha.write("".join(linhas).encode("utf-8"))
+                yield vazao.drenar()
+            planilha.write(b"</sheetData></worksheet>")
+    yield vazao.drenar()
+
+
+_GERADORES = {"CSV": gerar_csv, "JSON": gerar_json, "XLSX": gerar_xlsx}
+
+
+def exportar(df: pd.DataFrame, formato: str):
+    """
+    Gerador de pedaços de bytes do arquivo no formato pedido (ver ``FORMATOS``).
+    """
+    if formato not in _GERADORES:
+        raise ValueError(f"Formato de exportação desconhecido: {formato}")
+    return _GERADORES[formato](df)
+
+
+def gravar(partes, destino) -> int:
+    """
+    Grava os pedaços de ``exportar`` em um arquivo binário; devolve os bytes escritos.
+    """
+    total = 0
+    for parte in partes:
+        destino.write(parte)
+        total += len(parte)
+    return total
+
+
+def exportar_para_download(df: pd.DataFrame, formato: str) -> bytes:
+    """
+    Conteúdo completo do arquivo para um botão de download. Os pedaços vão
+    primeiro para um arquivo temporário em disco, então a memória guarda só
+    o resultado final, e não os pedaços e o resultado ao mesmo tempo.
+    """
+    with tempfile.TemporaryFile() as destino:
+        gravar(exportar(df, formato), destino)
+        destino.seek(0)
+        return destino.read()
+
+
+def lote_para_tabela(valores: dict) -> pd.DataFrame:
+    """
+    Tabela de uma linha com os valores de um único lote (ex.: os do checklist).
+    """
+    return pd.DataFrame([{coluna: valores[coluna] for coluna, _ in CAMPOS_EXPORTACAO if coluna in valores}])
+
@@ -0,0 +1,137 @@
+"""
+Tabelas de amortização (SAC e PRICE) para o "Financiamento Caixa".
+
+Os cenários (valor financiado, taxa, prazo, sistema, TR, seguro, tarifa)
+podem ser escalares ou arrays: todos são avaliados juntos, vetorizados ao
+longo dos meses e dos cenários, com saldo devedor em forma fechada.
+
+Convenções (como nos contratos habitacionais da Caixa):
+- a TR corrige o saldo devedor todo mês, antes dos juros e da amortização;
+- a prestação é recalculada sobre o saldo corrigido e o prazo restante;
+- o seguro (MIP/DFI) é um percentual mensal sobre o saldo corrigido;
+- a tarifa de administração é um valor fixo por mês.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+PRAZO_MAXIMO_MESES = 420
+SISTEMAS = ("SAC", "PRICE")
+
+
+class TabelaAmortizacao(NamedTuple):
+    """
+    Resultado de ``tabela_amortizacao``. Campos mensais têm formato
+    [cenário, mês]; meses após o prazo de cada cenário valem zero.
+    """
+    saldo_devedor: np.ndarray
+    amortizacao: np.ndarray
+    juros: np.ndarray
+    seguro: np.ndarray
+    tarifa: np.ndarray
+    prestacao: np.ndarray
+    primeira_prestacao: np.ndarray
+    ultima_prestacao: np.ndarray
+    total_pago: np.ndarray
+    total_juros: np.ndarray
+
+
+def taxa_mensal(taxa_anual_perc):
+    """
+    Converte taxa efetiva anual (%, ex.: 11.5) em taxa efetiva mensal (fração).
+    """
+    return (1.0 + np.asarray(taxa_anual_perc, dtype=np.float64) / 100.0) ** (1.0 / 12.0) - 1.0
+
+
+def calcular_entrada_financiamento(valor_lance, perc_entrada):
+    """
+    Divide o lance em entrada e valor financiado, como no PASSO 6.
+    """
+    valor_lance = np.asarray(valor_lance, dtype=np.float64)
+    valor_entrada = valor_lance * (np.asarray(perc_entrada, dtype=np.float64) / 100.0)
+    valor_financiado = np.maximum(valor_lance - valor_entrada, 0.0)
+    return valor_entrada, valor_financiado
+
+
+def tabela_amortizacao(valor_financiado, taxa_anual, prazo_meses, sistema="SAC",
+                       tr_mensal=0.0, taxa_seguro_mensal=0.0, tarifa_mensal=0.0) -> TabelaAmortizacao:
+    """
+    Gera a tabela completa de um ou vários cenários de financiamento.
+
+    ``taxa_anual`` é a taxa efetiva anual em % (ex.: 11.5); ``tr_mensal`` e
+    ``taxa_seguro_mensal`` são percentuais ao mês (ex.: 0.1); ``sistema`` é
+    "SAC" ou "PRICE" (ou um array deles). Levanta ValueError para prazo fora
+    de 1 a 420 meses ou sistema desconhecido.
+    """
+    principal, i, prazo, sistema, tr, seguro_taxa, tarifa = np.broadcast_arrays(
+        np.asarray(valor_financiado, dtype=np.float64),
+        taxa_mensal(taxa_anual),
+        np.asarray(prazo_meses, dtype=np.int64),
+        np.asarray(sistema, dtype=object),
+        np.asarray(tr_mensal, dtype=np.float64) / 100.0,
+        np.asarray(taxa_seguro_mensal, dtype=np.float64) / 100.0,
+        np.asarray(tarifa_mensal, dtype=np.float64),
+    )
+    if np.any((prazo < 1) | (prazo > PRAZO_MAXIMO_MESES)):
+        raise ValueError(f"O prazo deve estar entre 1 e {PRAZO_MAXIMO_MESES} meses.")
+    sistema = np.char.upper(sistema.astype(str))
+    if not np.isin(sistema, SISTEMAS).all():
+        raise ValueError(f"Sistema de amortização deve ser um de {SISTEMAS}.")
+
+    # Cenários em linhas, meses em colunas
+    principal, i, n, tr, seguro_taxa, tarifa = (
+        np.atleast_1d(a).reshape(-1, 1) for a in (principal, i, prazo, tr, seguro_taxa, tarifa)
+    )
+    eh_price = np.atleast_1d(sistema).reshape(-1, 1) == "PRICE"
+    k = np.arange(1, int(n.max()) + 1).reshape(1, -1)
+    ativo = k <= n
+    correcao = (1.0 + tr) ** k
+
+    # Fração do saldo original ainda devida após k e k-1 meses, sem TR
+    fracao_sac = np.clip((n - k) / n, 0.0, None)
+    fracao_sac_anterior = np.clip((n - k + 1) / n, 0.0, None)
+    if eh_price.any():
+        a = 1.0 + i
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fracao_price = np.where(i > 0, (a ** n - a ** k) / (a ** n - 1.0), fracao_sac)
+            fracao_price_anterior = np.where(i > 0, (a ** n - a ** (k - 1)) / (a ** n - 1.0),
+                                             fracao_sac_anterior)
+        fracao = np.where(eh_price, np.clip(fracao_price, 0.0, None), fracao_sac)
+        fracao_anterior = np.where(eh_price, np.clip(fracao_price_anterior, 0.0, None),
+                                   fracao_sac_anterior)
+    else:
+        fracao, fracao_anterior = fracao_sac, fracao_sac_anterior
+
+    # Com a prestação recalculada mês a mês, a TR apenas escala o saldo
+    saldo_corrigido = principal * fracao_anterior * correcao
+    saldo_devedor = np.where(ativo, principal * fracao * correcao, 0.0)
+    amortizacao = np.where(ativo, saldo_corrigido - saldo_devedor, 0.0)
+    juros = np.where(ativo, saldo_corrigido * i, 0.0)
+    seguro = np.where(ativo, saldo_corrigido * seguro_taxa, 0.0)
+    tarifa = np.where(ativo, np.broadcast_to(tarifa, ativo.shape), 0.0)
+    prestacao = amortizacao + juros + seguro + tarifa
+
+    linhas = np.arange(prestacao.shape[0])
+    return TabelaAmortizacao(
+        saldo_devedor=saldo_devedor,
+        amortizacao=amortizacao,
+        juros=juros,
+        seguro=seguro,
+        tarifa=tarifa,
+        prestacao=prestacao,
+        primeira_prestacao=prestacao[:, 0],
+        ultima_prestacao=prestacao[linhas, n.ravel() - 1],
+        total_pago=prestacao.sum(axis=1),
+        total_juros=juros.sum(axis=1),
+    )
+
+
+def valor_presente(fluxos_mensais, taxa_desconto_anual):
+    """
+    Valor presente de fluxos mensais ([..., mês], o primeiro no mês 1)
+    descontados a uma taxa efetiva anual (%), ex.: o custo de oportunidade.
+    """
+    fluxos_mensais = np.asarray(fluxos_mensais, dtype=np.float64)
+    d = np.asarray(taxa_mensal(taxa_desconto_anual))[..., None]
+    meses = np.arange(1, fluxos_mensais.shape[-1] + 1)
+    return (fluxos_mensais / (1.0 + d) ** meses).sum(axis=-1)
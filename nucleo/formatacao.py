@@ -0,0 +1,100 @@
+"""
+Formatação de valores monetários no estilo brasileiro (1.234.567,89).
+"""
+import math
+import re
+
+import numpy as np
+
+# Troca vírgula por ponto e ponto por vírgula em uma única passada
+_TROCA_SEPARADORES = str.maketrans(",.", ".,")
+
+# Remove símbolo da moeda, espaços e pontos de milhar; vírgula decimal vira ponto
+_LIMPA_BRL = str.maketrans({"R": None, "$": None, " ": None, "\xa0": None, ".": None, ",": "."})
+_LIMPA_SIMPLES = str.maketrans({"R": None, "$": None, " ": None, "\xa0": None})
+
+# Sem vírgula, pontos separando grupos de três dígitos são de milhar: "180.000", "1.234.567"
+_SO_MILHAR = re.compile(r"-?\d{1,3}(\.\d{3})+")
+
+
+def format_brl(value: float) -> str:
+    """
+    Formata valor float no estilo brasileiro: 1.234.567,89
+    """
+    if value is None:
+        return ""
+    return f"{value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def format_brl_array(values) -> list:
+    """
+    Formata uma coluna inteira (lista ou array NumPy) no estilo brasileiro.
+
+    Produz exatamente o mesmo texto que ``format_brl`` aplicado a cada valor,
+    mas formata a coluna inteira com uma única chamada a ``str.format`` e
+    troca os separadores com um só ``str.translate``, em vez de três
+    ``replace`` por valor.
+    """
+    if isinstance(values, np.ndarray):
+        values = values.ravel().tolist()
+    else:
+        values = list(values)
+    if not values:
+        return []
+
+    if None in values:
+        texto = "\n".join("" if v is None else format(v, ",.2f") for v in values)
+    else:
+        texto = ("{:,.2f}\n" * len(values)).format(*values)[:-1]
+    return texto.translate(_TROCA_SEPARADORES).split("\n")
+
+
+def parse_brl(texto) -> float:
+    """
+    Inverso de ``format_brl``: "1.234.567,89" (ou "R$ 1.234.567,89") -> 1234567.89
+
+    Sem vírgula, pontos de milhar ("R$ 180.000", "1.234.567") são
+    reconhecidos e os demais textos são lidos no formato simples
+    ("1234.56"). Texto vazio vira NaN e texto inválido levanta ValueError,
+    para não ser trocado em silêncio por um valor padrão; números já
+    numéricos passam direto.
+    """
+    if texto is None:
+        return math.nan
+    if isinstance(texto, (int, float)):
+        return float(texto)
+    original = str(texto)
+    if "," in original:
+        texto = original.translate(_LIMPA_BRL)
+    else:
+        texto = original.translate(_LIMPA_SIMPLES)
+        if _SO_MILHAR.fullmatch(texto):
+            texto = texto.replace(".", "")
+    if not texto:
+        return math.nan
+    try:
+        return float(texto)
+    except ValueError:
+        raise ValueError(f"Valor numérico inválido: '{original.strip()}'") from None
+
+
+def parse_brl_array(values) -> np.ndarray:
+    """
+    Versão em lote de ``parse_brl`` para uma coluna inteira de textos.
+
+    Quando todos os valores estão no formato brasileiro, a coluna é limpa com
+    um único ``str.translate`` e convertida de uma vez pelo NumPy; havendo
+    valores vazios ou em outro formato, cada um passa por ``parse_brl`` (e um
+    valor inválido levanta ValueError).
+    """
+    values = list(values)
+    if not values:
+        return np.empty(0, dtype=np.float64)
+    if all(isinstance(v, str) for v in values):
+        texto = "\n".join(values)
+        if texto.count(",") == len(values):
+            try:
+                return np.array(texto.translate(_LIMPA_BRL).split("\n"), dtype=np.float64)
+            except ValueError:
+                pass
+    return np.fromiter((parse_brl(v) for v in values), dtype=np.float64, count=len(values))
@@ -0,0 +1,91 @@
+"""
+Grafo de dependências para valores derivados, com marcação de "sujos".
+
+Cada nó é uma entrada (valor informado) ou um derivado (função das entradas
+e de outros derivados). As dependências de um derivado são os nomes dos
+parâmetros da sua função. Ao mudar uma entrada, só os nós que dependem dela,
+direta ou indiretamente, ficam sujos; um nó sujo é recalculado apenas quando
+for lido, e os limpos devolvem o valor guardado. As entradas podem ser
+escalares ou arrays NumPy (vários lotes de uma vez).
+"""
+import inspect
+from collections import Counter
+
+import numpy as np
+
+
+def _iguais(a, b) -> bool:
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.shape(a) == np.shape(b) and bool(np.array_equal(a, b))
+    return type(a) is type(b) and a == b
+
+
+class Grafo:
+    """
+    Grafo de cálculo: ``entrada``/``derivado`` para montar, ``definir`` para
+    mudar entradas e ``grafo[nome]`` para ler (recalculando se preciso).
+
+    ``recalculos`` conta quantas vezes cada derivado foi calculado.
+    """
+
+    def __init__(self):
+        self._funcoes = {}
+        self._dependencias = {}
+        self._dependentes = {}
+        self._valores = {}
+        self._sujos = set()
+        self.recalculos = Counter()
+
+    def entrada(self, nome: str, valor=None):
+        self._dependentes.setdefault(nome, [])
+        self._valores[nome] = valor
+
+    def derivado(self, nome: str, funcao):
+        """
+        Acrescenta um nó derivado; as dependências são os parâmetros de
+        ``funcao`` e precisam ter sido declaradas antes.
+        """
+        dependencias = list(inspect.signature(funcao).parameters)
+        for dependencia in dependencias:
+            if dependencia not in self._dependentes:
+                raise ValueError(f"'{nome}' depende de '{dependencia}', que não existe no grafo.")
+            self._dependentes[dependencia].append(nome)
+        self._dependentes[nome] = []
+        self._funcoes[nome] = funcao
+        self._dependencias[nome] = dependencias
+        self._sujos.add(nome)
+
+    def definir(self, **valores) -> set:
+        """
+        Muda entradas; valores iguais aos atuais não sujam nada. Devolve os
+        derivados que ficaram sujos com esta mudança.
+        """
+        sujos = set()
+        for nome, valor in valores.items():
+            if nome in self._funcoes or nome not in self._dependentes:
+                raise ValueError(f"'{nome}' não é uma entrada do grafo.")
+            if _iguais(self._valores[nome], valor):
+                continue
+            self._valores[nome] = valor
+            pendentes = list(self._dependentes[nome])
+            while pendentes:
+                dependente = pendentes.pop()
+                if dependente not in sujos:
+                    sujos.add(dependente)
+                    pendentes.extend(self._dependentes[dependente])
+        self._sujos |= sujos
+        return sujos
+
+    def __getitem__(self, nome: str):
+        if nome in self._sujos:
+            argumentos = {d: self[d] for d in self._dependencias[nome]}
+            self._valores[nome] = self._funcoes[nome](**argumentos)
+            self._sujos.discard(nome)
+            self.recalculos[nome] += 1
+        return self._valores[nome]
+
+    def valores(self, *nomes) -> dict:
+        return {nome: self[nome] for nome in nomes}
+
+    def sujos(self) -> set:
+        return set(self._sujos)
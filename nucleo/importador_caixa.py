@@ -0,0 +1,154 @@
+"""
+Importador da "Lista de Imóveis" exportada em venda-imoveis.caixa.gov.br.
+
+O arquivo (um por UF, ou o nacional) é lido em fluxo, bloco a bloco, e
+entregue em lotes de tamanho fixo já normalizados para o motor de custos.
+Nenhum momento do processamento mantém o arquivo inteiro em memória, então
+listas de centenas de MB são processadas com memória constante.
+
+Uso em linha de comando (resumo do arquivo):
+    python -m nucleo.importador_caixa Lista_imoveis_GO.csv
+"""
+import csv
+import io
+import sys
+from typing import Iterator
+
+import pandas as pd
+
+from nucleo.formatacao import format_brl, parse_brl_array
+from nucleo.portfolio import calcular_portfolio, normalizar_portfolio
+from nucleo.texto import chave_coluna
+
+# Tamanho padrão de cada lote entregue pelo importador (linhas)
+TAMANHO_LOTE = 10_000
+
+# Cabeçalhos da lista da Caixa (normalizados por chave_coluna) -> nomes internos
+CAMPOS_CAIXA = {
+    "n_do_imovel": "numero_imovel",
+    "no_do_imovel": "numero_imovel",
+    "numero_do_imovel": "numero_imovel",
+    "uf": "uf",
+    "cidade": "cidade",
+    "bairro": "bairro",
+    "endereco": "endereco",
+    "preco": "valor_lance",
+    "valor_de_avaliacao": "valor_mercado",
+    "desconto": "desconto",
+    "financiamento": "financiamento",
+    "descricao": "descricao",
+    "modalidade_de_venda": "modalidade",
+    "link_de_acesso": "link",
+}
+
+CAMPOS_NUMERICOS = ("valor_lance", "valor_mercado", "desconto")
+
+
+def _abrir_texto(origem, encoding: str):
+    """
+    Aceita caminho, arquivo binário (ex.: upload do Streamlit) ou arquivo texto.
+    """
+    if isinstance(origem, (str, bytes)) or hasattr(origem, "__fspath__"):
+        return open(origem, encoding=encoding, newline="")
+    if isinstance(origem, io.TextIOBase):
+        return origem
+    return io.TextIOWrapper(origem, encoding=encoding, newline="")
+
+
+def _tipo_imovel(descricao: str) -> str:
+    """
+    A descrição da Caixa começa pelo tipo: "Casa, 0.00 de área total, ...".
+    """
+    return descricao.split(",", 1)[0].strip().title()
+
+
+def _montar_lote(lote: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converte um lote cru da lista da Caixa para os nomes do checklist.
+    """
+    for campo in CAMPOS_NUMERICOS:
+        if campo in lote:
+            lote[campo] = parse_brl_array(lote[campo].str.strip())
+
+    vazio = pd.Series("", index=lote.index)
+    cidade = lote.get("cidade", vazio).str.strip().str.title()
+    bairro = lote.get("bairro", vazio).str.strip().str.title()
+    lote["local_imovel"] = (cidade + " - " + bairro).str.strip(" -")
+    if "descricao" in lote:
+        lote["tipo_imovel"] = lote["descricao"].map(_tipo_imovel)
+    # Imóveis da Caixa são retomados por alienação fiduciária (Lei 9.514/97)
+    lote["tipo_leilao"] = "Extrajudicial"
+    return lote
+
+
+def ler_lista_caixa(origem, tamanho_lote: int = TAMANHO_LOTE,
+                    encoding: str = "latin-1") -> Iterator[pd.DataFrame]:
+    """
+    Lê a lista de imóveis da Caixa e entrega DataFrames de até ``tamanho_lote``
+    linhas cada.
+
+    As linhas de título antes do cabeçalho são ignoradas; o cabeçalho é
+    reconhecido pela coluna "Preço". Levanta ValueError se ele não existir.
+    O restante do arquivo é lido pelo leitor em blocos do pandas
+    (``chunksize``), que nunca carrega o arquivo inteiro.
+    """
+    arquivo = _abrir_texto(origem, encoding)
+    try:
+        campos = None
+        for linha in iter(arquivo.readline, ""):
+            chaves = [chave_coluna(c) for c in next(csv.reader([linha], delimiter=";"), [])]
+            if "preco" in chaves:
+                campos = {i: CAMPOS_CAIXA[c] for i, c in enumerate(chaves) if c in CAMPOS_CAIXA}
+                break
+        if campos is None:
+            raise ValueError("Cabeçalho da lista da Caixa não encontrado (coluna 'Preço').")
+
+        leitor = pd.read_csv(
+            arquivo, sep=";", header=None, usecols=list(campos), dtype=str,
+            keep_default_na=False, chunksize=tamanho_lote, on_bad_lines="skip",
+        )
+        for lote in leitor:
+            lote = lote.rename(columns=campos)
+            lote = lote[lote["valor_lance"].str.strip() != ""].reset_index(drop=True)
+            if len(lote):
+                yield _montar_lote(lote)
+    finally:
+        if isinstance(origem, io.IOBase) and arquivo is not origem:
+            # Não fecha o arquivo binário de quem chamou (ex.: upload do Streamlit)
+            arquivo.detach()
+        elif arquivo is not origem:
+            arquivo.close()
+
+
+def custear_lista_caixa(origem, padroes: dict = None, tamanho_lote: int = TAMANHO_LOTE,
+                        encoding: str = "latin-1") -> Iterator[pd.DataFrame]:
+    """
+    Lê a lista da Caixa em fluxo e entrega cada lote já com as colunas de custo.
+
+    ``padroes`` tem o mesmo significado de ``normalizar_portfolio`` (ITBI,
+    registro, reforma etc. aplicados a todos os imóveis do arquivo).
+    """
+    for lote in ler_lista_caixa(origem, tamanho_lote, encoding):
+        yield calcular_portfolio(normalizar_portfolio(lote, padroes))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        raise SystemExit("Uso: python -m nucleo.importador_caixa <Lista_imoveis_UF.csv>")
+
+    quantidade = 0
+    soma_lances = 0.0
+    soma_custos = 0.0
+    for lote in custear_lista_caixa(argv[0]):
+        quantidade += len(lote)
+        soma_lances += lote["valor_lance"].sum()
+        soma_custos += lote["custo_total_avancado"].sum()
+
+    print(f"Imóveis lidos: {quantidade}")
+    print(f"Soma dos preços: R$ {format_brl(soma_lances)}")
+    print(f"Custo total estimado: R$ {format_brl(soma_custos)}")
+
+
+if __name__ == "__main__":
+    main()
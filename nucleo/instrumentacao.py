@@ -0,0 +1,169 @@
+"""
+Instrumentação das reexecuções do checklist: tempo e quantidade de elementos
+emitidos por bloco (PASSO 1 a 14, relatório), gravados em um log JSONL com
+uma linha por reexecução.
+
+Desligada por padrão. Para ativar, defina LEILAO_INSTRUMENTACAO=1; o log vai
+para LEILAO_INSTRUMENTACAO_LOG (padrão: instrumentacao.jsonl) e cada linha
+leva a versão em LEILAO_VERSAO, para comparar os blocos entre versões.
+
+Sem mais nada, só o tempo é medido. A contagem de elementos envolve o envio
+de mensagens da sessão, um detalhe interno do Streamlit, e por isso fica
+atrás de uma segunda opção, só para depuração:
+LEILAO_INSTRUMENTACAO_ELEMENTOS=1.
+
+Uso em linha de comando (p50/p95 por bloco e versão):
+    python -m nucleo.instrumentacao instrumentacao.jsonl
+"""
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+
+
+
+def _opcao(nome: str) -> bool:
+    return os.environ.get(nome, "").strip().lower() not in ("", "0", "false", "nao", "não")
+
+
+ATIVADA = _opcao("LEILAO_INSTRUMENTACAO")
+CONTAR_ELEMENTOS = ATIVADA and _opcao("LEILAO_INSTRUMENTACAO_ELEMENTOS")
+CAMINHO_LOG = os.environ.get("LEILAO_INSTRUMENTACAO_LOG", "instrumentacao.jsonl")
+VERSAO = os.environ.get("LEILAO_VERSAO", "dev")
+
+# Sessões do Streamlit rodam em threads do mesmo processo e gravam no mesmo log
+_TRAVA_LOG = threading.Lock()
+
+
+class Medidor:
+    """
+    Cronômetro por marcos: ``marco(nome)`` encerra o bloco anterior e abre o
+    seguinte; ``finalizar()`` encerra o último e grava a reexecução no log.
+
+    ``contador`` devolve o total de elementos emitidos até o momento (cada
+    bloco recebe a diferença entre dois marcos); sem ele, só o tempo é medido.
+    """
+
+    def __init__(self, script: str, escopo: str = "completa", contador=None,
+                 caminho_log: str = CAMINHO_LOG):
+        self.script = script
+        self.escopo = escopo
+        self.caminho_log = caminho_log
+        self.finalizado = False
+        self.blocos = {}
+        self._contador = contador or (lambda: 0)
+        self._inicio = self._inicio_bloco = time.perf_counter()
+        self._elementos_inicio = self._elementos_bloco = self._contador()
+        self._bloco = None
+
+    def _fechar_bloco(self, agora: float):
+        if self._bloco is None:
+            return
+        elementos = self._contador()
+        anterior = self.blocos.get(self._bloco, {"ms": 0.0, "elementos": 0})
+        self.blocos[self._bloco] = {
+            "ms": anterior["ms"] + (agora - self._inicio_bloco) * 1000,
+            "elementos": anterior["elementos"] + elementos - self._elementos_bloco,
+        }
+        self._elementos_bloco = elementos
+
+    def marco(self, nome: str):
+        agora = time.perf_counter()
+        self._fechar_bloco(agora)
+        self._bloco, self._inicio_bloco = nome, agora
+
+    def finalizar(self) -> dict:
+        """
+        Encerra a medição e devolve o registro gravado no log.
+        """
+        agora = time.perf_counter()
+        self._fechar_bloco(agora)
+        self.finalizado = True
+        registro = {
+            "data": datetime.datetime.now().isoformat(timespec="seconds"),
+            "versao": VERSAO,
+            "script": self.script,
+            "escopo": self.escopo,
+            "total_ms": round((agora - self._inicio) * 1000, 3),
+            "elementos": self._contador() - self._elementos_inicio,
+            "blocos": {nome: {"ms": round(b["ms"], 3), "elementos": b["elementos"]}
+                       for nome, b in self.blocos.items()},
+        }
+        if self.caminho_log:
+            linha = json.dumps(registro, ensure_ascii=False) + "\n"
+            with _TRAVA_LOG, open(self.caminho_log, "a", encoding="utf-8") as arquivo:
+                arquivo.write(linha)
+        return registro
+
+
+class MedidorNulo:
+    """
+    Usado quando a instrumentação está desligada: os marcos não custam nada.
+    """
+    finalizado = False
+
+    def marco(self, nome: str):
+        pass
+
+    def finalizar(self):
+        self.finalizado = True
+        return None
+
+
+def tabela_blocos(registros) -> pd.DataFrame:
+    """
+    Uma linha por (reexecução, bloco) a partir de registros do log.
+    """
+    linhas = [
+        {"versao": r.get("versao", ""), "script": r["script"], "escopo": r["escopo"],
+         "bloco": nome, "ms": b["ms"], "elementos": b["elementos"]}
+        for r in registros for nome, b in r["blocos"].items()
+    ]
+    return pd.DataFrame(linhas, columns=["versao", "script", "escopo", "bloco", "ms", "elementos"])
+
+
+def resumo_blocos(registros) -> pd.DataFrame:
+    """
+    p50/p95 do tempo e média de elementos de cada bloco, por versão e
+    script, do bloco mais lento para o mais rápido.
+    """
+    tabela = tabela_blocos(registros)
+    resumo = tabela.groupby(["versao", "script", "bloco"], sort=False).agg(
+        reexecucoes=("ms", "size"),
+        p50_ms=("ms", "median"),
+        p95_ms=("ms", lambda ms: ms.quantile(0.95)),
+        elementos=("elementos", "mean"),
+    )
+    return resumo.sort_values("p50_ms", ascending=False).reset_index()
+
+
+def ler_log(caminho: str = CAMINHO_LOG) -> list:
+    """
+    Registros do log JSONL (linhas inválidas ou incompletas são ignoradas).
+    """
+    registros = []
+    with open(caminho, encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            try:
+                registros.append(json.loads(linha))
+            except json.JSONDecodeError:
+                continue
+    return registros
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    caminho = argv[0] if argv else CAMINHO_LOG
+    registros = ler_log(caminho)
+    if not registros:
+        raise SystemExit(f"Nenhuma reexecução registrada em {caminho}")
+    with pd.option_context("display.width", 160, "display.max_rows", 200):
+        print(resumo_blocos(registros).round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
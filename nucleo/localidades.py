@@ -0,0 +1,163 @@
+"""
+Sugestão de cidade/bairro de Goiás para o campo "Cidade/Bairro do imóvel".
+
+Os nomes vêm de ``nucleo/dados/localidades_go.csv`` ("Município - Bairro"),
+uma lista parcial: cerca de 80 dos 246 municípios de Goiás e bairros só de
+Goiânia, Aparecida de Goiânia, Anápolis e algumas outras cidades. O que não
+está na lista não recebe sugestão, mas pode ser digitado normalmente. Os
+nomes são indexados duas vezes, sem acentos e em minúsculas:
+
+- uma árvore de prefixos (trie) das palavras de cada nome: "set bue" acha
+  "Goiânia - Setor Bueno" porque cada palavra digitada é prefixo de uma
+  palavra do nome, em qualquer ordem;
+- um índice de trigramas, usado quando os prefixos não bastam, que tolera
+  erros de digitação ("goiana bueno").
+
+O índice é montado uma vez e depois só lido, então uma instância pode ser
+compartilhada entre sessões.
+"""
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from nucleo.texto import remover_acentos
+
+CAMINHO_PADRAO = Path(__file__).resolve().parent / "dados" / "localidades_go.csv"
+
+# Fração mínima dos trigramas do texto digitado que o nome precisa ter
+SEMELHANCA_MINIMA = 0.4
+
+_NAO_ALFANUMERICO = re.compile(r"[^a-z0-9]+")
+_FIM = ""  # chave, em cada nó da trie, da lista de nomes que passam pelo nó
+_VAZIO = np.array([], dtype=np.int32)
+
+
+def normalizar(texto: str) -> str:
+    """
+    "Goiânia - Setor Bueno" -> "goiania setor bueno".
+    """
+    return _NAO_ALFANUMERICO.sub(" ", remover_acentos(texto).lower()).strip()
+
+
+def _trigramas(chave: str) -> set:
+    chave = f"  {chave} "
+    return {chave[i:i + 3] for i in range(len(chave) - 2)}
+
+
+def _congelar(no: dict):
+    """
+    Troca as listas de nomes da trie por arrays ordenados e sem repetição
+    (para ``np.isin`` com ``assume_unique``).
+    """
+    for letra, filho in no.items():
+        if letra == _FIM:
+            no[_FIM] = np.array(filho, dtype=np.int32)
+        else:
+            _congelar(filho)
+
+
+class Localidades:
+    """
+    Índice de nomes para autocompletar (``sugerir``) e reconhecer um nome
+    já completo (``canonico``). Os nomes mais curtos vêm primeiro nas
+    sugestões, então o município aparece antes dos seus bairros.
+    """
+
+    def __init__(self, nomes: list):
+        self.nomes = sorted(set(nomes), key=lambda nome: (len(nome), nome))
+        self._por_chave = {normalizar(nome): i for i, nome in enumerate(self.nomes)}
+        self._trie = {}
+        trigramas_nomes = {}
+        tamanhos = []
+        for i, nome in enumerate(self.nomes):
+            chave = normalizar(nome)
+            for palavra in set(chave.split()):
+                no = self._trie
+                for letra in palavra:
+                    no = no.setdefault(letra, {})
+                    nomes_no = no.setdefault(_FIM, [])
+                    # Duas palavras do nome com o mesmo prefixo ("setor sul") passam pelo mesmo nó
+                    if not nomes_no or nomes_no[-1] != i:
+                        nomes_no.append(i)
+            trigramas = _trigramas(chave)
+            for trigrama in trigramas:
+                trigramas_nomes.setdefault(trigrama, []).append(i)
+            tamanhos.append(len(trigramas))
+        _congelar(self._trie)
+        # Listas de nomes por trigrama como arrays: a contagem é um só np.bincount
+        self._trigramas = {t: np.array(nomes_t, dtype=np.int32) for t, nomes_t in trigramas_nomes.items()}
+        self._tamanhos = np.array(tamanhos, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def _prefixo(self, palavra: str) -> np.ndarray:
+        no = self._trie
+        for letra in palavra:
+            no = no.get(letra)
+            if no is None:
+                return _VAZIO
+        return no[_FIM]
+
+    def _por_prefixo(self, palavras: list, limite: int) -> list:
+        """
+        Até ``limite`` nomes (índices, na ordem das sugestões) em que cada
+        palavra digitada é prefixo de alguma palavra do nome: a lista da
+        palavra mais rara filtrada pelas listas das demais.
+        """
+        listas = sorted((self._prefixo(palavra) for palavra in palavras), key=len)
+        candidatos = listas[0]
+        for lista in listas[1:]:
+            if not len(candidatos):
+                break
+            candidatos = candidatos[np.isin(candidatos, lista, assume_unique=True)]
+        return candidatos[:limite].tolist()
+
+    def _por_trigramas(self, chave: str, limite: int) -> list:
+        """
+        Até ``limite`` nomes com pelo menos ``SEMELHANCA_MINIMA`` dos
+        trigramas do texto, do mais parecido para o menos parecido.
+        """
+        trigramas = _trigramas(chave)
+        listas = [self._trigramas[t] for t in trigramas if t in self._trigramas]
+        if not listas:
+            return []
+        comuns = np.bincount(np.concatenate(listas), minlength=len(self.nomes))
+        candidatos = np.flatnonzero(comuns >= SEMELHANCA_MINIMA * len(trigramas))
+        # Mais trigramas em comum primeiro; no empate, o nome com menos trigramas sobrando
+        n = comuns[candidatos]
+        ordem = np.lexsort((candidatos, self._tamanhos[candidatos] - n, -n))[:limite]
+        return candidatos[ordem].tolist()
+
+    def sugerir(self, texto: str, limite: int = 8) -> list:
+        """
+        Até ``limite`` nomes para o texto digitado: os que casam por prefixo
+        ou, se nenhum casar (erro de digitação), os mais parecidos por
+        trigramas.
+        """
+        chave = normalizar(texto)
+        if not chave:
+            return []
+        palavras = list(dict.fromkeys(chave.split()))
+        indices = self._por_prefixo(palavras, limite) or self._por_trigramas(chave, limite)
+        return [self.nomes[i] for i in indices]
+
+    def canonico(self, texto: str):
+        """
+        O nome da lista igual a ``texto`` (ignorando acentos, maiúsculas e
+        pontuação), ou None.
+        """
+        i = self._por_chave.get(normalizar(texto))
+        return None if i is None else self.nomes[i]
+
+
+def carregar_localidades(caminho=CAMINHO_PADRAO) -> Localidades:
+    """
+    Lê o CSV de municípios e bairros (";", bairro vazio para o município).
+    """
+    tabela = pd.read_csv(caminho, sep=";", comment="#", dtype=str, encoding="utf-8").fillna("")
+    nomes = [f"{municipio.strip()} - {bairro.strip()}" if bairro.strip() else municipio.strip()
+             for municipio, bairro in zip(tabela["municipio"], tabela["bairro"])]
+    return Localidades(nomes)
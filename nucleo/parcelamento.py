@@ -0,0 +1,149 @@
+"""
+Parcelamento judicial (CPC art. 895): entrada de pelo menos 25% e o saldo
+em até 30 parcelas mensais, corrigidas por um índice (IPCA, INPC etc.).
+
+O cronograma é calculado para vários lotes de uma vez ([lote, mês]) e o seu
+valor presente pode substituir o lance no custo de aquisição, para comparar
+lotes à vista, parcelados e financiados nos mesmos termos.
+"""
+import csv
+import io
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from nucleo.financiamento import valor_presente
+from nucleo.formatacao import parse_brl
+from nucleo.texto import chave_coluna
+
+FORMA_PAGAMENTO_CPC895 = "Parcelamento Judicial (CPC 895)"
+PERC_ENTRADA_MINIMA = 25.0
+PARCELAS_MAXIMAS = 30
+
+
+class CronogramaCPC895(NamedTuple):
+    """
+    Resultado de ``cronograma_cpc895``: ``parcelas`` tem formato [lote, mês]
+    (zero após a última parcela de cada lote); demais campos, um valor por lote.
+    """
+    valor_entrada: np.ndarray
+    parcelas: np.ndarray
+    total_pago: np.ndarray
+    valor_presente: np.ndarray
+
+
+def carregar_indice(origem) -> np.ndarray:
+    """
+    Lê uma tabela local de variação mensal de um índice (CSV com colunas de
+    mês e de variação em %, ex.: "mes;ipca" / "2025-01;0,16") e devolve as
+    variações em ordem cronológica, como frações (0,16% -> 0.0016).
+
+    Aceita caminho, arquivo texto ou binário. Levanta ValueError se não houver
+    coluna numérica de variação.
+    """
+    if isinstance(origem, (str, bytes)) or hasattr(origem, "__fspath__"):
+        with open(origem, encoding="utf-8-sig", newline="") as arquivo:
+            texto = arquivo.read()
+    else:
+        texto = origem.read()
+        if isinstance(texto, bytes):
+            texto = texto.decode("utf-8-sig")
+
+    dialeto = csv.Sniffer().sniff(texto.splitlines()[0], delimiters=";,\t")
+    tabela = pd.read_csv(io.StringIO(texto), sep=dialeto.delimiter, dtype=str)
+    tabela.columns = [chave_coluna(c) for c in tabela.columns]
+    coluna_mes = next((c for c in tabela.columns if c in ("mes", "data", "competencia", "periodo")), None)
+    colunas_valor = [c for c in tabela.columns if c != coluna_mes]
+    if not colunas_valor:
+        raise ValueError("A tabela do índice precisa de uma coluna com a variação mensal (%).")
+
+    if coluna_mes:
+        tabela = tabela.sort_values(coluna_mes, key=lambda s: pd.to_datetime(s, errors="coerce", dayfirst=True))
+    variacoes = tabela[colunas_valor[0]].map(parse_brl).to_numpy(dtype=np.float64)
+    return variacoes[~np.isnan(variacoes)] / 100.0
+
+
+def correcao_projetada(indice, n_meses: int) -> np.ndarray:
+    """
+    Variação de cada um dos ``n_meses`` a partir de um índice: um escalar
+    (% ao mês constante) ou a série de ``carregar_indice``. Se a série for
+    mais curta que o prazo, os meses restantes usam a média da série.
+    """
+    if np.ndim(indice) == 0:
+        return np.full(n_meses, float(indice) / 100.0)
+    indice = np.asarray(indice, dtype=np.float64)
+    if len(indice) >= n_meses:
+        return indice[:n_meses]
+    media = indice.mean() if len(indice) else 0.0
+    return np.concatenate([indice, np.full(n_meses - len(indice), media)])
+
+
+def cronograma_cpc895(valor_lance, perc_entrada=PERC_ENTRADA_MINIMA, n_parcelas=PARCELAS_MAXIMAS,
+                      indice=0.0, taxa_desconto_anual=0.0) -> CronogramaCPC895:
+    """
+    Entrada e parcelas mensais corrigidas de um ou vários lotes.
+
+    A parcela base é o saldo (lance - entrada) dividido pelo número de
+    parcelas; a parcela do mês k é corrigida pela variação acumulada do índice
+    até k (``indice`` como em ``correcao_projetada``). O valor presente soma a
+    entrada (paga no ato) às parcelas descontadas por ``taxa_desconto_anual``.
+    Levanta ValueError se a entrada for menor que 25% ou houver mais de 30
+    parcelas.
+    """
+    valor_lance, perc_entrada, n_parcelas = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(valor_lance, dtype=np.float64)),
+        np.asarray(perc_entrada, dtype=np.float64),
+        np.asarray(n_parcelas, dtype=np.int64),
+    )
+    if np.any(perc_entrada < PERC_ENTRADA_MINIMA):
+        raise ValueError(f"No CPC 895 a entrada mínima é de {PERC_ENTRADA_MINIMA:.0f}% do lance.")
+    if np.any((n_parcelas < 1) | (n_parcelas > PARCELAS_MAXIMAS)):
+        raise ValueError(f"O parcelamento do CPC 895 vai de 1 a {PARCELAS_MAXIMAS} parcelas.")
+
+    valor_entrada = valor_lance * perc_entrada / 100.0
+    parcela_base = (valor_lance - valor_entrada) / n_parcelas
+
+    n_meses = int(n_parcelas.max())
+    fator = np.cumprod(1.0 + correcao_projetada(indice, n_meses))
+    meses = np.arange(1, n_meses + 1)
+    parcelas = np.where(meses[None, :] <= n_parcelas[:, None],
+                        parcela_base[:, None] * fator[None, :], 0.0)
+
+    return CronogramaCPC895(
+        valor_entrada=valor_entrada,
+        parcelas=parcelas,
+        total_pago=valor_entrada + parcelas.sum(axis=1),
+        valor_presente=valor_entrada + valor_presente(parcelas, taxa_desconto_anual),
+    )
+
+
+def eh_cpc895(forma_pagamento: pd.Series) -> pd.Series:
+    """
+    Marca as linhas cuja forma de pagamento é o parcelamento judicial
+    (aceita o texto do checklist ou variações como "CPC 895", "parcelado").
+    """
+    chaves = forma_pagamento.fillna("").astype(str).map(chave_coluna)
+    return chaves.str.contains("cpc_895|cpc895|parcel", regex=True)
+
+
+def aplicar_cpc895(df: pd.DataFrame, perc_entrada=PERC_ENTRADA_MINIMA, n_parcelas=PARCELAS_MAXIMAS,
+                   indice=0.0, taxa_desconto_anual=0.0) -> pd.DataFrame:
+    """
+    Preenche ``valor_pago`` (valor presente do cronograma) nas linhas do
+    portfólio com ``forma_pagamento`` de parcelamento judicial, todas em uma
+    única chamada de ``cronograma_cpc895``. As demais linhas pagam o lance.
+    """
+    resultado = df.copy()
+    resultado["valor_pago"] = resultado["valor_lance"].astype("float64")
+    if "forma_pagamento" not in resultado:
+        return resultado
+
+    parcelados = eh_cpc895(resultado["forma_pagamento"]).to_numpy()
+    if parcelados.any():
+        cronograma = cronograma_cpc895(
+            resultado.loc[parcelados, "valor_lance"].to_numpy(),
+            perc_entrada, n_parcelas, indice, taxa_desconto_anual,
+        )
+        resultado.loc[parcelados, "valor_pago"] = cronograma.valor_presente
+    return resultado
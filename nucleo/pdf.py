@@ -0,0 +1,347 @@
+"""
+Gerador de PDF em Python puro para o relatório do checklist e para
+relatórios de portfólio com centenas de lotes.
+
+O documento é gravado no destino à medida que as páginas ficam prontas:
+cada página vai para o arquivo assim que termina e só os deslocamentos dos
+objetos (para a tabela xref) ficam em memória. Usa as fontes padrão
+Helvetica e Helvetica-Bold (codificação WinAnsi/cp1252), que todo leitor de
+PDF já tem, então nenhum arquivo de fonte é embutido.
+"""
+import datetime
+import unicodedata
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from nucleo import centavos
+from nucleo.formatacao import format_brl_array
+from nucleo.portfolio import arredondar_custos, totais_centavos
+
+# Página A4 em pontos (1/72 pol.) e margens
+LARGURA_PAGINA, ALTURA_PAGINA = 595.28, 841.89
+MARGEM = 50.0
+
+# Larguras (milésimos do corpo) dos caracteres 32 a 126 nas métricas AFM
+_LARGURAS_REGULAR = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_LARGURAS_NEGRITO = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+# Caracteres fora do ASCII que não são letras acentuadas
+_LARGURAS_EXTRAS = {"º": 365, "ª": 370, "°": 400, "•": 350, "–": 556, "—": 1000, "€": 556, "\xa0": 278}
+_LARGURA_PADRAO = 556
+
+
+def _tabela_larguras(larguras_ascii) -> dict:
+    tabela = {chr(32 + i): largura for i, largura in enumerate(larguras_ascii)}
+    tabela.update(_LARGURAS_EXTRAS)
+    return tabela
+
+
+_LARGURAS = {False: _tabela_larguras(_LARGURAS_REGULAR), True: _tabela_larguras(_LARGURAS_NEGRITO)}
+
+
+def largura_texto(texto: str, tamanho: float, negrito: bool = False) -> float:
+    """
+    Largura do texto em pontos. Letras acentuadas têm a largura da letra base.
+    """
+    tabela = _LARGURAS[negrito]
+    total = 0
+    for caractere in texto:
+        largura = tabela.get(caractere)
+        if largura is None:
+            largura = tabela.get(unicodedata.normalize("NFD", caractere)[0], _LARGURA_PADRAO)
+        total += largura
+    return total * tamanho / 1000.0
+
+
+def _literal(texto: str) -> bytes:
+    """
+    String literal do PDF em cp1252 (caracteres sem equivalente viram "?").
+    """
+    dados = texto.encode("cp1252", errors="replace")
+    return b"(" + dados.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def _trechos_markdown(texto: str) -> list:
+    """
+    Divide o texto em trechos (texto, negrito) pelos marcadores ``**``.
+    """
+    return [(trecho, i % 2 == 1) for i, trecho in enumerate(texto.split("**")) if trecho]
+
+
+class DocumentoPDF:
+    """
+    Escreve um PDF de texto corrido em ``destino`` (arquivo binário aberto),
+    página a página; ``fechar()`` completa o arquivo.
+
+    A numeração dos objetos é fixa no início (catálogo, árvore de páginas,
+    fontes e informações) e as páginas vêm em seguida, duas por página
+    (conteúdo e página); a árvore de páginas é gravada por último, quando
+    todas já são conhecidas.
+    """
+
+    _CATALOGO, _PAGINAS, _FONTE, _FONTE_NEGRITO, _INFORMACOES = 1, 2, 3, 4, 5
+
+    def __init__(self, destino, titulo: str = ""):
+        self.destino = destino
+        self.titulo = titulo
+        self._posicao = 0
+        self._deslocamentos = {}
+        self._paginas = []
+        self._proximo_objeto = 6
+        self._operacoes = None
+        self._y = 0.0
+
+        self._gravar(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for numero, nome in ((self._FONTE, b"Helvetica"), (self._FONTE_NEGRITO, b"Helvetica-Bold")):
+            self._objeto(numero, b"<< /Type /Font /Subtype /Type1 /BaseFont /" + nome
+                         + b" /Encoding /WinAnsiEncoding >>")
+        criacao = datetime.datetime.now().strftime("D:%Y%m%d%H%M%S")
+        self._objeto(self._INFORMACOES, b"<< /Title " + _literal(titulo) + b" /Producer "
+                     + _literal("Checklist de Leilão de Imóveis") + b" /CreationDate " + _literal(criacao) + b" >>")
+
+    # -----------------------------------------------------------------------
+    # Gravação dos objetos
+    # -----------------------------------------------------------------------
+    def _gravar(self, dados: bytes):
+        self.destino.write(dados)
+        self._posicao += len(dados)
+
+    def _objeto(self, numero: int, corpo: bytes):
+        self._deslocamentos[numero] = self._posicao
+        self._gravar(b"%d 0 obj\n" % numero + corpo + b"\nendobj\n")
+
+    def _nova_pagina(self):
+        self._encerrar_pagina()
+        self._operacoes = []
+        self._y = ALTURA_PAGINA - MARGEM
+        if self.titulo:
+            self._texto_em(MARGEM, ALTURA_PAGINA - MARGEM / 2 - 4, [(self.titulo, False)], 8)
+
+    def _encerrar_pagina(self):
+        if self._operacoes is None:
+            return
+        rodape = f"Página {len(self._paginas) + 1}"
+        self._texto_em(LARGURA_PAGINA - MARGEM - largura_texto(rodape, 8), MARGEM / 2, [(rodape, False)], 8)
+
+        conteudo = zlib.compress(b"\n".join(self._operacoes))
+        numero_conteudo, numero_pagina = self._proximo_objeto, self._proximo_objeto + 1
+        self._proximo_objeto += 2
+        self._objeto(numero_conteudo, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(conteudo)
+                     + conteudo + b"\nendstream")
+        self._objeto(numero_pagina, b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.2f %.2f] "
+                     b"/Resources << /Font << /F1 %d 0 R /F2 %d 0 R >> >> /Contents %d 0 R >>"
+                     % (self._PAGINAS, LARGURA_PAGINA, ALTURA_PAGINA, self._FONTE, self._FONTE_NEGRITO,
+                        numero_conteudo))
+        self._paginas.append(numero_pagina)
+        self._operacoes = None
+
+    def _texto_em(self, x: float, y: float, trechos, tamanho: float):
+        operacoes = [b"BT %.2f %.2f Td" % (x, y)]
+        for texto, negrito in trechos:
+            operacoes.append(b"/F%d %.1f Tf %s Tj" % (2 if negrito else 1, tamanho, _literal(texto)))
+        operacoes.append(b"ET")
+        self._operacoes.append(b" ".join(operacoes))
+
+    def _reservar(self, altura: float):
+        """
+        Garante ``altura`` pontos livres na página atual (ou abre outra).
+        """
+        if self._operacoes is None or self._y - altura < MARGEM:
+            self._nova_pagina()
+
+    # -----------------------------------------------------------------------
+    # Conteúdo
+    # -----------------------------------------------------------------------
+    def paragrafo(self, trechos, tamanho: float = 10, recuo: float = 0.0, marcador: str = ""):
+        """
+        Texto com quebra automática de linha. ``trechos`` é uma string (com
+        ``**negrito**`` no estilo Markdown) ou uma lista de (texto, negrito).
+        """
+        if isinstance(trechos, str):
+            trechos = _trechos_markdown(trechos)
+        largura_util = LARGURA_PAGINA - 2 * MARGEM - recuo
+        entrelinha = tamanho * 1.35
+
+        linhas, atual, largura = [], [], 0.0
+        for texto, negrito in trechos:
+            # Entre trechos o espaçamento é o do próprio texto; entre palavras, um espaço
+            for j, palavra in enumerate(texto.replace("\n", " ").split(" ")):
+                peca = (" " if j and atual else "") + palavra
+                medida = largura_texto(peca, tamanho, negrito)
+                if atual and largura + medida > largura_util:
+                    linhas.append(atual)
+                    atual, largura = [], 0.0
+                    peca, medida = palavra, largura_texto(palavra, tamanho, negrito)
+                if atual and atual[-1][1] == negrito:
+                    atual[-1] = (atual[-1][0] + peca, negrito)
+                else:
+                    atual.append((peca, negrito))
+                largura += medida
+        if atual:
+            linhas.append(atual)
+
+        for i, linha in enumerate(linhas):
+            self._reservar(entrelinha)
+            self._y -= entrelinha
+            if marcador and i == 0:
+                self._texto_em(MARGEM + recuo - 10, self._y, [(marcador, False)], tamanho)
+            self._texto_em(MARGEM + recuo, self._y, linha, tamanho)
+
+    def titulo_secao(self, texto: str, tamanho: float = 13):
+        self._reservar(tamanho * 3)
+        self._y -= tamanho * 0.6
+        self.paragrafo([(texto, True)], tamanho)
+        self._y -= tamanho * 0.3
+
+    def espaco(self, pontos: float):
+        self._reservar(pontos)
+        self._y -= pontos
+
+    def linha_horizontal(self):
+        self._reservar(12)
+        self._y -= 6
+        self._operacoes.append(b"0.6 w %.2f %.2f m %.2f %.2f l S"
+                               % (MARGEM, self._y, LARGURA_PAGINA - MARGEM, self._y))
+        self._y -= 6
+
+    def markdown(self, documento: str):
+        """
+        Escreve o subconjunto de Markdown usado nos relatórios: títulos
+        ``###``, listas ``-`` (com um nível de recuo), ``---`` e ``**negrito**``.
+        """
+        for linha in documento.splitlines():
+            conteudo = linha.strip()
+            if not conteudo:
+                self.espaco(4)
+            elif conteudo == "---":
+                self.linha_horizontal()
+            elif conteudo.startswith("#"):
+                self.titulo_secao(conteudo.lstrip("#").strip())
+            elif conteudo.startswith("- "):
+                recuo = 28.0 if linha.startswith("  ") else 14.0
+                self.paragrafo(conteudo[2:], recuo=recuo, marcador="•")
+            else:
+                self.paragrafo(conteudo)
+
+    def fechar(self):
+        """
+        Encerra a última página e grava a árvore de páginas, o catálogo, a
+        tabela xref e o trailer.
+        """
+        if self._operacoes is None and not self._paginas:
+            self._nova_pagina()
+        self._encerrar_pagina()
+        filhos = b" ".join(b"%d 0 R" % numero for numero in self._paginas)
+        self._objeto(self._PAGINAS, b"<< /Type /Pages /Kids [" + filhos + b"] /Count %d >>" % len(self._paginas))
+        self._objeto(self._CATALOGO, b"<< /Type /Catalog /Pages %d 0 R >>" % self._PAGINAS)
+
+        inicio_xref = self._posicao
+        total = self._proximo_objeto
+        entradas = [b"xref\n0 %d\n0000000000 65535 f \n" % total]
+        entradas += [b"%010d 00000 n \n" % self._deslocamentos[numero] for numero in range(1, total)]
+        self._gravar(b"".join(entradas))
+        self._gravar(b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                     % (total, self._CATALOGO, self._INFORMACOES, inicio_xref))
+        return len(self._paginas)
+
+
+def pdf_relatorio(documento: str, destino, titulo: str = "Relatório Final do Checklist") -> int:
+    """
+    Grava em ``destino`` o PDF do relatório do checklist (o Markdown de
+    ``nucleo.relatorio.montar_relatorio``). Devolve o número de páginas.
+    """
+    pdf = DocumentoPDF(destino, titulo)
+    pdf.markdown(documento)
+    return pdf.fechar()
+
+
+# Linhas do detalhamento de cada lote: (coluna, rótulo); ausentes são puladas
+_LINHAS_LOTE = [
+    ("valor_lance", "Lance"),
+    ("valor_pago", "Valor presente do pagamento"),
+    ("comissao_leiloeiro", "Comissão do leiloeiro"),
+    ("itbi", "ITBI"),
+    ("registro_cartorio", "Registro em cartório"),
+    ("debitos_passados", "Dívidas passadas"),
+    ("valor_acordo", "Acordo com ocupante"),
+    ("custo_reforma", "Reforma"),
+    ("honorarios_adv", "Honorários advocatícios"),
+    ("seguro_imovel", "Seguro"),
+    ("custo_total_avancado", "**Custo total**"),
+    ("valor_mercado", "Valor de mercado"),
+    ("margem_mercado", "Margem sobre o mercado"),
+    ("lance_maximo", "Lance máximo no orçamento"),
+    ("folga_lance", "Folga sobre o lance máximo"),
+    ("lucro_revenda", "Lucro na revenda"),
+    ("vpl", "VPL da revenda"),
+]
+_BLOCO_LOTES = 1000
+
+
+def _percentual(valores: np.ndarray) -> list:
+    return [f"{v * 100:.1f}%".replace(".", ",") if np.isfinite(v) else "n/d" for v in valores.tolist()]
+
+
+def _moeda(valores: np.ndarray) -> list:
+    finitos = np.isfinite(valores)
+    textos = format_brl_array(np.where(finitos, valores, 0.0))
+    return [f"R$ {texto}" if finito else "n/d" for texto, finito in zip(textos, finitos.tolist())]
+
+
+def pdf_portfolio(resultado: pd.DataFrame, destino, titulo: str = "Relatório do Portfólio de Lotes") -> int:
+    """
+    Grava em ``destino`` o relatório de um portfólio custeado (saída de
+    ``calcular_portfolio`` e, se houver, de ``calcular_retorno_portfolio``):
+    resumo e uma seção por lote. Os custos de cada lote saem de
+    ``arredondar_custos`` e o resumo de ``totais_centavos``, então os totais
+    batem com a soma dos lotes. Os valores são formatados em blocos de
+    lotes, coluna a coluna (valores não finitos, como o lance máximo de um
+    lote sem orçamento, saem como "n/d"), e as páginas vão para o destino
+    conforme ficam prontas. Devolve o número de páginas.
+    """
+    resultado = arredondar_custos(resultado)
+    colunas = [(coluna, rotulo) for coluna, rotulo in _LINHAS_LOTE if coluna in resultado]
+    pdf = DocumentoPDF(destino, titulo)
+    pdf.titulo_secao(titulo, 16)
+    pdf.paragrafo(f"Gerado em {datetime.date.today().strftime('%d/%m/%Y')}")
+    pdf.espaco(6)
+    totais = totais_centavos(resultado)
+    somas = centavos.formatar([totais["valor_lance"], totais["custo_total_avancado"]])
+    pdf.markdown(
+        f"- **Lotes:** {len(resultado)}\n"
+        f"- **Soma dos lances:** R$ {somas[0]}\n"
+        f"- **Custo total (c/ honorários e seguro):** R$ {somas[1]}\n"
+    )
+    pdf.linha_horizontal()
+
+    for inicio in range(0, len(resultado), _BLOCO_LOTES):
+        bloco = resultado.iloc[inicio:inicio + _BLOCO_LOTES]
+        valores = {coluna: _moeda(bloco[coluna].to_numpy(dtype=np.float64)) for coluna, _ in colunas}
+        roi = _percentual(bloco["roi"].to_numpy(dtype=np.float64)) if "roi" in bloco else None
+        tir = _percentual(bloco["tir_anual"].to_numpy(dtype=np.float64)) if "tir_anual" in bloco else None
+        descricoes = bloco.get("local_imovel", pd.Series("", index=bloco.index)).astype(str).tolist()
+        tipos = bloco.get("tipo_imovel", pd.Series("", index=bloco.index)).astype(str).tolist()
+
+        for i in range(len(bloco)):
+            cabecalho = " - ".join(p for p in (descricoes[i], tipos[i]) if p)
+            pdf.titulo_secao(f"Lote {inicio + i + 1}" + (f": {cabecalho}" if cabecalho else ""), 11)
+            linhas = [f"- {rotulo}: {valores[coluna][i]}" for coluna, rotulo in colunas]
+            if roi is not None:
+                linhas.append(f"- ROI: {roi[i]}; TIR: {tir[i]} a.a." if tir is not None else f"- ROI: {roi[i]}")
+            pdf.markdown("\n".join(linhas))
+    return pdf.fechar()
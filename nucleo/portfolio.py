@@ -0,0 +1,307 @@
+"""
+Portfólio de lotes: leitura de um CSV com vários imóveis e cálculo, em uma
+única passada vetorizada, do detalhamento de custos dos PASSOS 6, 8 e 10.
+"""
+from typing import Iterable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from nucleo import centavos
+from nucleo.custos import PERC_COMISSAO_LEILOEIRO, calcular_custos, lance_maximo
+from nucleo.formatacao import parse_brl
+from nucleo.retorno import PERC_CUSTOS_VENDA, PRAZO_VENDA_MESES, TAXA_DESCONTO_ANUAL, calcular_retorno
+from nucleo.texto import chave_coluna
+
+# Valores padrão (os mesmos dos sliders do checklist) para colunas ausentes
+PADROES = {
+    "perc_itbi": 2.5,
+    "perc_registro": 1.2,
+    "debitos_passados": 0.0,
+    "valor_acordo": 0.0,
+    "custo_reforma": 0.0,
+    "honorarios_adv": 0.0,
+    "seguro_imovel": 0.0,
+    "valor_mercado": 0.0,
+}
+
+COLUNAS_TEXTO = ["local_imovel", "tipo_imovel", "tipo_leilao", "ocupado"]
+COLUNAS_NUMERICAS = ["valor_lance"] + list(PADROES)
+
+# Nomes alternativos aceitos no cabeçalho do CSV (já sem acentos e minúsculos)
+APELIDOS = {
+    "cidade": "local_imovel",
+    "local": "local_imovel",
+    "cidade_bairro": "local_imovel",
+    "tipo": "tipo_imovel",
+    "leilao": "tipo_leilao",
+    "ocupacao": "ocupado",
+    "lance": "valor_lance",
+    "itbi": "perc_itbi",
+    "registro": "perc_registro",
+    "debitos": "debitos_passados",
+    "dividas": "debitos_passados",
+    "acordo": "valor_acordo",
+    "reforma": "custo_reforma",
+    "honorarios": "honorarios_adv",
+    "seguro": "seguro_imovel",
+    "mercado": "valor_mercado",
+    "orcamento": "valor_orcamento_max",
+    "pagamento": "forma_pagamento",
+}
+
+COLUNAS_CUSTOS = [
+    "comissao_leiloeiro",
+    "itbi",
+    "registro_cartorio",
+    "custo_aquisicao_bruto",
+    "investimento_total",
+    "custo_total_avancado",
+]
+
+
+def _para_numero(serie: pd.Series) -> pd.Series:
+    """
+    Converte uma coluna com números em formato brasileiro ("R$ 1.234,56")
+    para float. Colunas que já são numéricas passam direto.
+    """
+    if pd.api.types.is_numeric_dtype(serie):
+        return serie.astype("float64")
+    return serie.map(parse_brl, na_action="ignore").astype("float64")
+
+
+def _perc_comissao(df: pd.DataFrame):
+    """
+    Comissão de cada lote (coluna ``perc_comissao``, preenchida por
+    ``nucleo.tarifas.aplicar_tarifas``) ou a comissão padrão.
+    """
+    return df["perc_comissao"].to_numpy() if "perc_comissao" in df else PERC_COMISSAO_LEILOEIRO
+
+
+def _emolumentos(df: pd.DataFrame):
+    """
+    Parte fixa (R$) do registro de cada lote (coluna ``emolumentos``) ou zero.
+    """
+    return df["emolumentos"].to_numpy() if "emolumentos" in df else 0.0
+
+
+def normalizar_portfolio(df: pd.DataFrame, padroes: dict = None) -> pd.DataFrame:
+    """
+    Padroniza nomes de colunas, converte valores e preenche colunas ausentes.
+    Valores em branco recebem o padrão; valores que não são números levantam
+    ValueError (com o nome da coluna), em vez de virar o padrão.
+
+    ``padroes`` sobrescreve os valores de ``PADROES`` usados nas colunas que
+    faltarem no arquivo (um padrão NaN deixa os valores ausentes em branco,
+    ver ``nucleo.tarifas.TAXAS_DA_TABELA``). Levanta ValueError se não houver
+    coluna de lance.
+    """
+    padroes = {**PADROES, **(padroes or {})}
+    chaves = {coluna: chave_coluna(coluna) for coluna in df.columns}
+    presentes = set(chaves.values())
+    renomear = {}
+    for coluna, chave in chaves.items():
+        # Um apelido só é usado se a coluna padrão não vier no próprio arquivo
+        destino = APELIDOS.get(chave, chave)
+        renomear[coluna] = chave if destino in presentes else destino
+    df = df.rename(columns=renomear)
+
+    if "valor_lance" not in df.columns:
+        raise ValueError("O arquivo precisa de uma coluna de lance (ex.: 'lance' ou 'valor_lance').")
+
+    for coluna in COLUNAS_TEXTO:
+        if coluna not in df.columns:
+            df[coluna] = ""
+        df[coluna] = df[coluna].fillna("").astype(str).str.strip()
+
+    for coluna in COLUNAS_NUMERICAS:
+        if coluna not in df.columns:
+            df[coluna] = padroes[coluna]
+            continue
+        try:
+            valores = _para_numero(df[coluna])
+        except ValueError as erro:
+            raise ValueError(f"Coluna '{coluna}': {erro}") from None
+        # Só o que veio em branco recebe o padrão
+        df[coluna] = valores.fillna(padroes.get(coluna, 0.0))
+
+    return df
+
+
+def ler_portfolio_csv(arquivo, padroes: dict = None) -> pd.DataFrame:
+    """
+    Lê um CSV de lotes (separador ";" ou "," detectado automaticamente).
+    """
+    df = pd.read_csv(arquivo, sep=None, engine="python", dtype=str, encoding="utf-8-sig")
+    return normalizar_portfolio(df, padroes)
+
+
+def calcular_portfolio(df: pd.DataFrame, tarifas=None) -> pd.DataFrame:
+    """
+    Acrescenta ao portfólio as colunas de custo de cada lote.
+
+    Todas as linhas são custeadas de uma vez pelo motor vetorizado
+    (``calcular_custos``), sem laço em Python por lote. Se o arquivo tiver a
+    coluna ``valor_orcamento_max``, também calcula o lance máximo de cada lote
+    (``tarifas`` como em ``calcular_lance_maximo``); com ``valor_pago`` (ver
+    ``aplicar_cpc895``), usa-a no custo de aquisição, e com ``emolumentos``
+    (ver ``nucleo.tarifas.aplicar_tarifas``), soma-a ao registro.
+    """
+    custos = calcular_custos(
+        df["valor_lance"].to_numpy(),
+        df["perc_itbi"].to_numpy(),
+        df["perc_registro"].to_numpy(),
+        debitos_passados=df["debitos_passados"].to_numpy(),
+        valor_acordo=df["valor_acordo"].to_numpy(),
+        custo_reforma=df["custo_reforma"].to_numpy(),
+        honorarios_adv=df["honorarios_adv"].to_numpy(),
+        seguro_imovel=df["seguro_imovel"].to_numpy(),
+        perc_comissao=_perc_comissao(df),
+        valor_pago=df["valor_pago"].to_numpy() if "valor_pago" in df else None,
+        emolumentos=_emolumentos(df),
+    )
+    resultado = df.copy()
+    for coluna, valores in custos._asdict().items():
+        resultado[coluna] = valores
+    resultado["margem_mercado"] = resultado["valor_mercado"] - resultado["custo_total_avancado"]
+    if "valor_orcamento_max" in resultado:
+        resultado = calcular_lance_maximo(resultado, tarifas=tarifas)
+    return resultado
+
+
+def custos_centavos(df: pd.DataFrame) -> centavos.CustosCentavos:
+    """
+    Taxas e custos de ``COLUNAS_CUSTOS`` de cada lote em centavos, cada taxa
+    arredondada conforme ``centavos.REGRAS``, como nas guias. Com a coluna
+    ``emolumentos`` (tabela de tarifas), esse valor fixo entra no registro.
+    """
+    reais = {coluna: centavos.de_reais(df[coluna].to_numpy())
+             for coluna in ["valor_lance", "debitos_passados", "valor_acordo", "custo_reforma",
+                            "honorarios_adv", "seguro_imovel"]}
+    return centavos.calcular_custos_centavos(
+        reais["valor_lance"],
+        df["perc_itbi"].to_numpy(),
+        df["perc_registro"].to_numpy(),
+        debitos_passados=reais["debitos_passados"],
+        valor_acordo=reais["valor_acordo"],
+        custo_reforma=reais["custo_reforma"],
+        honorarios_adv=reais["honorarios_adv"],
+        seguro_imovel=reais["seguro_imovel"],
+        perc_comissao=_perc_comissao(df),
+        valor_pago=centavos.de_reais(df["valor_pago"].to_numpy()) if "valor_pago" in df else None,
+        emolumentos=centavos.de_reais(_emolumentos(df)),
+    )
+
+
+def totais_centavos(df: pd.DataFrame) -> dict:
+    """
+    Totais exatos do portfólio, em centavos: lances e as somas de
+    ``custos_centavos``.
+    """
+    totais = {"valor_lance": centavos.somar(centavos.de_reais(df["valor_lance"].to_numpy()))}
+    totais.update({coluna: centavos.somar(valores) for coluna, valores in custos_centavos(df)._asdict().items()})
+    return totais
+
+
+def arredondar_custos(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cópia de ``df`` com as colunas de ``COLUNAS_CUSTOS`` (e a margem sobre o
+    mercado) trocadas pelos valores de ``custos_centavos``: o que é
+    exportado lote a lote soma exatamente os totais de ``totais_centavos``.
+    """
+    custos = custos_centavos(df)
+    resultado = df.copy()
+    for coluna, valores in custos._asdict().items():
+        resultado[coluna] = centavos.para_reais(valores)
+    if "margem_mercado" in resultado:
+        margem = centavos.de_reais(resultado["valor_mercado"].to_numpy()) - custos.custo_total_avancado
+        resultado["margem_mercado"] = centavos.para_reais(margem)
+    return resultado
+
+
+def calcular_lance_maximo(df: pd.DataFrame, valor_orcamento_max=None, tarifas=None) -> pd.DataFrame:
+    """
+    Acrescenta ``lance_maximo`` (maior lance que cabe no orçamento) e
+    ``folga_lance`` (lance máximo menos o lance informado) a cada lote.
+
+    Sem ``valor_orcamento_max``, usa a coluna de mesmo nome do portfólio.
+    Com ``tarifas`` (``nucleo.tarifas.Tarifas``), os lotes com emolumentos
+    da tabela são resolvidos pelas faixas: o emolumento é o da faixa do lance
+    máximo, não o do lance informado.
+    """
+    if valor_orcamento_max is None:
+        valor_orcamento_max = _para_numero(df["valor_orcamento_max"]).to_numpy()
+    entradas = dict(
+        valor_orcamento_max=valor_orcamento_max,
+        perc_itbi=df["perc_itbi"].to_numpy(),
+        perc_registro=df["perc_registro"].to_numpy(),
+        debitos_passados=df["debitos_passados"].to_numpy(),
+        valor_acordo=df["valor_acordo"].to_numpy(),
+        custo_reforma=df["custo_reforma"].to_numpy(),
+        honorarios_adv=df["honorarios_adv"].to_numpy(),
+        seguro_imovel=df["seguro_imovel"].to_numpy(),
+        perc_comissao=_perc_comissao(df),
+        emolumentos=_emolumentos(df),
+    )
+    resultado = df.copy()
+    resultado["lance_maximo"] = lance_maximo(**entradas)
+    if tarifas is not None and "emolumentos" in df:
+        pela_tabela = df["emolumentos"].to_numpy() > 0
+        resultado["lance_maximo"] = np.where(pela_tabela, lance_maximo(**entradas, faixas_registro=tarifas),
+                                             resultado["lance_maximo"].to_numpy())
+    resultado["folga_lance"] = resultado["lance_maximo"] - resultado["valor_lance"]
+    return resultado
+
+
+class ResumoPortfolio(NamedTuple):
+    """
+    Resultado de ``resumir_portfolio``: quantos lotes passaram, os totais
+    exatos em centavos (como em ``totais_centavos``) e os melhores lotes,
+    já ordenados.
+    """
+    quantidade: int
+    totais: dict
+    melhores: pd.DataFrame
+
+
+def resumir_portfolio(blocos: Iterable[pd.DataFrame], coluna: str, limite: int = None) -> ResumoPortfolio:
+    """
+    Reduz um portfólio entregue em blocos (ex.: a lista da Caixa lida em
+    fluxo, já custeada) a contagem, totais e os ``limite`` lotes de maior
+    ``coluna`` (todos, se ``limite`` for None), sem juntar os blocos: a
+    memória guarda só o bloco atual e os melhores até aqui. Lotes com
+    ``coluna`` em branco ficam por último.
+    """
+    quantidade = 0
+    totais = {}
+    melhores = None
+    for bloco in blocos:
+        quantidade += len(bloco)
+        for nome, total in totais_centavos(bloco).items():
+            totais[nome] = totais.get(nome, 0) + total
+        candidatos = bloco if melhores is None else pd.concat([melhores, bloco], ignore_index=True)
+        melhores = candidatos.sort_values(coluna, ascending=False, na_position="last", kind="stable",
+                                          ignore_index=True)
+        if limite is not None:
+            melhores = melhores.head(limite)
+    return ResumoPortfolio(quantidade, totais, melhores)
+
+
+def calcular_retorno_portfolio(df: pd.DataFrame, meses=PRAZO_VENDA_MESES, perc_custos_venda=PERC_CUSTOS_VENDA,
+                               custo_mensal=0.0, taxa_desconto_anual=TAXA_DESCONTO_ANUAL) -> pd.DataFrame:
+    """
+    Acrescenta ``lucro_revenda``, ``roi``, ``vpl`` e ``tir_anual`` (revenda
+    pelo ``valor_mercado``) a cada lote de um portfólio já custeado. A TIR de
+    todos os lotes é resolvida de uma vez (ver ``nucleo.retorno``).
+    """
+    retorno = calcular_retorno(
+        df["custo_total_avancado"].to_numpy(),
+        df["valor_mercado"].to_numpy(),
+        meses, perc_custos_venda, custo_mensal, taxa_desconto_anual,
+    )
+    resultado = df.copy()
+    resultado["lucro_revenda"] = retorno.lucro
+    resultado["roi"] = retorno.roi
+    resultado["vpl"] = retorno.vpl
+    resultado["tir_anual"] = retorno.tir_anual
+    return resultado
@@ -0,0 +1,171 @@
+"""
+Texto do relatório final do checklist ("Gerar Relatório Completo").
+
+O relatório é montado como um único documento Markdown a partir dos valores
+do checklist, para ser enviado ao navegador em um só elemento (em vez de uma
+mensagem por linha) e guardado em cache pelos valores de entrada.
+"""
+import math
+
+from nucleo.formatacao import format_brl
+
+
+def _sim_nao(valor) -> str:
+    return "Sim" if valor else "Não"
+
+
+def _percentual(valor: float) -> str:
+    # Sem troca de sinal nos fluxos a TIR não existe (NaN): "n/d", não "nan%"
+    return f"{valor * 100:.1f}%" if math.isfinite(valor) else "n/d"
+
+
+def montar_relatorio(d: dict) -> str:
+    """
+    Markdown do relatório a partir do dicionário de valores do checklist
+    (as chaves são os nomes das variáveis de ``paginas/completo.py``).
+    """
+    f_br = format_brl
+    linhas = ["### RELATÓRIO FINAL DO CHECKLIST - ULTRA COMPLETO", ""]
+
+    # Título e dados básicos
+    linhas.append(f"**Data:** {d['data_atual']}  ")
+    if d["nome_comprador"]:
+        linhas.append(f"**Nome do Comprador:** {d['nome_comprador']}")
+    linhas += ["", "---", ""]
+
+    linhas += [
+        "### PASSO 1: Objetivos e Orçamento",
+        f"- Objetivo: {d['objetivo']}",
+        f"- Orçamento Máximo: R$ {f_br(d['valor_orcamento_max'])}",
+    ]
+    if d["valor_orcamento_max"] > 0:
+        linhas.append(f"- Lance Máximo dentro do Orçamento: R$ {f_br(d['lance_max_orcamento'])}")
+    linhas.append(f"- Verificou Financiamento previamente? {_sim_nao(d['verificou_financiamento'])}")
+
+    linhas += [
+        "",
+        "### PASSO 2: Mercado e Visita",
+        f"- Local (GO): {d['local_imovel']}",
+        f"- Tipo de Imóvel: {d['tipo_imovel']}",
+        f"- Visita In Loco? {_sim_nao(d['visitou'])}",
+        f"- Conversou com corretores/pesquisa online? {_sim_nao(d['conversou_corretores'])}",
+        f"- Valor de Mercado Estimado: R$ {f_br(d['valor_mercado'])}",
+        f"- Conferiu possíveis ampliações não averbadas? {_sim_nao(d['verificou_averbacoes'])}",
+    ]
+
+    linhas += [
+        "",
+        "### PASSO 3: Documentos e Edital",
+        f"- Tipo de Leilão: {d['tipo_leilao']}",
+        f"- Edital lido? {_sim_nao(d['edital_lido'])}",
+        f"- Matrícula verificada? {_sim_nao(d['matricula_conf'])}",
+    ]
+    if d["tipo_leilao"] == "Extrajudicial":
+        linhas.append(f"- Antigo dono notificado? {d['notificacao_ok']}")
+    linhas.append(f"- Pesquisou processos no TJGO? {_sim_nao(d['verificou_processos'])}")
+
+    linhas += ["", "### PASSO 4: Ocupação", f"- Ocupação do Imóvel: {d['ocupado']}"]
+    if d["ocupado"] == "Ocupado":
+        linhas.append(f"  - Acordo amigável? {d['acordo_amigavel']}")
+        if d["acordo_amigavel"] == "Sim":
+            linhas.append(f"  - Valor de acordo: R$ {f_br(d['valor_acordo'])}")
+    linhas.append(f"- Contrato de locação verificado? {_sim_nao(d['verificou_locacao'])}")
+
+    linhas += [
+        "",
+        "### PASSO 5: Cadastro e Participação no Leilão",
+        f"- Cadastro no leiloeiro feito? {_sim_nao(d['cadastro_feito'])}",
+        f"- Verificou data/hora do leilão? {_sim_nao(d['verifica_data_leilao'])}",
+    ]
+
+    linhas += [
+        "",
+        "### PASSO 6: Forma de Pagamento e Cálculos",
+        f"- Valor do Lance: R$ {f_br(d['valor_lance'])}",
+        f"- Forma de Pagamento: {d['forma_pagamento']}",
+    ]
+    if d["forma_pagamento"] == "Financiamento Caixa":
+        linhas += [
+            f"  - % de Entrada: {d['perc_entrada']}%",
+            f"  - Valor de Entrada (aprox.): R$ {f_br(d['valor_entrada'])}",
+            f"  - Valor Financiado (aprox.): R$ {f_br(d['valor_financiado'])}",
+        ]
+        if d["financiamento"] is not None:
+            fin = d["financiamento"]
+            linhas += [
+                f"  - Sistema {fin['sistema']}, {fin['taxa_juros_anual']}% a.a., {fin['prazo']} meses",
+                f"  - 1ª / última prestação: R$ {f_br(fin['primeira_prestacao'])}"
+                f" / R$ {f_br(fin['ultima_prestacao'])}",
+                f"  - Total pago no financiamento: R$ {f_br(fin['total_pago'])}",
+            ]
+    if d["parcelamento"] is not None:
+        parc = d["parcelamento"]
+        linhas += [
+            f"  - Entrada ({d['perc_entrada']}%): R$ {f_br(d['valor_entrada'])}",
+            f"  - {parc['n_parcelas']} parcelas corrigidas, de R$ {f_br(parc['primeira_parcela'])}"
+            f" a R$ {f_br(parc['ultima_parcela'])}",
+            f"  - Total pago no parcelamento: R$ {f_br(parc['total_pago'])}",
+        ]
+    if d["forma_pagamento"] != "À Vista":
+        linhas.append(f"  - Valor presente do pagamento ({d['taxa_desconto_anual']}% a.a.): "
+                      f"R$ {f_br(d['valor_pago'])}")
+
+    # Com a tabela de tarifas o registro é um emolumento fixo, não um percentual
+    registro = "emolumentos" if d["emolumentos"] else f"{d['perc_registro']}%"
+    linhas += [
+        f"- Comissão do Leiloeiro ({d['perc_comissao']}%): R$ {f_br(d['comissao_leiloeiro'])}",
+        f"- ITBI ({d['perc_itbi']}%): R$ {f_br(d['itbi'])}",
+        f"- Registro em Cartório ({registro}): R$ {f_br(d['registro_cartorio'])}",
+        f"- Dívidas Passadas (IPTU/condomínio): R$ {f_br(d['debitos_passados'])}",
+    ]
+    if d["valor_acordo"] > 0:
+        linhas.append(f"- Valor de Acordo Ocupante: R$ {f_br(d['valor_acordo'])}")
+    linhas += ["", f"**Subtotal de Aquisição**: R$ {f_br(d['custo_aquisicao_bruto'])}"]
+
+    # RESUMO DO PASSO 7
+    linhas += [
+        "",
+        "### PASSO 7: Pós-Arremate - Checkpoints",
+        f"- Depósito do valor no prazo? {_sim_nao(d['depositou_valor'])}",
+        f"- Pagamento da comissão do leiloeiro? {_sim_nao(d['pagou_comissao'])}",
+        f"- (Judicial) Homologação / Carta de Arrematação recebida? {_sim_nao(d['judicial_homologacao'])}",
+        f"- (Extrajudicial) Contrato/escritura com o banco? {_sim_nao(d['extrajudicial_assinou'])}",
+        f"- ITBI pago e comprovado? {_sim_nao(d['pagou_itbi'])}",
+        f"- Registro no Cartório de Imóveis efetuado? {_sim_nao(d['registrou_imovel'])}",
+        f"- Ação de imissão na posse iniciada (se necessário)? {_sim_nao(d['acao_posse'])}",
+    ]
+
+    linhas += [
+        "",
+        "### PASSO 8: Reforma e Revenda",
+        f"- Custo de Reforma: R$ {f_br(d['custo_reforma'])}",
+        "",
+        f"**Investimento Total (Compra + Reforma)**: R$ {f_br(d['investimento_total'])}",
+    ]
+    if d["retorno"] is not None:
+        ret = d["retorno"]
+        linhas += [
+            "",
+            f"- Revenda em {d['prazo_venda']} meses: lucro de R$ {f_br(ret['lucro'])}, "
+            f"ROI de {_percentual(ret['roi'])}, TIR de {_percentual(ret['tir_anual'])} a.a., "
+            f"VPL de R$ {f_br(ret['vpl'])}",
+        ]
+
+    # PASSO 10 - RELATÓRIO
+    linhas += [
+        "",
+        "### PASSO 10: Honorários, Seguros e Verificações Avançadas",
+        f"- Honorários advocatícios: R$ {f_br(d['honorarios_adv'])}",
+        f"- Seguro do Imóvel: R$ {f_br(d['seguro_imovel'])}",
+        "",
+        f"**Total Geral (Compra + Reforma + Honorários + Seguro)**: R$ {f_br(d['total_geral_avancado'])}",
+    ]
+
+    # PASSO 11 - RELATÓRIO
+    linhas += [
+        "",
+        "### PASSO 11: Documentos Complementares e Conclusão",
+        "- Guarde todos os comprovantes e documentos (edital, matrícula, recibos de pagamento).",
+        "- Atualize cadastros de água, luz, IPTU, e eventualmente disponibilize o imóvel para venda/locação.",
+    ]
+    return "\n".join(linhas) + "\n"
@@ -0,0 +1,162 @@
+"""
+Retorno da revenda: ROI, VPL e TIR de um ou de milhares de lotes.
+
+O fluxo de cada lote é: o custo total na compra (mês 0), custos mensais de
+manutenção (IPTU, condomínio) até a venda e, no mês da venda, o valor de
+mercado menos os custos de venda (corretagem etc.). Como o fluxo tem essa
+forma fixa, o VPL sai em forma fechada (sem matriz de meses) e a TIR é
+obtida por iterações de Newton aplicadas a todos os lotes ao mesmo tempo.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from nucleo.financiamento import taxa_mensal
+
+PRAZO_VENDA_MESES = 12
+PERC_CUSTOS_VENDA = 6.0
+TAXA_DESCONTO_ANUAL = 10.0
+
+_ITERACOES_MAXIMAS = 100
+_TOLERANCIA = 1e-10
+
+
+class Retorno(NamedTuple):
+    """
+    Resultado de ``calcular_retorno`` (um valor por lote). ``roi`` é o lucro
+    sobre o capital investido no período; ``tir_anual`` é a taxa interna de
+    retorno efetiva ao ano (NaN quando não existe).
+    """
+    receita_liquida: np.ndarray
+    lucro: np.ndarray
+    roi: np.ndarray
+    vpl: np.ndarray
+    tir_anual: np.ndarray
+
+
+def _anuidade(r, meses):
+    """
+    Fator de desconto da venda, ``(1 + r)^-n``, e valor presente de 1 ao mês
+    por n meses, com a derivada deste em relação a ``r`` (série de Taylor
+    perto de r = 0).
+    """
+    desconto = (1.0 + r) ** -meses
+    perto_de_zero = np.abs(r) < 1e-8
+    r_seguro = np.where(perto_de_zero, 1.0, r)
+    anuidade = np.where(perto_de_zero, meses, (1.0 - desconto) / r_seguro)
+    d_anuidade = np.where(perto_de_zero, -meses * (meses + 1) / 2.0,
+                          (meses * desconto / (1.0 + r) * r_seguro - (1.0 - desconto)) / r_seguro ** 2)
+    return desconto, anuidade, d_anuidade
+
+
+def _vpl(r, custo_total, custo_mensal, receita_liquida, meses):
+    """
+    VPL do fluxo de compra, manutenção e venda à taxa mensal ``r``.
+    """
+    desconto, anuidade, _ = _anuidade(r, meses)
+    return -custo_total - custo_mensal * anuidade + receita_liquida * desconto
+
+
+def tir_mensal(custo_total, receita_liquida, meses, custo_mensal=0.0) -> np.ndarray:
+    """
+    Taxa interna de retorno mensal (fração) de cada lote, por Newton vetorizado.
+
+    Com um único fluxo positivo (a venda), o VPL tem uma só raiz acima de -100%
+    e é positivo antes dela. Newton é aplicado a
+    ``log(venda descontada) - log(custo + manutenção descontada)``, que tem a
+    mesma raiz e é quase linear (o VPL cresce como ``(1 + r)^-n`` e faria
+    Newton avançar muito devagar em prazos longos). O ponto de partida é a TIR
+    exata sem custos mensais, ``(receita/custo)^(1/n) - 1``, que limita a raiz
+    por cima quando ``custo_mensal`` é positivo; quando é negativo (receita
+    mensal, como um aluguel até a venda), o limite superior é dobrado, em
+    ``1 + r``, até o VPL trocar de sinal. Cada iteração atualiza de uma vez
+    todos os lotes ainda não convergidos e, quando o passo sai do intervalo
+    que contém a raiz, usa a bissecção.
+    Lotes sem solução (receita ou custo nulos) ficam NaN.
+    """
+    custo_total, receita_liquida, meses, custo_mensal = (
+        np.atleast_1d(a).astype(np.float64)
+        for a in np.broadcast_arrays(custo_total, receita_liquida, meses, custo_mensal)
+    )
+    valido = (custo_total > 0) & (receita_liquida > 0) & (meses > 0)
+    r = np.full(custo_total.shape, np.nan)
+    r[valido] = (receita_liquida[valido] / custo_total[valido]) ** (1.0 / meses[valido]) - 1.0
+    inferior = np.full(custo_total.shape, -1.0)
+    superior = r.copy()
+
+    def funcao(taxas, indices):
+        # g positivo: a raiz está acima da taxa; negativo: abaixo.
+        # Perto de -100% as contas estouram (NaN) e valem como positivo.
+        n, h = meses[indices], custo_mensal[indices]
+        _, anuidade, d_anuidade = _anuidade(taxas, n)
+        saidas = custo_total[indices] + h * anuidade
+        g = np.log(receita_liquida[indices]) - n * np.log1p(taxas) - np.log(saidas)
+        return g, -n / (1.0 + taxas) - h * d_anuidade / saidas
+
+    ativo = valido.copy()
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        expandir = valido & (custo_mensal < 0)
+        for _ in range(_ITERACOES_MAXIMAS):
+            if not expandir.any():
+                break
+            indices = np.flatnonzero(expandir)
+            g, _ = funcao(superior[indices], indices)
+            acima = ~(g <= 0)
+            subir = indices[acima]
+            inferior[subir] = r[subir] = superior[subir]
+            superior[subir] = 2.0 * superior[subir] + 1.0
+            expandir[indices[~acima]] = False
+        ativo &= ~expandir
+
+        for _ in range(_ITERACOES_MAXIMAS):
+            if not ativo.any():
+                break
+            indices = np.flatnonzero(ativo)
+            atual = r[indices]
+            g, derivada = funcao(atual, indices)
+            acima = ~(g <= 0)
+            inferior[indices] = np.where(acima, atual, inferior[indices])
+            superior[indices] = np.where(acima, superior[indices], atual)
+
+            novo = atual - g / derivada
+            fora = ~((novo > inferior[indices]) & (novo < superior[indices]))
+            novo = np.where(fora, (inferior[indices] + superior[indices]) / 2.0, novo)
+            r[indices] = novo
+            convergiu = np.abs(novo - atual) < _TOLERANCIA * np.maximum(1.0, np.abs(novo))
+            ativo[indices[convergiu]] = False
+    r[ativo | expandir] = np.nan
+    return r
+
+
+def calcular_retorno(custo_total, valor_venda, meses=PRAZO_VENDA_MESES,
+                     perc_custos_venda=PERC_CUSTOS_VENDA, custo_mensal=0.0,
+                     taxa_desconto_anual=TAXA_DESCONTO_ANUAL) -> Retorno:
+    """
+    ROI, VPL e TIR da compra e revenda de um ou vários lotes.
+
+    ``custo_total`` é o ``custo_total_avancado`` do motor de custos e
+    ``valor_venda`` o valor de mercado esperado; ``meses`` é o prazo até a
+    venda, ``perc_custos_venda`` o percentual do preço pago na venda e
+    ``custo_mensal`` a manutenção mensal até lá. O VPL usa
+    ``taxa_desconto_anual`` (% efetiva ao ano). Aceita escalares ou arrays.
+    """
+    custo_total, valor_venda, meses, custo_mensal = (
+        np.asarray(a, dtype=np.float64) for a in (custo_total, valor_venda, meses, custo_mensal)
+    )
+    receita_liquida = valor_venda * (1.0 - np.asarray(perc_custos_venda, dtype=np.float64) / 100.0)
+    investido = custo_total + custo_mensal * meses
+    lucro = receita_liquida - investido
+    roi = lucro / np.where(investido > 0, investido, np.nan)
+
+    vpl = _vpl(taxa_mensal(taxa_desconto_anual), custo_total, custo_mensal, receita_liquida, meses)
+    tir = tir_mensal(custo_total, receita_liquida, meses, custo_mensal)
+    if np.ndim(lucro) == 0:
+        tir = tir[0]
+
+    return Retorno(
+        receita_liquida=receita_liquida,
+        lucro=lucro,
+        roi=roi,
+        vpl=vpl,
+        tir_anual=(1.0 + tir) ** 12 - 1.0,
+    )
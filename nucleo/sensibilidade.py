@@ -0,0 +1,56 @@
+"""
+Grade de sensibilidade do custo total a ITBI, registro e lance.
+
+Calcula, em uma única passada vetorizada, o custo total para todas as
+posições dos sliders de ITBI (1% a 5%, passo 0,5) e de registro (0,5% a 2%,
+passo 0,1) contra uma faixa de lances em torno do lance informado.
+"""
+import numpy as np
+import pandas as pd
+
+from nucleo.custos import calcular_custos
+
+# Mesmas posições dos sliders do PASSO 6
+PERCS_ITBI = np.round(np.arange(1.0, 5.0 + 1e-9, 0.5), 1)
+PERCS_REGISTRO = np.round(np.arange(0.5, 2.0 + 1e-9, 0.1), 1)
+
+
+def faixa_lances(valor_lance: float, variacao: float = 0.2, passos: int = 9) -> np.ndarray:
+    """
+    Lances igualmente espaçados entre -variacao e +variacao do lance informado.
+    """
+    return valor_lance * np.linspace(1.0 - variacao, 1.0 + variacao, passos)
+
+
+def grade_sensibilidade(lances, debitos_passados=0.0, valor_acordo=0.0, custo_reforma=0.0,
+                        honorarios_adv=0.0, seguro_imovel=0.0,
+                        percs_itbi=PERCS_ITBI, percs_registro=PERCS_REGISTRO) -> np.ndarray:
+    """
+    Custo total (com honorários e seguro) no formato [lance, ITBI, registro].
+    """
+    lances = np.asarray(lances, dtype=np.float64)[:, None, None]
+    percs_itbi = np.asarray(percs_itbi, dtype=np.float64)[None, :, None]
+    percs_registro = np.asarray(percs_registro, dtype=np.float64)[None, None, :]
+    return calcular_custos(
+        lances, percs_itbi, percs_registro,
+        debitos_passados=debitos_passados,
+        valor_acordo=valor_acordo,
+        custo_reforma=custo_reforma,
+        honorarios_adv=honorarios_adv,
+        seguro_imovel=seguro_imovel,
+    ).custo_total_avancado
+
+
+def tabela_sensibilidade(lances, grade: np.ndarray, percs_itbi=PERCS_ITBI,
+                         percs_registro=PERCS_REGISTRO) -> pd.DataFrame:
+    """
+    Converte a grade em tabela "longa" (uma linha por combinação), própria
+    para filtros, ordenação e gráficos de calor.
+    """
+    eixo_lance, eixo_itbi, eixo_registro = np.meshgrid(lances, percs_itbi, percs_registro, indexing="ij")
+    return pd.DataFrame({
+        "valor_lance": eixo_lance.ravel(),
+        "perc_itbi": eixo_itbi.ravel(),
+        "perc_registro": eixo_registro.ravel(),
+        "custo_total_avancado": grade.ravel(),
+    })
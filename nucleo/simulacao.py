@@ -0,0 +1,125 @@
+"""
+Simulação de Monte Carlo para os custos mais incertos de cada lote.
+
+Dívidas passadas, acordo com o ocupante, reforma e valor de mercado são
+estimativas pontuais no checklist. Aqui cada uma vira uma distribuição
+triangular (mínimo, estimativa, máximo) e o custo total e a margem sobre o
+valor de mercado são avaliados em milhares de sorteios por lote, de forma
+vetorizada. Os lotes de um portfólio são divididos entre processos.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from nucleo.custos import PERC_COMISSAO_LEILOEIRO, calcular_custos
+
+N_AMOSTRAS = 100_000
+PERCENTIS = (5, 50, 95)
+
+
+class Incerteza(NamedTuple):
+    """
+    Faixa relativa (mínimo, máximo) de cada entrada incerta, como fração da
+    estimativa informada. A estimativa é o valor mais provável (moda).
+    """
+    debitos_passados: tuple = (0.8, 1.5)
+    valor_acordo: tuple = (0.8, 1.5)
+    custo_reforma: tuple = (0.9, 1.6)
+    valor_mercado: tuple = (0.85, 1.10)
+
+
+def _triangular(rng: np.random.Generator, estimativa: float, faixa: tuple, n: int) -> np.ndarray:
+    """
+    Sorteia ``n`` valores de uma triangular (estimativa*min, estimativa, estimativa*max).
+    Estimativa zero (ou faixa sem largura) devolve o próprio valor, sem sorteio.
+    """
+    minimo, maximo = estimativa * faixa[0], estimativa * faixa[1]
+    if maximo <= minimo:
+        return np.full(n, estimativa)
+    return rng.triangular(minimo, estimativa, maximo, n)
+
+
+def simular_lote(lote: dict, n_amostras: int = N_AMOSTRAS, incerteza: Incerteza = Incerteza(),
+                 percentis: tuple = PERCENTIS, rng: np.random.Generator = None) -> dict:
+    """
+    Simula um lote (dicionário com as colunas do portfólio) e devolve os
+    percentis do custo total e da margem, além da probabilidade de prejuízo.
+    Com ``valor_pago`` (parcelamento CPC 895), o custo usa esse valor
+    presente no lugar do lance, e com ``perc_comissao`` e ``emolumentos``
+    (tabela de tarifas), essa comissão e esse registro, como
+    ``calcular_portfolio``.
+    """
+    rng = rng or np.random.default_rng()
+    amostras = {
+        campo: _triangular(rng, float(lote[campo]), getattr(incerteza, campo), n_amostras)
+        for campo in Incerteza._fields
+    }
+    custo = calcular_custos(
+        lote["valor_lance"], lote["perc_itbi"], lote["perc_registro"],
+        debitos_passados=amostras["debitos_passados"],
+        valor_acordo=amostras["valor_acordo"],
+        custo_reforma=amostras["custo_reforma"],
+        honorarios_adv=lote["honorarios_adv"],
+        seguro_imovel=lote["seguro_imovel"],
+        perc_comissao=lote.get("perc_comissao", PERC_COMISSAO_LEILOEIRO),
+        valor_pago=lote.get("valor_pago"),
+        emolumentos=lote.get("emolumentos", 0.0),
+    ).custo_total_avancado
+    margem = amostras["valor_mercado"] - custo
+
+    resultado = {}
+    for p, valor in zip(percentis, np.percentile(custo, percentis)):
+        resultado[f"custo_p{p}"] = valor
+    for p, valor in zip(percentis, np.percentile(margem, percentis)):
+        resultado[f"margem_p{p}"] = valor
+    resultado["prob_prejuizo"] = float(np.mean(margem < 0))
+    return resultado
+
+
+def _simular_bloco(lotes: list, n_amostras: int, incerteza: Incerteza,
+                   percentis: tuple, semente: np.random.SeedSequence) -> list:
+    """
+    Tarefa de um processo: simula, em sequência, um bloco de lotes.
+    """
+    rng = np.random.default_rng(semente)
+    return [simular_lote(lote, n_amostras, incerteza, percentis, rng) for lote in lotes]
+
+
+def simular_portfolio(df: pd.DataFrame, n_amostras: int = N_AMOSTRAS,
+                      incerteza: Incerteza = Incerteza(), percentis: tuple = PERCENTIS,
+                      processos: int = None, semente: int = None) -> pd.DataFrame:
+    """
+    Simula todos os lotes de um portfólio normalizado (``normalizar_portfolio``).
+
+    Os lotes são divididos em blocos distribuídos por um pool de processos
+    (``processos`` = None usa todos os núcleos; 1 roda no processo atual).
+    Com a mesma ``semente`` e o mesmo número de processos o resultado se repete.
+    Devolve um DataFrame com o mesmo índice de ``df``.
+    """
+    colunas = ["valor_lance", "perc_itbi", "perc_registro", "honorarios_adv",
+               "seguro_imovel"] + list(Incerteza._fields)
+    colunas += [coluna for coluna in ["valor_pago", "perc_comissao", "emolumentos"] if coluna in df]
+    lotes = df[colunas].to_dict("records")
+    processos = processos or os.cpu_count() or 1
+    processos = max(1, min(processos, len(lotes)))
+
+    # Alguns blocos por processo equilibram a carga entre lotes rápidos e lentos
+    n_blocos = max(1, min(len(lotes), processos * 4))
+    limites = np.linspace(0, len(lotes), n_blocos + 1).astype(int)
+    blocos = [lotes[inicio:fim] for inicio, fim in zip(limites[:-1], limites[1:])]
+    sementes = np.random.SeedSequence(semente).spawn(len(blocos))
+    argumentos = [(bloco, n_amostras, incerteza, percentis, s) for bloco, s in zip(blocos, sementes)]
+
+    if processos == 1:
+        partes = [_simular_bloco(*args) for args in argumentos]
+    else:
+        # "spawn" evita herdar as threads do servidor do Streamlit via fork
+        contexto = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=processos, mp_context=contexto) as executor:
+            partes = list(executor.map(_simular_bloco, *zip(*argumentos)))
+
+    return pd.DataFrame([r for parte in partes for r in parte], index=df.index)
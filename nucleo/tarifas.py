@@ -0,0 +1,159 @@
+"""
+Tabela local de tarifas: ITBI por município, emolumentos de registro de Goiás
+por faixa de valor e comissão por leiloeiro.
+
+As tabelas ficam em ``nucleo/dados`` (CSV com ";" e números no formato
+brasileiro) e são lidas uma vez por processo; os valores que acompanham o
+projeto são ILUSTRATIVOS e devem ser conferidos com a prefeitura, a tabela
+da Corregedoria e o edital. A consulta é vetorizada: a faixa de emolumentos
+de todos os lotes sai de um único ``np.searchsorted`` e o ITBI de cada
+município é procurado uma vez, não uma vez por lote.
+"""
+import bisect
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from nucleo.custos import PERC_COMISSAO_LEILOEIRO
+from nucleo.formatacao import parse_brl_array
+from nucleo.portfolio import PADROES
+from nucleo.texto import chave_coluna
+
+PASTA_DADOS = Path(__file__).resolve().parent / "dados"
+LEILOEIRO_PADRAO = "Padrão"
+
+# Padrões para ``normalizar_portfolio`` que deixam em branco (NaN) as taxas
+# não informadas no arquivo, para ``aplicar_tarifas`` preencher pela tabela
+TAXAS_DA_TABELA = {"perc_itbi": np.nan, "perc_registro": np.nan}
+
+# "Goiânia - Setor Bueno", "Anápolis, Jundiaí" e "Trindade/Centro" -> município antes do separador
+_SEPARADOR_BAIRRO = re.compile(r"\s+-\s+|[,/]")
+
+
+def _ler_tabela(caminho: Path, colunas_numericas: list) -> pd.DataFrame:
+    tabela = pd.read_csv(caminho, sep=";", comment="#", dtype=str, encoding="utf-8")
+    for coluna in colunas_numericas:
+        tabela[coluna] = parse_brl_array(tabela[coluna].to_numpy())
+    return tabela
+
+
+def _por_valor_unico(valores, funcao) -> np.ndarray:
+    """
+    Aplica ``funcao`` uma vez a cada valor distinto e espalha o resultado
+    para todas as posições (poucos municípios/leiloeiros, muitos lotes).
+    """
+    codigos, unicos = pd.factorize(np.asarray(valores, dtype=object), use_na_sentinel=False)
+    return np.array([funcao(valor) for valor in unicos], dtype=np.float64)[codigos]
+
+
+def municipio(local: str) -> str:
+    """
+    Município de um texto "cidade - bairro", normalizado como chave
+    ("Goiânia - Setor Bueno" -> "goiania").
+    """
+    return chave_coluna(_SEPARADOR_BAIRRO.split(str(local), maxsplit=1)[0])
+
+
+class Tarifas:
+    """
+    Tabelas de tarifas já carregadas, só para leitura (uma instância é
+    compartilhada entre sessões).
+
+    ``limites`` e ``emolumentos`` são as faixas de registro: o emolumento
+    ``emolumentos[i]`` vale para imóveis de até ``limites[i]`` reais (e acima
+    de ``limites[i - 1]``); acima da última faixa vale o último emolumento.
+    ``leiloeiros`` são os nomes como escritos na tabela, para listas de
+    escolha (as chaves de ``comissoes`` já vêm normalizadas).
+    """
+
+    def __init__(self, itbi: dict, limites: np.ndarray, emolumentos: np.ndarray, comissoes: dict,
+                 leiloeiros: list = None):
+        if len(limites) != len(emolumentos) or not len(limites) or np.any(np.diff(limites) <= 0):
+            raise ValueError("As faixas de emolumentos precisam estar em ordem crescente de valor.")
+        self.itbi = itbi
+        self.limites = limites
+        self.emolumentos = emolumentos
+        self.comissoes = comissoes
+        self.leiloeiros = list(leiloeiros) if leiloeiros is not None else list(comissoes)
+        self._limites_lista = limites.tolist()
+
+    def perc_itbi(self, locais, padrao=np.nan) -> np.ndarray:
+        """
+        Alíquota de ITBI (%) de cada local; municípios fora da tabela recebem
+        ``padrao`` (escalar ou array do mesmo tamanho).
+        """
+        resultado = _por_valor_unico(locais, lambda local: self.itbi.get(municipio(local or ""), np.nan))
+        return np.where(np.isnan(resultado), padrao, resultado)
+
+    def emolumento(self, valor: float) -> float:
+        """
+        Emolumento de registro de um imóvel (busca binária nas faixas).
+        """
+        faixa = min(bisect.bisect_left(self._limites_lista, valor), len(self._limites_lista) - 1)
+        return float(self.emolumentos[faixa])
+
+    def emolumentos_lotes(self, valores) -> np.ndarray:
+        """
+        Versão vetorizada de ``emolumento`` para um array de valores.
+        """
+        faixas = np.searchsorted(self.limites, np.asarray(valores, dtype=np.float64), side="left")
+        return self.emolumentos[np.minimum(faixas, len(self.limites) - 1)]
+
+    def perc_comissao(self, leiloeiros) -> np.ndarray:
+        """
+        Comissão (%) de cada leiloeiro; os desconhecidos ou em branco ficam
+        com a comissão do leiloeiro padrão.
+        """
+        padrao = self.comissoes.get(chave_coluna(LEILOEIRO_PADRAO), PERC_COMISSAO_LEILOEIRO)
+        return _por_valor_unico(leiloeiros, lambda nome: self.comissoes.get(chave_coluna(nome or ""), padrao))
+
+
+def carregar_tarifas(pasta=PASTA_DADOS) -> Tarifas:
+    """
+    Lê as três tabelas de ``pasta`` (itbi_municipios.csv, emolumentos_go.csv
+    e leiloeiros.csv).
+    """
+    pasta = Path(pasta)
+    itbi = _ler_tabela(pasta / "itbi_municipios.csv", ["perc_itbi"])
+    faixas = _ler_tabela(pasta / "emolumentos_go.csv", ["valor_ate", "emolumento"]).sort_values("valor_ate")
+    leiloeiros = _ler_tabela(pasta / "leiloeiros.csv", ["perc_comissao"])
+    return Tarifas(
+        itbi=dict(zip(itbi["municipio"].map(chave_coluna), itbi["perc_itbi"])),
+        limites=faixas["valor_ate"].to_numpy(),
+        emolumentos=faixas["emolumento"].to_numpy(),
+        comissoes=dict(zip(leiloeiros["leiloeiro"].map(chave_coluna), leiloeiros["perc_comissao"])),
+        leiloeiros=leiloeiros["leiloeiro"].str.strip().tolist(),
+    )
+
+
+def aplicar_tarifas(df: pd.DataFrame, tarifas: Tarifas, padroes: dict = None) -> pd.DataFrame:
+    """
+    Preenche pela tabela de tarifas as taxas que o portfólio (ver
+    ``nucleo.portfolio``) não informou; o que veio no arquivo prevalece. Leia
+    o arquivo com ``normalizar_portfolio(df, TAXAS_DA_TABELA)`` para que as
+    taxas ausentes fiquem em branco (NaN):
+
+    - ``perc_itbi`` em branco: alíquota do município em ``local_imovel``, ou
+      ``padroes["perc_itbi"]`` para municípios fora da tabela;
+    - ``perc_registro`` em branco: ``emolumentos`` (R$) pela faixa do lance,
+      custo fixo do registro no motor de custos, com ``perc_registro`` zerado
+      (o lance máximo é resolvido pelas faixas, ver ``calcular_lance_maximo``);
+    - ``perc_comissao`` pelo ``leiloeiro`` (coluna opcional).
+
+    ``padroes`` sobrescreve ``PADROES`` como em ``normalizar_portfolio``.
+    """
+    padroes = {**PADROES, **(padroes or {})}
+    resultado = df.copy()
+    valor_lance = resultado["valor_lance"].to_numpy(dtype=np.float64)
+    perc_itbi = resultado["perc_itbi"].to_numpy(dtype=np.float64)
+    resultado["perc_itbi"] = np.where(
+        np.isnan(perc_itbi), tarifas.perc_itbi(resultado["local_imovel"].to_numpy(), padroes["perc_itbi"]), perc_itbi)
+    perc_registro = resultado["perc_registro"].to_numpy(dtype=np.float64)
+    pela_tabela = np.isnan(perc_registro)
+    resultado["emolumentos"] = np.where(pela_tabela, tarifas.emolumentos_lotes(valor_lance), 0.0)
+    resultado["perc_registro"] = np.where(pela_tabela, 0.0, perc_registro)
+    leiloeiros = resultado["leiloeiro"] if "leiloeiro" in resultado else pd.Series("", index=resultado.index)
+    resultado["perc_comissao"] = tarifas.perc_comissao(leiloeiros.to_numpy())
+    return resultado
@@ -0,0 +1,18 @@
+"""
+Normalização de textos (nomes de colunas, cidades, bairros) para comparação.
+"""
+import unicodedata
+
+
+def remover_acentos(texto: str) -> str:
+    """
+    Remove acentos e cedilhas: "Goiânia" -> "Goiania".
+    """
+    return unicodedata.normalize("NFKD", str(texto)).encode("ascii", "ignore").decode("ascii")
+
+
+def chave_coluna(nome: str) -> str:
+    """
+    Normaliza um nome de coluna: sem acentos, minúsculo, espaços viram "_".
+    """
+    return "_".join(remover_acentos(nome).strip().lower().replace("/", " ").split())
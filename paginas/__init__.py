@@ -0,0 +1,9 @@
+"""
+Páginas do aplicativo (checklist simples, checklist ultra completo,
+portfólio de lotes e comparação de lotes), abertas pelo ponto de entrada
+``app.py``.
+
+Cada módulo expõe ``main()`` e só é importado quando a página é visitada
+pela primeira vez no processo. Conexões e índices usados por mais de uma
+página ficam em ``recursos``.
+"""
@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from nucleo.comparacao import (CAMPOS_DERIVADOS, CAMPOS_ENTRADA, LOTES_MAXIMOS, Comparacao, alteracoes)
+from nucleo.retorno import PERC_CUSTOS_VENDA, PRAZO_VENDA_MESES, TAXA_DESCONTO_ANUAL
+from paginas.recursos import abrir_banco_checklists
+
+ROTULOS_ENTRADA = {
+    "valor_lance": "Lance (R$)",
+    "perc_comissao": "Comissão (%)",
+    "perc_itbi": "ITBI (%)",
+    "perc_registro": "Registro (%)",
+    "debitos_passados": "Dívidas passadas (R$)",
+    "valor_acordo": "Acordo com ocupante (R$)",
+    "custo_reforma": "Reforma (R$)",
+    "honorarios_adv": "Honorários (R$)",
+    "seguro_imovel": "Seguro (R$)",
+    "valor_mercado": "Valor de mercado (R$)",
+}
+
+ROTULOS_DERIVADOS = {
+    "comissao_leiloeiro": "Comissão do leiloeiro (R$)",
+    "itbi": "ITBI (R$)",
+    "registro_cartorio": "Registro (R$)",
+    "custo_aquisicao_bruto": "Subtotal de aquisição (R$)",
+    "investimento_total": "Compra + reforma (R$)",
+    "custo_total_avancado": "Custo total (R$)",
+    "margem_mercado": "Margem sobre o mercado (R$)",
+    "lucro_revenda": "Lucro na revenda (R$)",
+    "roi": "ROI no período (%)",
+    "vpl": "VPL (R$)",
+    "tir_anual": "TIR ao ano (%)",
+}
+
+# Campos em fração (0,12 = 12%), mostrados em %; a soma deles não faz sentido
+_PERCENTUAIS = ["roi", "tir_anual"]
+
+
+def _nova_comparacao(lotes, nomes):
+    """
+    Troca a comparação da sessão; a versão nova zera as edições da tabela.
+    """
+    st.session_state["_comparacao"] = Comparacao(lotes, nomes)
+    st.session_state["_comparacao_base"] = _com_rotulos(st.session_state["_comparacao"].tabela_entradas(),
+                                                        ROTULOS_ENTRADA)
+    st.session_state["_comparacao_versao"] = st.session_state.get("_comparacao_versao", 0) + 1
+
+
+def _com_rotulos(tabela, rotulos):
+    tabela = tabela.copy()
+    tabela.index = [rotulos[campo] for campo in tabela.index]
+    return tabela
+
+
+def origem_lotes():
+    """
+    Barra lateral: quantidade de lotes em branco ou checklists salvos de um
+    analista. Só recria a comparação quando a origem muda.
+    """
+    st.sidebar.subheader("Lotes")
+    origem = st.sidebar.radio("Origem:", ["Lotes em branco", "Checklists salvos"])
+    if origem == "Lotes em branco":
+        n_lotes = st.sidebar.number_input("Número de lotes", min_value=2, max_value=LOTES_MAXIMOS, value=3, step=1)
+        comparacao = st.session_state.get("_comparacao")
+        if comparacao is None or len(comparacao) != n_lotes:
+            # Mantém os lotes já preenchidos e completa (ou corta) até n_lotes
+            entradas = comparacao.tabela_entradas().to_dict() if comparacao is not None else {}
+            lotes = list(entradas.values())[:n_lotes]
+            lotes += [{} for _ in range(n_lotes - len(lotes))]
+            _nova_comparacao(lotes, [f"Lote {i + 1}" for i in range(n_lotes)])
+        return
+
+    analista = st.sidebar.text_input("Analista:")
+    if not analista.strip():
+        st.sidebar.caption("Informe o analista para listar os checklists salvos.")
+        return
+    salvos = abrir_banco_checklists().carregar_todos(analista.strip())
+    escolhidos = st.sidebar.multiselect("Lotes salvos:", salvos["lote"].tolist(), max_selections=LOTES_MAXIMOS)
+    if st.sidebar.button("Comparar lotes salvos", disabled=not escolhidos):
+        selecionados = salvos.set_index("lote").loc[escolhidos]
+        lotes = [{c: v for c, v in linha.items() if c in CAMPOS_ENTRADA and pd.notna(v)}
+                 for linha in selecionados.to_dict(orient="records")]
+        _nova_comparacao(lotes, escolhidos)
+
+
+def main():
+    st.set_page_config(page_title="Comparação de Lotes - Leilão de Imóveis", layout="wide")
+    st.title("Comparação de Lotes Lado a Lado")
+
+    st.write("""
+    Cada coluna é um lote. Edite as entradas na primeira tabela: só o lote alterado é recalculado,
+    e o resumo é atualizado apenas nas linhas que dependem do campo editado.
+    """)
+
+    origem_lotes()
+    comparacao = st.session_state.get("_comparacao")
+    if comparacao is None:
+        st.info("Escolha os lotes na barra lateral para começar a comparação.")
+        return
+
+    st.sidebar.subheader("Revenda")
+    prazo_venda = st.sidebar.number_input(
+        "Prazo até a venda (meses)", min_value=1, max_value=120, value=PRAZO_VENDA_MESES, step=1,
+    )
+    perc_custos_venda = st.sidebar.number_input(
+        "Custos de venda (% do preço)", min_value=0.0, max_value=20.0, value=PERC_CUSTOS_VENDA,
+        step=0.5, format="%.1f",
+    )
+    custo_mensal = st.sidebar.number_input(
+        "Manutenção até a venda (R$/mês por lote)", min_value=0.0, step=100.0, format="%.2f",
+    )
+    taxa_desconto_anual = st.sidebar.number_input(
+        "Custo de oportunidade (% ao ano)", min_value=0.0, max_value=50.0, value=TAXA_DESCONTO_ANUAL,
+        step=0.5, format="%.2f",
+    )
+    recalculos = comparacao.recalculos
+    comparacao.definir_parametros(meses=prazo_venda, perc_custos_venda=perc_custos_venda,
+                                  custo_mensal=custo_mensal, taxa_desconto_anual=taxa_desconto_anual)
+
+    st.subheader("Entradas")
+    # A tabela recebe sempre a mesma base; as edições acumuladas voltam no
+    # resultado e só as células que mudaram desde a última execução são aplicadas
+    editado = st.data_editor(
+        st.session_state["_comparacao_base"],
+        column_config={nome: st.column_config.NumberColumn(nome, min_value=0.0, format="%.2f")
+                       for nome in comparacao.nomes},
+        key=f"comparacao_{st.session_state['_comparacao_versao']}",
+        width="stretch",
+    ).fillna(0.0)
+    for indice, campo, valor in alteracoes(comparacao.tabela_entradas(), editado):
+        comparacao.alterar(indice, campo, valor)
+
+    derivados = comparacao.tabela_derivados()
+    derivados.loc[_PERCENTUAIS] *= 100
+    st.subheader("Custos e retorno")
+    st.dataframe(
+        _com_rotulos(derivados, ROTULOS_DERIVADOS),
+        column_config={nome: st.column_config.NumberColumn(nome, format="%.2f") for nome in comparacao.nomes},
+        width="stretch",
+    )
+
+    resumo = comparacao.tabela_resumo()
+    resumo.loc[_PERCENTUAIS, ["menor", "maior"]] *= 100
+    resumo.loc[_PERCENTUAIS, "soma"] = np.nan
+    st.subheader("Resumo")
+    st.dataframe(
+        _com_rotulos(resumo, ROTULOS_DERIVADOS).reindex([ROTULOS_DERIVADOS[c] for c in CAMPOS_DERIVADOS]),
+        column_config={
+            "soma": st.column_config.NumberColumn("Soma", format="%.2f"),
+            "menor": st.column_config.NumberColumn("Menor", format="%.2f"),
+            "maior": st.column_config.NumberColumn("Maior", format="%.2f"),
+            "melhor": st.column_config.TextColumn("Melhor lote"),
+        },
+        width="stretch",
+    )
+    st.caption(f"{len(comparacao)} lotes; nesta interação, {comparacao.recalculos - recalculos} "
+               f"recálculo(s) de lote.")
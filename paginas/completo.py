@@ -0,0 +1,1559 @@
+import streamlit as st
+import altair as alt
+import pandas as pd
+import contextlib
+import datetime
+import io
+import json
+import math
+from typing import NamedTuple
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from nucleo.custos import PERC_COMISSAO_LEILOEIRO, modelo_custos
+from nucleo.exportacao import FORMATOS, exportar_para_download, lote_para_tabela
+from nucleo.financiamento import (PRAZO_MAXIMO_MESES, calcular_entrada_financiamento, tabela_amortizacao,
+                                   valor_presente)
+from nucleo.formatacao import format_brl, format_brl_array
+from nucleo.instrumentacao import (ATIVADA as INSTRUMENTACAO_ATIVADA, CONTAR_ELEMENTOS, Medidor, MedidorNulo,
+                                   resumo_blocos)
+from nucleo.localidades import Localidades, carregar_localidades
+from nucleo.parcelamento import PARCELAS_MAXIMAS, PERC_ENTRADA_MINIMA, carregar_indice, cronograma_cpc895
+from nucleo.pdf import pdf_relatorio
+from nucleo.portfolio import arredondar_custos
+from nucleo.relatorio import montar_relatorio
+from nucleo.retorno import PERC_CUSTOS_VENDA, PRAZO_VENDA_MESES, TAXA_DESCONTO_ANUAL
+from nucleo.sensibilidade import faixa_lances, grade_sensibilidade, tabela_sensibilidade
+from nucleo.tarifas import municipio
+from paginas.recursos import abrir_banco_checklists, carregar_tabela_tarifas
+
+# ---------------------------------------------------------------------------
+# Grade de sensibilidade (ITBI x Registro x Lance), guardada em cache pelas
+# demais entradas: mover os sliders de ITBI/registro não recalcula a grade.
+# ---------------------------------------------------------------------------
+@st.cache_data(max_entries=256, show_spinner=False)
+def grade_sensibilidade_cache(valor_lance, debitos_passados, valor_acordo, custo_reforma,
+                              honorarios_adv, seguro_imovel):
+    lances = faixa_lances(valor_lance)
+    grade = grade_sensibilidade(
+        lances,
+        debitos_passados=debitos_passados,
+        valor_acordo=valor_acordo,
+        custo_reforma=custo_reforma,
+        honorarios_adv=honorarios_adv,
+        seguro_imovel=seguro_imovel,
+    )
+    tabela = tabela_sensibilidade(lances, grade)
+    tabela["custo_formatado"] = ["R$ " + v for v in format_brl_array(tabela["custo_total_avancado"].to_numpy())]
+    tabela["lance_formatado"] = tabela["valor_lance"].map(dict(zip(lances, format_brl_array(lances))))
+    return tabela
+
+# ---------------------------------------------------------------------------
+# Relatório final montado em um único documento Markdown, guardado em cache
+# pelos valores do checklist. A chave é o JSON dos valores: o hash de uma
+# string sai bem mais barato que o de um dicionário aninhado.
+# ---------------------------------------------------------------------------
+@st.cache_data(max_entries=256, show_spinner=False)
+def relatorio_cache(dados_json):
+    return montar_relatorio(json.loads(dados_json))
+
+def relatorio_pdf(documento):
+    """
+    PDF do relatório, gerado só quando o usuário clica em baixar.
+    """
+    destino = io.BytesIO()
+    pdf_relatorio(documento, destino)
+    return destino.getvalue()
+
+@st.dialog("Relatório Completo", width="large")
+def relatorio_completo(documento, custo_total_avancado):
+    """
+    Relatório final em uma janela sobre o checklist. A janela fecha antes de
+    qualquer outra mudança na página, então nunca mostra custos antigos
+    depois de uma reexecução só da seção de custos.
+    """
+    # O relatório inteiro vai ao navegador em um único elemento
+    st.markdown(documento)
+
+    st.success(f"""
+    **Checklist concluído**!  
+    Você finalizou todas as etapas do roteiro de compra de imóvel em leilão.  
+    Caso precise de suporte jurídico, consulte um advogado especializado.  
+    **Valor Final c/ Honorários e Seguro**: R$ {format_brl(custo_total_avancado)}
+    """)
+    st.download_button(
+        "Baixar relatório em PDF",
+        data=lambda: relatorio_pdf(documento),
+        file_name=f"relatorio_leilao_{datetime.date.today():%Y%m%d}.pdf",
+        mime="application/pdf",
+        on_click="ignore",
+        help="Mesmo conteúdo do relatório acima, pronto para imprimir ou arquivar."
+    )
+
+def grafico_calor(tabela, eixo_x, eixo_y, titulo_x, titulo_y):
+    """
+    Mapa de calor do custo total; o valor exato aparece ao passar o mouse.
+    """
+    return alt.Chart(tabela).mark_rect().encode(
+        x=alt.X(f"{eixo_x}:O", title=titulo_x),
+        y=alt.Y(f"{eixo_y}:O", title=titulo_y, sort="descending"),
+        color=alt.Color("custo_total_avancado:Q", title="Custo total (R$)", scale=alt.Scale(scheme="orangered")),
+        tooltip=[alt.Tooltip(f"{eixo_x}:O", title=titulo_x), alt.Tooltip(f"{eixo_y}:O", title=titulo_y),
+                 alt.Tooltip("custo_formatado:N", title="Custo total")],
+    )
+
+# ---------------------------------------------------------------------------
+# Instrumentação opcional (LEILAO_INSTRUMENTACAO=1): tempo por PASSO em cada
+# reexecução, no log JSONL e em um painel na barra lateral; elementos por
+# PASSO só com LEILAO_INSTRUMENTACAO_ELEMENTOS=1 (depuração).
+# ---------------------------------------------------------------------------
+class _EnvioContado:
+    """
+    Envolve o envio de mensagens da sessão contando os elementos (deltas).
+    """
+
+    def __init__(self, destino):
+        self.destino = destino
+        self.elementos = 0
+
+    def __call__(self, msg):
+        if msg.HasField("delta"):
+            self.elementos += 1
+        return self.destino(msg)
+
+@contextlib.contextmanager
+def medicao(escopo="completa"):
+    """
+    Medidor de uma reexecução. Só com a contagem de elementos ligada (opção
+    de depuração) o envio de mensagens da sessão (``_enqueue``, interno do
+    Streamlit) é envolvido para contá-los, e o original volta no ``finally``,
+    mesmo quando a execução é interrompida (st.rerun, st.stop ou erro). Se
+    uma versão do Streamlit não tiver esse envio, só o tempo é medido.
+    """
+    ctx = get_script_run_ctx() if CONTAR_ELEMENTOS else None
+    if getattr(ctx, "_enqueue", None) is None:
+        yield Medidor("completo", escopo) if INSTRUMENTACAO_ATIVADA else MedidorNulo()
+        return
+    original = ctx._enqueue
+    envio = ctx._enqueue = _EnvioContado(original)
+    try:
+        yield Medidor("completo", escopo, lambda: envio.elementos)
+    finally:
+        ctx._enqueue = original
+
+def painel_medicao(registro):
+    """
+    Painel da barra lateral com a última reexecução completa e o histórico
+    da sessão (inclusive as reexecuções só da seção de custos).
+    """
+    historico = st.session_state.setdefault("_instrumentacao", [])
+    historico.append(registro)
+    with st.sidebar.expander("Instrumentação (tempo por PASSO)"):
+        elementos = f", {registro['elementos']} elementos" if CONTAR_ELEMENTOS else ""
+        st.write(f"**Última reexecução:** {registro['total_ms']:.1f} ms{elementos}")
+        ocultas = [] if CONTAR_ELEMENTOS else ["elementos"]
+        blocos = pd.DataFrame.from_dict(registro["blocos"], orient="index").drop(columns=ocultas)
+        st.dataframe(blocos.sort_values("ms", ascending=False), width="stretch")
+        st.write(f"**Sessão:** {len(historico)} reexecuções (p50/p95 por bloco)")
+        st.dataframe(resumo_blocos(historico).drop(columns=["versao", "script"] + ocultas).round(1),
+                     hide_index=True, width="stretch")
+
+# ---------------------------------------------------------------------------
+# Checklist salvo por analista e lote (nucleo.estado). As chaves dos widgets
+# são os nomes das variáveis; analista e lote também ficam na URL, então
+# recarregar a página ou voltar depois de a sessão expirar restaura tudo em
+# uma leitura.
+# ---------------------------------------------------------------------------
+CAMPOS_CHECKLIST = (
+    "nome_comprador", "objetivo", "valor_orcamento_max", "verificou_financiamento",
+    "local_imovel", "tipo_imovel", "visitou", "conversou_corretores", "valor_mercado", "verificou_averbacoes",
+    "tipo_leilao", "edital_lido", "matricula_conf", "check_notif", "verificou_processos",
+    "ocupado", "acordo_amigavel", "valor_acordo", "verificou_locacao",
+    "cadastro_feito", "verifica_data_leilao",
+    "valor_lance", "forma_pagamento", "taxa_desconto_anual", "perc_entrada_financiamento", "sistema_amortizacao",
+    "taxa_juros_anual", "prazo_financiamento", "tr_mensal", "taxa_seguro_mensal", "tarifa_mensal",
+    "perc_entrada_cpc895", "n_parcelas", "correcao_mensal", "usar_tarifas", "leiloeiro", "perc_comissao",
+    "perc_itbi", "perc_registro", "registro_tabela", "emolumentos", "debitos_passados",
+    "depositou_valor", "pagou_comissao", "judicial_homologacao", "extrajudicial_assinou", "pagou_itbi",
+    "registrou_imovel", "acao_posse",
+    "custo_reforma", "prazo_venda", "perc_custos_venda", "custo_mensal_manutencao", "taxa_desconto_anual_vista",
+    "honorarios_adv", "seguro_imovel",
+)
+
+@st.cache_resource
+def carregar_indice_localidades() -> Localidades:
+    """
+    Índice da lista parcial de municípios e bairros de GO (ver
+    ``nucleo.localidades``), montado uma vez e compartilhado (só leitura)
+    entre sessões.
+    """
+    return carregar_localidades()
+
+def _usar_sugestao_local():
+    if st.session_state.get("_sugestao_local"):
+        st.session_state["local_imovel"] = st.session_state["_sugestao_local"]
+    st.session_state["_sugestao_local"] = None
+
+def sugestoes_local(local_imovel):
+    """
+    Sugestões para o campo de cidade/bairro, com a grafia da lista. Se o
+    texto já é um nome da lista, escrito igual, não há o que sugerir.
+    """
+    if not local_imovel.strip():
+        return []
+    indice = carregar_indice_localidades()
+    canonico = indice.canonico(local_imovel)
+    if canonico is not None:
+        return [] if canonico == local_imovel.strip() else [canonico]
+    return indice.sugerir(local_imovel)
+
+def _identificacao():
+    return st.session_state.get("_analista", "").strip(), st.session_state.get("_lote", "").strip()
+
+def abrir_checklist():
+    """
+    Troca o checklist da sessão pelo salvo para o analista/lote informados
+    (ou pelos valores padrão, se não houver). Roda antes dos widgets.
+    """
+    analista, lote = _identificacao()
+    if analista and lote:
+        st.query_params.update(analista=analista, lote=lote)
+    else:
+        # Só os parâmetros do checklist: os demais da URL continuam
+        for parametro in ("analista", "lote"):
+            st.query_params.pop(parametro, None)
+    for campo in CAMPOS_CHECKLIST:
+        st.session_state.pop(campo, None)
+    estado = abrir_banco_checklists().carregar(analista, lote) if analista and lote else None
+    if estado:
+        st.session_state.update({c: v for c, v in estado.items() if c in CAMPOS_CHECKLIST})
+    st.session_state["_checklist_salvo"] = estado
+    # O ITBI salvo já é o escolhido para o município do lote: a tabela de
+    # tarifas só volta a preenchê-lo se o município mudar
+    st.session_state["_itbi_municipio"] = municipio(estado.get("local_imovel", "")) if estado else None
+
+def _retomar_lote():
+    st.session_state["_lote"] = st.session_state.pop("_lote_salvo")
+    abrir_checklist()
+
+def painel_checklist_salvo():
+    """
+    Identificação do checklist na barra lateral. Na primeira execução da
+    sessão, analista e lote vêm da URL e o checklist salvo é restaurado.
+    """
+    if "_analista" not in st.session_state:
+        st.session_state["_analista"] = st.query_params.get("analista", "")
+        st.session_state["_lote"] = st.query_params.get("lote", "")
+        abrir_checklist()
+
+    st.sidebar.subheader("Checklist Salvo")
+    st.sidebar.text_input("Analista:", key="_analista", on_change=abrir_checklist)
+    st.sidebar.text_input("Lote (nº do imóvel ou apelido):", key="_lote", on_change=abrir_checklist,
+                          help="As respostas são salvas automaticamente para este analista e lote.")
+    analista, lote = _identificacao()
+    if analista:
+        salvos = [l for l in abrir_banco_checklists().lotes(analista) if l != lote]
+        if salvos:
+            st.sidebar.selectbox("Retomar lote salvo:", salvos, index=None, key="_lote_salvo",
+                                 placeholder=f"{len(salvos)} lote(s) salvo(s)", on_change=_retomar_lote)
+
+def salvar_checklist():
+    """
+    Grava o checklist da sessão se ele mudou desde a última gravação.
+    """
+    analista, lote = _identificacao()
+    if not (analista and lote):
+        return
+    estado = {c: st.session_state[c] for c in CAMPOS_CHECKLIST if c in st.session_state}
+    if estado != st.session_state.get("_checklist_salvo"):
+        abrir_banco_checklists().salvar(analista, lote, estado)
+        st.session_state["_checklist_salvo"] = estado
+
+def modelo_sessao():
+    """
+    Modelo de custos da sessão (grafo de dependências), mantido entre as
+    reexecuções para que só o que mudou seja recalculado.
+    """
+    if "_modelo_custos" not in st.session_state:
+        st.session_state["_modelo_custos"] = modelo_custos()
+    return st.session_state["_modelo_custos"]
+
+def _usar_comissao_tabela():
+    leiloeiro = st.session_state.get("leiloeiro")
+    if leiloeiro:
+        st.session_state["perc_comissao"] = float(carregar_tabela_tarifas().perc_comissao([leiloeiro])[0])
+
+# ---------------------------------------------------------------------------
+# Resultado da seção de custos
+# ---------------------------------------------------------------------------
+class CalculoCustos(NamedTuple):
+    """
+    Valores da seção de custos usados fora dela: no relatório final e na
+    exportação do 11.3. ``financiamento`` e ``parcelamento`` são os resumos
+    do relatório (None quando a forma de pagamento não os tem).
+    """
+    forma_pagamento: str
+    valor_lance: float
+    perc_entrada: float
+    valor_entrada: float
+    valor_financiado: float
+    valor_pago: float
+    taxa_desconto_anual: float
+    financiamento: dict
+    parcelamento: dict
+    perc_comissao: float
+    comissao_leiloeiro: float
+    perc_itbi: float
+    itbi: float
+    perc_registro: float
+    emolumentos: float
+    registro_cartorio: float
+    debitos_passados: float
+    valor_acordo: float
+    custo_aquisicao_bruto: float
+    custo_reforma: float
+    investimento_total: float
+    honorarios_adv: float
+    seguro_imovel: float
+    custo_total_avancado: float
+    valor_orcamento_max: float
+    lance_max_orcamento: float
+    valor_mercado: float
+    prazo_venda: int
+    retorno: object
+    depositou_valor: bool
+    pagou_comissao: bool
+    judicial_homologacao: bool
+    extrajudicial_assinou: bool
+    pagou_itbi: bool
+    registrou_imovel: bool
+    acao_posse: bool
+
+# ---------------------------------------------------------------------------
+# PASSOS 6 a 10 (forma de pagamento, custos, reforma, honorários e totais).
+# Como fragmento, mexer em um widget desta seção reexecuta só a seção, e não
+# todo o checklist; as entradas dos PASSOS anteriores chegam como argumentos
+# (elas disparam a reexecução completa) e os valores voltam para o relatório.
+# ---------------------------------------------------------------------------
+@st.fragment
+def secao_custos(local_imovel, valor_mercado, valor_acordo, valor_orcamento_max, medidor):
+    # Na reexecução só do fragmento, a medição do script inteiro já terminou
+    if not (INSTRUMENTACAO_ATIVADA and medidor.finalizado):
+        return _secao_custos(local_imovel, valor_mercado, valor_acordo, valor_orcamento_max, medidor)
+    with medicao("fragmento") as medidor:
+        calculo = _secao_custos(local_imovel, valor_mercado, valor_acordo, valor_orcamento_max, medidor)
+        st.session_state.setdefault("_instrumentacao", []).append(medidor.finalizar())
+    return calculo
+
+def _secao_custos(local_imovel, valor_mercado, valor_acordo, valor_orcamento_max, medidor):
+    modelo = modelo_sessao()
+
+    # ================================================================================
+    # PASSO 6: FORMA DE PAGAMENTO E CÁLCULOS DE CUSTOS
+    # ================================================================================
+    medidor.marco("PASSO 6")
+    st.header("PASSO 6: Forma de Pagamento e Cálculos de Custos Principais")
+
+    st.write("""
+    **6.1 - Valor de Arrematação (Lance)**  
+    Informe abaixo quanto você imagina que o imóvel deve ser arrematado no leilão.
+    """)
+
+    valor_lance = st.number_input(
+        "Valor estimado de arrematação (R$):",
+        min_value=0.0, step=10000.0, format="%.2f",
+        key="valor_lance"
+    )
+
+    st.write("""
+    **6.2 - Forma de Pagamento**  
+    - **À Vista**  
+    - **Financiamento Caixa** (extrajudicial, ou se o leilão permitir)  
+    - **Parcelamento Judicial** (CPC art. 895: 25% + até 30 parcelas)
+    """)
+
+    forma_pagamento = st.radio(
+        "Escolha a forma de pagamento:",
+        ["À Vista", "Financiamento Caixa", "Parcelamento Judicial (CPC 895)"],
+        help="Verifique no edital se permitem financiamento ou parcelamento.",
+        key="forma_pagamento"
+    )
+
+    # Caso financiamento, perguntar sobre a entrada
+    perc_entrada = 0.0
+    valor_entrada = 0.0
+    valor_financiado = 0.0
+    tabela_financiamento = None
+    cronograma_judicial = None
+    # Pagamento a prazo: valor presente do que será pago, para comparar com à vista
+    valor_pago = valor_lance
+    if forma_pagamento != "À Vista":
+        st.session_state.setdefault("taxa_desconto_anual", 10.0)
+        taxa_desconto_anual = st.number_input(
+            "Custo de oportunidade do dinheiro (% ao ano)",
+            min_value=0.0, max_value=50.0, step=0.5, format="%.2f",
+            help="Taxa usada para trazer as parcelas a valor presente (ex.: rendimento de um CDB).",
+            key="taxa_desconto_anual"
+        )
+    if forma_pagamento == "Financiamento Caixa":
+        st.write("""
+        **Entrada (%)**  
+        Geralmente 20% a 30% do valor. O resto vira financiamento. Pode usar FGTS se o imóvel 
+        e o comprador atenderem às regras (ex.: uso para moradia própria).
+        """)
+        st.session_state.setdefault("perc_entrada_financiamento", 25.0)
+        perc_entrada = st.slider(
+            "Percentual de entrada (Financiamento) (%)",
+            5.0, 90.0, step=5.0,
+            help="Selecione a % de entrada. Ex.: 25% do lance.",
+            key="perc_entrada_financiamento"
+        )
+        modelo.definir(valor_lance=valor_lance, perc_entrada=perc_entrada)
+        valor_entrada, valor_financiado = float(modelo["valor_entrada"]), float(modelo["valor_financiado"])
+
+        st.write("""
+        **Simulação do Financiamento (SAC ou PRICE)**  
+        - **SAC**: amortização constante, prestações começam maiores e caem com o tempo.  
+        - **PRICE**: prestações mais estáveis, porém com mais juros no total.  
+        A TR corrige o saldo devedor todo mês; o seguro (MIP/DFI) incide sobre o saldo.
+        """)
+        sistema_amortizacao = st.radio(
+            "Sistema de amortização:",
+            ["SAC", "PRICE"],
+            horizontal=True,
+            help="A Caixa oferece os dois sistemas na maioria das linhas habitacionais.",
+            key="sistema_amortizacao"
+        )
+        st.session_state.setdefault("taxa_juros_anual", 11.5)
+        taxa_juros_anual = st.number_input(
+            "Taxa de juros efetiva anual (%)",
+            min_value=0.0, max_value=30.0, step=0.1, format="%.2f",
+            help="Consulte a taxa da sua linha de crédito (SBPE, Pró-Cotista, etc.).",
+            key="taxa_juros_anual"
+        )
+        st.session_state.setdefault("prazo_financiamento", 360)
+        prazo_financiamento = st.slider(
+            "Prazo do financiamento (meses)",
+            12, PRAZO_MAXIMO_MESES, step=12,
+            help="A Caixa financia em até 420 meses (35 anos).",
+            key="prazo_financiamento"
+        )
+        col_tr, col_seguro, col_tarifa = st.columns(3)
+        st.session_state.setdefault("tr_mensal", 0.0)
+        tr_mensal = col_tr.number_input(
+            "TR mensal (%)", min_value=0.0, max_value=2.0, step=0.01, format="%.4f",
+            help="Taxa Referencial projetada ao mês.", key="tr_mensal"
+        )
+        st.session_state.setdefault("taxa_seguro_mensal", 0.03)
+        taxa_seguro_mensal = col_seguro.number_input(
+            "Seguro MIP/DFI (% do saldo ao mês)", min_value=0.0, max_value=1.0,
+            step=0.01, format="%.4f", key="taxa_seguro_mensal"
+        )
+        st.session_state.setdefault("tarifa_mensal", 25.0)
+        tarifa_mensal = col_tarifa.number_input(
+            "Tarifa de administração (R$/mês)", min_value=0.0, max_value=500.0,
+            step=5.0, format="%.2f", key="tarifa_mensal"
+        )
+
+        if valor_financiado > 0:
+            tabela_financiamento = tabela_amortizacao(
+                valor_financiado, taxa_juros_anual, prazo_financiamento, sistema_amortizacao,
+                tr_mensal=tr_mensal, taxa_seguro_mensal=taxa_seguro_mensal, tarifa_mensal=tarifa_mensal,
+            )
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("1ª prestação", f"R$ {format_brl(float(tabela_financiamento.primeira_prestacao[0]))}")
+            col2.metric("Última prestação", f"R$ {format_brl(float(tabela_financiamento.ultima_prestacao[0]))}")
+            col3.metric("Total pago", f"R$ {format_brl(float(tabela_financiamento.total_pago[0]))}")
+            col4.metric("Total de juros", f"R$ {format_brl(float(tabela_financiamento.total_juros[0]))}")
+            valor_pago = valor_entrada + float(valor_presente(tabela_financiamento.prestacao[0], taxa_desconto_anual))
+            st.write(f"Valor presente do pagamento (entrada + prestações a {taxa_desconto_anual}% a.a.): "
+                     f"**R$ {format_brl(valor_pago)}**")
+            st.line_chart(pd.DataFrame(
+                {
+                    "Prestação": tabela_financiamento.prestacao[0],
+                    "Amortização": tabela_financiamento.amortizacao[0],
+                    "Juros": tabela_financiamento.juros[0],
+                },
+                index=pd.RangeIndex(1, prazo_financiamento + 1, name="Mês"),
+            ))
+
+            with st.expander("Comparar cenários de financiamento (entrada, taxa, prazo, sistema)"):
+                cenarios = st.data_editor(
+                    pd.DataFrame({
+                        "Entrada (%)": [perc_entrada, perc_entrada, 30.0, 30.0],
+                        "Taxa anual (%)": [taxa_juros_anual] * 4,
+                        "Prazo (meses)": [prazo_financiamento, prazo_financiamento, 240, 240],
+                        "Sistema": ["SAC", "PRICE", "SAC", "PRICE"],
+                    }),
+                    column_config={
+                        "Sistema": st.column_config.SelectboxColumn(options=["SAC", "PRICE"], required=True),
+                        "Prazo (meses)": st.column_config.NumberColumn(min_value=1, max_value=PRAZO_MAXIMO_MESES, step=1),
+                    },
+                    num_rows="dynamic",
+                    hide_index=True,
+                ).dropna()
+                if len(cenarios):
+                    _, financiados = calcular_entrada_financiamento(valor_lance, cenarios["Entrada (%)"].to_numpy())
+                    comparacao = tabela_amortizacao(
+                        financiados, cenarios["Taxa anual (%)"].to_numpy(),
+                        cenarios["Prazo (meses)"].to_numpy().astype(int), cenarios["Sistema"].to_numpy(),
+                        tr_mensal=tr_mensal, taxa_seguro_mensal=taxa_seguro_mensal, tarifa_mensal=tarifa_mensal,
+                    )
+                    resultado_cenarios = cenarios.assign(**{
+                        "Valor financiado (R$)": financiados,
+                        "1ª prestação (R$)": comparacao.primeira_prestacao,
+                        "Última prestação (R$)": comparacao.ultima_prestacao,
+                        "Total pago (R$)": comparacao.total_pago,
+                        "Total de juros (R$)": comparacao.total_juros,
+                    })
+                    st.dataframe(
+                        resultado_cenarios,
+                        column_config={c: st.column_config.NumberColumn(format="%.2f")
+                                       for c in resultado_cenarios.columns if c.endswith("(R$)")},
+                        hide_index=True,
+                    )
+
+    if forma_pagamento == "Parcelamento Judicial (CPC 895)":
+        st.write("""
+        **Parcelamento Judicial (CPC art. 895)**  
+        Entrada de no mínimo 25% do lance e o saldo em até 30 parcelas mensais,
+        corrigidas pelo índice indicado no edital (geralmente IPCA ou INPC).
+        """)
+        col_entrada, col_parcelas = st.columns(2)
+        st.session_state.setdefault("perc_entrada_cpc895", PERC_ENTRADA_MINIMA)
+        perc_entrada = col_entrada.slider(
+            "Percentual de entrada (CPC 895) (%)",
+            PERC_ENTRADA_MINIMA, 90.0, step=5.0,
+            help="O art. 895 exige pelo menos 25% à vista.",
+            key="perc_entrada_cpc895"
+        )
+        st.session_state.setdefault("n_parcelas", PARCELAS_MAXIMAS)
+        n_parcelas = col_parcelas.slider(
+            "Número de parcelas", 1, PARCELAS_MAXIMAS, step=1,
+            key="n_parcelas"
+        )
+        arquivo_indice = st.file_uploader(
+            "Tabela do índice de correção (CSV com mês e variação mensal em %) - opcional",
+            type=["csv"],
+            help="Ex.: série do IPCA. Meses além da tabela usam a média da série."
+        )
+        indice = None
+        if arquivo_indice is not None:
+            try:
+                indice = carregar_indice(arquivo_indice)
+                st.caption(f"{len(indice)} meses lidos; média de {indice.mean() * 100:.3f}% ao mês.")
+            except ValueError as erro:
+                st.error(f"Não foi possível ler a tabela do índice: {erro}")
+        if indice is None:
+            st.session_state.setdefault("correcao_mensal", 0.4)
+            indice = st.number_input(
+                "Correção mensal projetada (%)",
+                min_value=0.0, max_value=5.0, step=0.05, format="%.2f",
+                help="Usada quando não há tabela do índice. Ex.: 0,4% ao mês ≈ 4,9% ao ano.",
+                key="correcao_mensal"
+            )
+
+        cronograma_judicial = cronograma_cpc895(valor_lance, perc_entrada, n_parcelas, indice, taxa_desconto_anual)
+        valor_entrada = float(cronograma_judicial.valor_entrada[0])
+        valor_pago = float(cronograma_judicial.valor_presente[0])
+        parcelas = cronograma_judicial.parcelas[0]
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Entrada", f"R$ {format_brl(valor_entrada)}")
+        col2.metric("1ª / última parcela", f"R$ {format_brl(float(parcelas[0]))}",
+                    delta=f"R$ {format_brl(float(parcelas[-1]))} ao final", delta_color="off")
+        col3.metric("Total pago", f"R$ {format_brl(float(cronograma_judicial.total_pago[0]))}")
+        col4.metric("Valor presente", f"R$ {format_brl(valor_pago)}")
+        st.bar_chart(pd.DataFrame(
+            {"Parcela corrigida": parcelas},
+            index=pd.RangeIndex(1, n_parcelas + 1, name="Mês"),
+        ))
+
+    st.write("""
+    **6.3 - Comissão do Leiloeiro (geralmente 5%)**  
+    A tabela de tarifas do projeto (nucleo/dados) sugere a comissão do leiloeiro, o ITBI do
+    município do PASSO 2 e os emolumentos de registro; os valores continuam editáveis para seguir
+    o edital, a prefeitura e o cartório.
+    """)
+    usar_tarifas = st.checkbox(
+        "Preencher comissão, ITBI e registro pela tabela de tarifas",
+        help="Valores ilustrativos: confira a tabela antes de usar em uma análise real.",
+        key="usar_tarifas"
+    )
+    tarifas = carregar_tabela_tarifas() if usar_tarifas else None
+    if usar_tarifas:
+        st.selectbox(
+            "Leiloeiro:", tarifas.leiloeiros, index=None, placeholder="Escolha o leiloeiro do edital",
+            on_change=_usar_comissao_tabela,
+            key="leiloeiro"
+        )
+    st.session_state.setdefault("perc_comissao", PERC_COMISSAO_LEILOEIRO)
+    perc_comissao = st.number_input(
+        "Comissão do leiloeiro (%)",
+        min_value=0.0, max_value=10.0, step=0.5, format="%.2f",
+        help="Confira no edital; a escolha do leiloeiro acima preenche este valor.",
+        key="perc_comissao"
+    )
+
+    st.write("""
+    **6.4 - ITBI** (em média 2% a 3% no município; alguns podem variar)
+    """)
+    if usar_tarifas:
+        municipio_lote = municipio(local_imovel)
+        perc_itbi_tabela = tarifas.itbi.get(municipio_lote)
+        if perc_itbi_tabela is None:
+            st.caption("Município fora da tabela de tarifas: informe o ITBI no slider.")
+        else:
+            # Só ao mudar de município (ou ligar a tabela); depois o slider é do usuário
+            if st.session_state.get("_itbi_municipio") != municipio_lote:
+                st.session_state["perc_itbi"] = min(max(float(perc_itbi_tabela), 1.0), 5.0)
+                st.session_state["_itbi_municipio"] = municipio_lote
+            st.caption(f"ITBI do município pela tabela: {perc_itbi_tabela:.2f}%".replace(".", ","))
+    else:
+        st.session_state["_itbi_municipio"] = None
+    st.session_state.setdefault("perc_itbi", 2.5)
+    perc_itbi = st.slider(
+        "Taxa de ITBI (%)",
+        1.0, 5.0, step=0.5,
+        help="Altere conforme a sua prefeitura, ex.: 2,5%.",
+        key="perc_itbi"
+    )
+
+    st.write("""
+    **6.5 - Registro em Cartório** (1% a 1,5% do valor)
+    """)
+    # Com a tabela, o registro é o emolumento da faixa do lance (valor fixo, não
+    # percentual); desmarcando, o usuário informa o valor cobrado pelo cartório
+    perc_registro = 0.0
+    emolumentos = 0.0
+    faixas_registro = None
+    if usar_tarifas:
+        st.session_state.setdefault("registro_tabela", True)
+        registro_tabela = st.checkbox(
+            "Registro pelos emolumentos da tabela (faixa do lance)",
+            help="Desmarque para informar o valor orçado no cartório.",
+            key="registro_tabela"
+        )
+        emolumento_tabela = tarifas.emolumento(valor_lance)
+        if registro_tabela:
+            emolumentos = emolumento_tabela
+            faixas_registro = tarifas
+            st.caption(f"Emolumentos pela tabela para este lance: R$ {format_brl(emolumento_tabela)}.")
+        else:
+            st.session_state.setdefault("emolumentos", emolumento_tabela)
+            emolumentos = st.number_input(
+                "Emolumentos de registro (R$)",
+                min_value=0.0, step=100.0, format="%.2f",
+                help=f"Pela tabela, para este lance: R$ {format_brl(emolumento_tabela)}.",
+                key="emolumentos"
+            )
+    else:
+        st.session_state.setdefault("perc_registro", 1.2)
+        perc_registro = st.slider(
+            "Porcentagem de registro em cartório (%)",
+            0.5, 2.0, step=0.1,
+            help="Ex.: 1,2% do valor do imóvel.",
+            key="perc_registro"
+        )
+
+    st.write("""
+    **6.6 - Dívidas passadas** (IPTU, condomínio, água, etc.)
+    """)
+    debitos_passados = st.number_input(
+        "Valor estimado de dívidas (R$)",
+        min_value=0.0, step=1000.0, format="%.2f",
+        help="Nem sempre o banco/leiloeiro paga essas dívidas. Verifique no edital.",
+        key="debitos_passados"
+    )
+
+    # Usamos valor_acordo definido acima (PASSO 4)
+    st.write("""
+    **6.7 - Somatório parcial** (Aquisição)
+    """)
+    # Os valores derivados (comissão, ITBI, registro e totais) são calculados
+    # pelo motor de custos ao final do PASSO 10, quando todas as entradas existem.
+
+    # ================================================================================
+    # PASSO 7: CHECAGENS PÓS-ARREMATE (PAGAMENTOS, ITBI, REGISTRO)
+    # ================================================================================
+
+    medidor.marco("PASSO 7")
+    st.header("PASSO 7: Checagens Pós-Arremate (Pagamento, ITBI, Registro, etc.)")
+
+    st.write("""  
+    **7.1 - Se você der o lance vencedor**:  
+     1) Deposite o valor (ou a entrada) no prazo do edital (24h, 48h, etc.)  
+     2) Pague a comissão do leiloeiro no prazo estabelecido  
+     3) Se judicial, aguarde a homologação do juiz e emissão do Auto/Carta de Arrematação  
+     4) Se extrajudicial (banco), assine o contrato de compra e venda ou escritura  
+
+    **Ações práticas para cada etapa:**  
+    - Verifique a conta bancária informada para o depósito do lance.  
+    - Envie o comprovante de pagamento ao leiloeiro (ou junte nos autos, se judicial).  
+    - Acompanhe o andamento do processo (judicial) ou contato com o banco (extrajudicial).  
+    - Se financiamento, continue com a documentação (análise de crédito, assinatura de contrato).  
+    """)
+
+    depositou_valor = st.checkbox(
+        "Depositei o valor/entrada no prazo (7.1.1)?",
+        help="Confirme que realizou o depósito (à vista ou entrada do financiamento) dentro do prazo.",
+        key="depositou_valor"
+    )
+    pagou_comissao = st.checkbox(
+        "Paguei a comissão do leiloeiro (7.1.2)?",
+        help="Normalmente 5% do lance, verifique prazo e conta específica do leiloeiro.",
+        key="pagou_comissao"
+    )
+    judicial_homologacao = st.checkbox(
+        "No caso de leilão judicial, aguardei homologação e recebi a Carta de Arrematação (7.1.3)?",
+        help="Marque se for judicial e já tiver cumprido essa etapa (aguardar juiz).",
+        key="judicial_homologacao"
+    )
+    extrajudicial_assinou = st.checkbox(
+        "No caso de leilão extrajudicial (banco), assinei contrato ou escritura (7.1.4)?",
+        help="Marque se for extrajudicial e tiver assinado com o banco/vendedor.",
+        key="extrajudicial_assinou"
+    )
+
+    st.write("""  
+    **7.2 - Pague o ITBI** na prefeitura para poder efetuar o registro.  
+    Apresente o comprovante no cartório.
+
+    Observações:  
+    - Verifique a guia de recolhimento do ITBI na prefeitura.  
+    - Após o pagamento, pegue o comprovante oficial para levar ao cartório.
+    """)
+    pagou_itbi = st.checkbox(
+        "Já paguei o ITBI e tenho o comprovante (7.2)?",
+        help="Sem esse comprovante, o cartório não efetua o registro no seu nome.",
+        key="pagou_itbi"
+    )
+
+    st.write("""  
+    **7.3 - Registre** a carta ou escritura no Cartório de Registro de Imóveis para oficializar a propriedade.  
+
+    Observações:  
+    - Para judicial: use a Carta de Arrematação emitida pelo juiz.  
+    - Para extrajudicial: use a escritura ou contrato fornecido pelo banco, levando em conta o pagamento do ITBI.  
+    - Verifique se o cartório exige alguma certidão adicional ou guias pagas.
+    """)
+    registrou_imovel = st.checkbox(
+        "Já efetuei o registro no Cartório de Imóveis (7.3)?",
+        help="Somente após o registro você se torna oficialmente proprietário perante terceiros.",
+        key="registrou_imovel"
+    )
+
+    st.write("""  
+    **7.4 - Se o imóvel estiver ocupado e não houver acordo**, inicie a ação de imissão na posse (judicial) 
+    ou use o mandado (se for judicial).  
+
+    Observações:  
+    - Para leilão judicial, solicite o Mandado de Imissão na Posse após homologação.  
+    - Para extrajudicial, precisará de uma ação autônoma de imissão na posse.
+    """)
+    acao_posse = st.checkbox(
+        "Precisei (ou vou precisar) ingressar com ação de imissão na posse (7.4)?",
+        help="Marque se houver ocupante resistente e você não obtiver posse amigável.",
+        key="acao_posse"
+    )
+
+    # ================================================================================
+    # PASSO 8: PLANEJAMENTO DE REFORMA E REVENDA (SE INVESTIMENTO)
+    # ================================================================================
+    medidor.marco("PASSO 8")
+    st.header("PASSO 8: Reforma e Revenda (se for investimento)")
+
+    st.write("""
+    **8.1 - Planeje a reforma**:
+    - Itens estruturais (telhado, laje, infiltrações)
+    - Elétrica, hidráulica
+    - Revestimentos, piso, pintura
+    - Fachada (se for casa)
+    - Modernização de cozinha e banheiros
+    """)
+
+    custo_reforma = st.number_input(
+        "Custo estimado da reforma (R$)",
+        min_value=0.0, step=1000.0, format="%.2f",
+        help="Baseie-se em orçamentos com profissionais confiáveis.",
+        key="custo_reforma"
+    )
+
+    st.write("""
+    **8.2 - Se a ideia é revender**:
+    - Pesquise o preço de revenda pós-reforma.
+    - Se possível, considere **retorno sobre investimento** (ROI).
+    - Verifique o tempo para a reforma e legalização (se for necessário atualizar matrículas, projetos).
+    """)
+    col_prazo, col_venda, col_manutencao = st.columns(3)
+    st.session_state.setdefault("prazo_venda", PRAZO_VENDA_MESES)
+    prazo_venda = col_prazo.number_input(
+        "Prazo até a venda (meses)", min_value=1, max_value=120, step=1,
+        help="Da arrematação até receber o valor da venda (inclui reforma e legalização).",
+        key="prazo_venda"
+    )
+    st.session_state.setdefault("perc_custos_venda", PERC_CUSTOS_VENDA)
+    perc_custos_venda = col_venda.number_input(
+        "Custos de venda (% do preço)", min_value=0.0, max_value=20.0,
+        step=0.5, format="%.1f",
+        help="Corretagem (geralmente 5% a 6%) e outras despesas da venda.",
+        key="perc_custos_venda"
+    )
+    custo_mensal_manutencao = col_manutencao.number_input(
+        "Manutenção até a venda (R$/mês)", min_value=0.0, step=100.0, format="%.2f",
+        help="IPTU, condomínio, água e luz enquanto o imóvel não é vendido.",
+        key="custo_mensal_manutencao"
+    )
+    if forma_pagamento == "À Vista":
+        st.session_state.setdefault("taxa_desconto_anual_vista", TAXA_DESCONTO_ANUAL)
+        taxa_desconto_anual = st.number_input(
+            "Custo de oportunidade do dinheiro (% ao ano)",
+            min_value=0.0, max_value=50.0, step=0.5, format="%.2f",
+            help="Taxa usada no VPL (ex.: rendimento de um CDB).",
+            key="taxa_desconto_anual_vista"
+        )
+
+    # ================================================================================
+    # PASSO 9: RESUMO FINAL (RELATÓRIO)
+    # ================================================================================
+    medidor.marco("PASSO 9")
+    st.header("PASSO 9: Resumo Final e Geração de Relatório")
+
+    # ================================================================================
+    # PASSO 10: HONORÁRIOS, SEGUROS, VERIFICAÇÕES AVANÇADAS
+    # (NOVO - ADICIONADO SEM RETIRAR NADA DO SCRIPT)
+    # ================================================================================
+    medidor.marco("PASSO 10")
+    st.header("PASSO 10: Honorários, Seguros e Verificações Avançadas")
+
+    st.write("""
+    **10.1 - Honorários Advocatícios** (se necessários):  
+    - Caso contrate um advogado para acompanhamento do leilão, ocupação, ou 
+      ações judiciais de imissão na posse, consulte o valor.  
+    """)
+
+    honorarios_adv = st.number_input(
+        "Honorários advocatícios estimados (R$)",
+        min_value=0.0, step=1000.0, format="%.2f",
+        help="Se houver advogado para acompanhar todo o processo.",
+        key="honorarios_adv"
+    )
+
+    st.write("""
+    **10.2 - Seguro do Imóvel**  
+    - Se pretende reformar, é prudente contratar um **seguro residencial** para cobrir 
+      possíveis danos (furto de materiais, sinistros) durante a obra.  
+    - Também avalie um seguro após a reforma, se for alugar ou manter.  
+    """)
+
+    seguro_imovel = st.number_input(
+        "Custo estimado de seguro (R$)",
+        min_value=0.0, step=100.0, format="%.2f",
+        help="Ex.: Seguro residencial básico, anual.",
+        key="seguro_imovel"
+    )
+
+    st.write("""
+    **10.3 - Verificações Adicionais**  
+    - Certidões pessoais do ex-proprietário (protesto, execuções) para evitar surpresas.  
+    - Possíveis débitos de condomínio não declarados.  
+    - Se for área rural (não é o caso aqui, mas vale lembrar) verificar CCIR, ITR.  
+    """)
+
+    # Só os derivados que dependem de entradas alteradas desde a última
+    # execução são recalculados (nucleo.custos.modelo_custos)
+    modelo.definir(
+        valor_lance=valor_lance, perc_comissao=perc_comissao, perc_itbi=perc_itbi, perc_registro=perc_registro,
+        emolumentos=emolumentos, faixas_registro=faixas_registro, debitos_passados=debitos_passados,
+        valor_acordo=valor_acordo, custo_reforma=custo_reforma, honorarios_adv=honorarios_adv,
+        seguro_imovel=seguro_imovel, valor_pago=valor_pago, valor_orcamento_max=valor_orcamento_max,
+        valor_mercado=valor_mercado, prazo_venda=prazo_venda, perc_custos_venda=perc_custos_venda,
+        custo_mensal_manutencao=custo_mensal_manutencao, taxa_desconto_anual=taxa_desconto_anual,
+    )
+    comissao_leiloeiro = float(modelo["comissao_leiloeiro"])
+    itbi = float(modelo["itbi"])
+    registro_cartorio = float(modelo["registro_cartorio"])
+    custo_aquisicao_bruto = float(modelo["custo_aquisicao_bruto"])
+    investimento_total = float(modelo["investimento_total"])
+    custo_total_avancado = float(modelo["custo_total_avancado"])
+    lance_max_orcamento = float(modelo["lance_max_orcamento"])
+    if valor_orcamento_max > 0:
+        st.write("""
+        **10.4 - Lance Máximo dentro do Orçamento**  
+        Considerando o orçamento do PASSO 1 e todos os custos informados acima.
+        """)
+        if valor_lance <= lance_max_orcamento:
+            st.info(f"Lance máximo: R$ {format_brl(lance_max_orcamento)} "
+                    f"(folga de R$ {format_brl(lance_max_orcamento - valor_lance)} sobre o lance informado).")
+        else:
+            st.warning(f"Lance máximo: R$ {format_brl(lance_max_orcamento)}. O lance informado "
+                       f"ultrapassa o orçamento em R$ {format_brl(valor_lance - lance_max_orcamento)}.")
+
+    st.write("""
+    **10.5 - Análise de Sensibilidade (ITBI × Registro × Lance)**  
+    Veja de uma vez como o custo total muda com todas as posições dos sliders de ITBI e de 
+    registro, e com lances até 20% abaixo ou acima do informado.
+    """)
+    if valor_lance > 0:
+        with st.expander("Ver grade de sensibilidade do custo total"):
+            tabela = grade_sensibilidade_cache(valor_lance, debitos_passados, valor_acordo,
+                                               custo_reforma, honorarios_adv, seguro_imovel)
+            lances = tabela["valor_lance"].unique()
+
+            st.altair_chart(
+                grafico_calor(tabela[tabela["valor_lance"] == lances[len(lances) // 2]],
+                              "perc_registro", "perc_itbi", "Registro (%)", "ITBI (%)"),
+                width="stretch",
+            )
+            # Com emolumentos, a posição da grade mais próxima do registro efetivo
+            registros = tabela["perc_registro"].unique().tolist()
+            registro_grade = min(registros, key=lambda r: abs(r - registro_cartorio / valor_lance * 100))
+            st.altair_chart(
+                grafico_calor(tabela[tabela["perc_registro"] == registro_grade],
+                              "lance_formatado", "perc_itbi", "Lance (R$)", "ITBI (%)"),
+                width="stretch",
+            )
+            st.dataframe(
+                tabela[["valor_lance", "perc_itbi", "perc_registro", "custo_total_avancado"]],
+                column_config={
+                    "valor_lance": st.column_config.NumberColumn("Lance (R$)", format="%.2f"),
+                    "perc_itbi": st.column_config.NumberColumn("ITBI (%)", format="%.1f"),
+                    "perc_registro": st.column_config.NumberColumn("Registro (%)", format="%.1f"),
+                    "custo_total_avancado": st.column_config.NumberColumn("Custo total (R$)", format="%.2f"),
+                },
+                hide_index=True,
+            )
+    else:
+        st.write("*Informe o valor do lance no PASSO 6 para ver a grade.*")
+
+    retorno = modelo["retorno"]
+    if valor_mercado > 0 and custo_total_avancado > 0:
+        st.write(f"""
+        **10.6 - Retorno sobre o Investimento (Revenda)**  
+        Venda pelo valor de mercado do PASSO 2 em {prazo_venda} meses, descontados os custos de venda 
+        e a manutenção; VPL a {taxa_desconto_anual}% ao ano.
+        """)
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Lucro", f"R$ {format_brl(float(retorno.lucro))}")
+        col2.metric("ROI no período", f"{float(retorno.roi) * 100:.1f}%")
+        tir_anual = float(retorno.tir_anual)
+        col3.metric("TIR (ao ano)", f"{tir_anual * 100:.1f}%" if math.isfinite(tir_anual) else "n/d")
+        col4.metric("VPL", f"R$ {format_brl(float(retorno.vpl))}")
+
+    # Todas as entradas do checklist já existem aqui, na execução completa e
+    # na reexecução só desta seção
+    salvar_checklist()
+
+    financiamento = None
+    if forma_pagamento == "Financiamento Caixa" and tabela_financiamento is not None:
+        financiamento = {
+            "sistema": sistema_amortizacao,
+            "taxa_juros_anual": taxa_juros_anual,
+            "prazo": prazo_financiamento,
+            "primeira_prestacao": float(tabela_financiamento.primeira_prestacao[0]),
+            "ultima_prestacao": float(tabela_financiamento.ultima_prestacao[0]),
+            "total_pago": float(tabela_financiamento.total_pago[0]),
+        }
+    parcelamento = None
+    if cronograma_judicial is not None:
+        parcelamento = {
+            "n_parcelas": n_parcelas,
+            "primeira_parcela": float(parcelas[0]),
+            "ultima_parcela": float(parcelas[-1]),
+            "total_pago": float(cronograma_judicial.total_pago[0]),
+        }
+
+    calculo = CalculoCustos(
+        forma_pagamento=forma_pagamento, valor_lance=valor_lance, perc_entrada=perc_entrada,
+        valor_entrada=valor_entrada, valor_financiado=valor_financiado, valor_pago=valor_pago,
+        taxa_desconto_anual=taxa_desconto_anual, financiamento=financiamento, parcelamento=parcelamento,
+        perc_comissao=perc_comissao, comissao_leiloeiro=comissao_leiloeiro, perc_itbi=perc_itbi, itbi=itbi,
+        perc_registro=perc_registro, emolumentos=emolumentos, registro_cartorio=registro_cartorio,
+        debitos_passados=debitos_passados, valor_acordo=valor_acordo, custo_aquisicao_bruto=custo_aquisicao_bruto,
+        custo_reforma=custo_reforma, investimento_total=investimento_total, honorarios_adv=honorarios_adv,
+        seguro_imovel=seguro_imovel, custo_total_avancado=custo_total_avancado,
+        valor_orcamento_max=valor_orcamento_max, lance_max_orcamento=lance_max_orcamento,
+        valor_mercado=valor_mercado, prazo_venda=prazo_venda, retorno=retorno,
+        depositou_valor=depositou_valor, pagou_comissao=pagou_comissao, judicial_homologacao=judicial_homologacao,
+        extrajudicial_assinou=extrajudicial_assinou, pagou_itbi=pagou_itbi, registrou_imovel=registrou_imovel,
+        acao_posse=acao_posse,
+    )
+    # O download do 11.3 fica fora do fragmento e lê daqui, ao ser clicado, os
+    # custos da última execução desta seção
+    st.session_state.setdefault("_calculo_atual", {})["calculo"] = calculo
+    return calculo
+
+
+def valores_lote(calculo, local_imovel, tipo_imovel, tipo_leilao, ocupado):
+    """
+    Valores calculados de um lote para a exportação do 11.3.
+    """
+    return {
+        "local_imovel": local_imovel, "tipo_imovel": tipo_imovel, "tipo_leilao": tipo_leilao, "ocupado": ocupado,
+        "forma_pagamento": calculo.forma_pagamento, "valor_lance": calculo.valor_lance,
+        "perc_comissao": calculo.perc_comissao, "comissao_leiloeiro": calculo.comissao_leiloeiro,
+        "perc_itbi": calculo.perc_itbi, "itbi": calculo.itbi,
+        "perc_registro": calculo.perc_registro, "registro_cartorio": calculo.registro_cartorio,
+        "debitos_passados": calculo.debitos_passados, "valor_acordo": calculo.valor_acordo,
+        "custo_aquisicao_bruto": calculo.custo_aquisicao_bruto, "custo_reforma": calculo.custo_reforma,
+        "investimento_total": calculo.investimento_total, "honorarios_adv": calculo.honorarios_adv,
+        "seguro_imovel": calculo.seguro_imovel, "custo_total_avancado": calculo.custo_total_avancado,
+        "perc_entrada": calculo.perc_entrada, "valor_entrada": calculo.valor_entrada,
+        "valor_financiado": calculo.valor_financiado, "valor_pago": calculo.valor_pago,
+        "valor_orcamento_max": calculo.valor_orcamento_max, "lance_maximo": calculo.lance_max_orcamento,
+        "valor_mercado": calculo.valor_mercado, "lucro_revenda": float(calculo.retorno.lucro),
+        "roi": float(calculo.retorno.roi), "vpl": float(calculo.retorno.vpl),
+        "tir_anual": float(calculo.retorno.tir_anual),
+    }
+
+
+def main():
+    with medicao() as medidor:
+        checklist(medidor)
+        registro = medidor.finalizar()
+    if registro:
+        painel_medicao(registro)
+
+
+def checklist(medidor):
+    medidor.marco("Cabeçalho")
+
+    # -------------------------------------------------------------------------------------
+    # CONFIGURAÇÃO INICIAL DA PÁGINA
+    # -------------------------------------------------------------------------------------
+    st.set_page_config(page_title="Checklist Ultra Completo - Leilão de Imóveis", layout="wide")
+    st.title("Checklist Ultra Completo (Passo a Passo) - Compra de Imóveis em Leilão (GO)")
+
+    st.write("""
+    Este aplicativo contém um **passo a passo extremamente detalhado** para ajudar você a comprar 
+    um imóvel em leilão (judicial ou extrajudicial) no estado de Goiás, **sem perder nenhum cuidado**.  
+    Inclui orientações sobre **visita, documentação, notificação do antigo dono, uso de FGTS, 
+    financiamento Caixa, verificação de dívidas, ocupação**, reforma e revenda.  
+    Use-o como um **roteiro** para **não esquecer** nenhuma etapa crucial.
+    """)
+
+    # -------------------------------------------------------------------------------------
+    # DADOS INICIAIS (BARRA LATERAL)
+    # -------------------------------------------------------------------------------------
+    painel_checklist_salvo()
+
+    data_hoje = datetime.date.today().strftime("%d/%m/%Y")
+    st.sidebar.subheader("Dados Iniciais")
+    nome_comprador = st.sidebar.text_input(
+        "Seu nome (Pessoa Física):",
+        help="Escreva seu nome completo ou como deseja ser identificado no relatório.",
+        key="nome_comprador"
+    )
+    data_atual = st.sidebar.text_input("Data:", data_hoje)
+
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### Sumário das Etapas:")
+    st.sidebar.markdown("1. Definição de Objetivos e Orçamento")
+    st.sidebar.markdown("2. Pesquisa e Análise de Mercado (visita, corretores)")
+    st.sidebar.markdown("3. Verificação Documental (matrícula, edital, notificações)")
+    st.sidebar.markdown("4. Ocupação do Imóvel (desocupado, acordo, etc.)")
+    st.sidebar.markdown("5. Cadastro no Leiloeiro e Participação")
+    st.sidebar.markdown("6. Forma de Pagamento e Cálculos de Custos")
+    st.sidebar.markdown("7. Checagens Pós-Arremate (ITBI, registro, etc.)")
+    st.sidebar.markdown("8. Reforma e Revenda")
+    st.sidebar.markdown("9. Resumo Final")
+    st.sidebar.markdown("10. Honorários, Seguros e Verificações Avançadas")
+    st.sidebar.markdown("11. Documentos Complementares e Conclusão")
+    st.sidebar.markdown("12. Checklist Detalhado (Antes, Durante, Depois)")
+    st.sidebar.markdown("13. Diferenças e Cuidados: Judicial vs Extrajudicial")
+    st.sidebar.markdown("14. Referências Úteis e Fontes de Consulta")
+
+    st.write(f"**Data atual:** {data_atual}")
+    if nome_comprador:
+        st.write(f"**Nome do comprador:** {nome_comprador}")
+    else:
+        st.write("*Preencha o nome na barra lateral para personalizar.*")
+
+    st.markdown("---")
+
+    # ================================================================================
+    # PASSO 1: DEFINIÇÃO DE OBJETIVOS E ORÇAMENTO
+    # ================================================================================
+    medidor.marco("PASSO 1")
+    st.header("PASSO 1: Definição de Objetivos e Orçamento")
+
+    st.write("""
+    **1.1 - Objetivo da Compra**  
+    Defina se a aquisição é para **moradia própria**, para **investir/revender** ou 
+    para **alugar**. Isso influencia suas decisões (tipo de imóvel, valor de reforma, etc.).
+    """)
+
+    objetivo = st.selectbox(
+        "Qual seu principal objetivo?",
+        ["(Selecione)", "Moradia Própria", "Investimento (Revenda)", "Investimento (Locação)", "Outros"],
+        help="Escolha a categoria que mais se aproxima do seu propósito.",
+        key="objetivo"
+    )
+
+    st.write("""
+    **1.2 - Orçamento Total**  
+    Calcule quanto dinheiro, ao todo, você está disposto a aplicar (incluindo **lance, comissão, 
+    ITBI, registro, eventuais dívidas, reforma**, etc.).
+    """)
+
+    valor_orcamento_max = st.number_input(
+        "Orçamento máximo global (R$)",
+        min_value=0.0, step=10000.0, format="%.2f",
+        help="Inclua aqui TUDO que você pode gastar, não apenas o lance.",
+        key="valor_orcamento_max"
+    )
+
+    st.write("""
+    **1.3 - Verificação de Financiamento (se houver)**  
+    Se pretende financiar (ex.: Caixa), confira previamente seu **score**, documentos e se 
+    **o nome no qual será financiado** atende aos requisitos (FGTS, tempo de trabalho, 
+    limite de crédito, etc.).
+    """)
+
+    verificou_financiamento = st.checkbox(
+        "Consultei a instituição financeira / Caixa para saber se tenho crédito/condições de financiamento?",
+        help="Por exemplo, uma pré-aprovação de crédito, verificação de FGTS disponível, etc.",
+        key="verificou_financiamento"
+    )
+
+    # ================================================================================
+    # PASSO 2: PESQUISA E ANÁLISE DE MERCADO
+    # ================================================================================
+    medidor.marco("PASSO 2")
+    st.header("PASSO 2: Pesquisa e Análise de Mercado (Visita, Corretores, etc.)")
+
+    st.write("""
+    **2.1 - Localização e Tipo de Imóvel**  
+    Decida em qual região de Goiás (cidade/bairro) deseja comprar, e qual tipo (casa, apê).
+    """)
+
+    local_imovel = st.text_input(
+        "Cidade/Bairro do imóvel (GO)",
+        help="Ex.: Goiânia, setor, bairro, etc. As sugestões cobrem só parte de GO (os principais "
+             "municípios e bairros das maiores cidades); outros nomes podem ser digitados normalmente.",
+        key="local_imovel"
+    )
+    sugestoes = sugestoes_local(local_imovel)
+    if sugestoes:
+        st.pills(
+            "Sugestões (grafia padronizada):", sugestoes,
+            key="_sugestao_local", on_change=_usar_sugestao_local,
+            help="Escolha uma sugestão para o mesmo bairro não aparecer com grafias diferentes."
+        )
+    tipo_imovel = st.radio(
+        "Tipo de imóvel:",
+        ["Casa", "Apartamento", "Lote/Terreno", "Outros"],
+        help="Selecione o tipo principal.",
+        key="tipo_imovel"
+    )
+
+    st.write("""
+    **2.2 - Visita ao imóvel**  
+    Sempre que possível, visite para avaliar **estado de conservação**, **vizinhança**, 
+    **possíveis problemas** (rachaduras, infiltrações), etc.
+    """)
+
+    visitou = st.checkbox(
+        "Realizei (ou vou realizar) a visita in loco?",
+        help="Converse com vizinhos, síndico, porteiro para saber se há pendências ou problemas.",
+        key="visitou"
+    )
+
+    st.write("""
+    **2.3 - Conversar com Corretores / Pesquisa de Mercado**  
+    Fale com **corretores da região** e consulte sites (OLX, VivaReal, Imovelweb) para 
+    comparar valores. Isso evita pagar acima do **valor de mercado**.
+    """)
+
+    conversou_corretores = st.checkbox(
+        "Conversei com corretores e/ou fiz pesquisa online de valores na região?",
+        help="Isso ajuda a comparar com o lance mínimo do leilão.",
+        key="conversou_corretores"
+    )
+
+    valor_mercado = st.number_input(
+        "Valor de mercado estimado (R$)",
+        min_value=0.0, step=10000.0, format="%.2f",
+        help="Coloque aqui a média de preço que você acredita ser justo na região.",
+        key="valor_mercado"
+    )
+
+    st.write("""
+    **2.4 - Verificação de ampliações não averbadas**  
+    Consulte, por exemplo, se a casa teve puxadinho ou área construída não registrada. 
+    Isso pode gerar custos de regularização no futuro.
+    """)
+
+    verificou_averbacoes = st.checkbox(
+        "Verifiquei se há construções não averbadas (o que pode exigir regularização)?",
+        help="Pergunte a vizinhos, verifique a matrícula, planta na prefeitura, etc.",
+        key="verificou_averbacoes"
+    )
+
+    # ================================================================================
+    # PASSO 3: VERIFICAÇÃO DOCUMENTAL (MATRÍCULA, EDITAL, NOTIFICAÇÕES)
+    # ================================================================================
+    medidor.marco("PASSO 3")
+    st.header("PASSO 3: Verificação Documental (Matrícula, Edital, Notificações)")
+
+    st.write("""
+    **3.1 - Tipo de Leilão**  
+    - **Judicial**: Acontece por determinação do juiz, com base no CPC (art. 879+).  
+    - **Extrajudicial**: Normalmente alienação fiduciária (Lei 9.514/97), conduzida por bancos.  
+    """)
+
+    tipo_leilao = st.radio(
+        "Tipo de leilão:",
+        ["Judicial", "Extrajudicial"],
+        help="Escolha conforme o edital - extrajudicial é tipicamente leilão de banco por inadimplência.",
+        key="tipo_leilao"
+    )
+
+    st.write("""
+    **3.2 - Edital do Leilão**  
+    Leia com extrema atenção:
+    - Valor mínimo, datas, comissão, dívidas incluídas ou não.
+    - Condições de pagamento (à vista, parcelado, financiamento).
+    - Responsabilidade de desocupação.
+    """)
+
+    edital_lido = st.checkbox(
+        "Li e compreendi o edital do leilão?",
+        help="Verifique todas as cláusulas antes de dar qualquer lance.",
+        key="edital_lido"
+    )
+
+    st.write("""
+    **3.3 - Matrícula do Imóvel**  
+    Solicite a **certidão de inteiro teor** no Cartório de Registro de Imóveis. Verifique:
+    - Proprietário atual
+    - Penhoras, usufrutos, hipotecas
+    - Consolidação (no caso de extrajudicial)
+    - Averbações de penhora, execuções
+    """)
+
+    matricula_conf = st.checkbox(
+        "Verifiquei a matrícula atualizada e vi se há ônus?",
+        help="Documento essencial para avaliar pendências.",
+        key="matricula_conf"
+    )
+
+    st.write("""
+    **3.4 - Notificações do Antigo Dono** (Leilão Extrajudicial)  
+    Se for extrajudicial, confirmar se houve notificação adequada do devedor (Lei 9.514/97).
+    Falhas podem anular o leilão.
+    """)
+
+    notificacao_ok = "Não se aplica (Leilão Judicial)"
+    if tipo_leilao == "Extrajudicial":
+        check_notif = st.checkbox(
+            "Confirmado que o antigo dono foi notificado corretamente (conforme matrícula)?",
+            help="Verifique se consta no registro a intimação formal do devedor.",
+            key="check_notif"
+        )
+        notificacao_ok = "Sim" if check_notif else "Não"
+
+    st.write("""
+    **3.5 - Verificar processos judiciais correlatos**  
+    Pesquise se há **outras ações** (ex.: usucapião, falência, inventário) no nome do proprietário. 
+    Acesse o site do TJGO ou fale com um advogado.
+    """)
+
+    verificou_processos = st.checkbox(
+        "Consultei processos no TJGO em nome do devedor/proprietário?",
+        help="Isso evita surpresas como outra penhora, etc.",
+        key="verificou_processos"
+    )
+
+    # ================================================================================
+    # PASSO 4: OCUPAÇÃO DO IMÓVEL
+    # ================================================================================
+    medidor.marco("PASSO 4")
+    st.header("PASSO 4: Ocupação do Imóvel (Desocupado x Ocupado)")
+
+    st.write("""
+    **4.1 - O imóvel está desocupado ou ocupado?**  
+    - **Desocupado**: Posse mais fácil.
+    - **Ocupado**: Pode ser ex-proprietário, inquilino ou até invasor.
+    """)
+
+    ocupado = st.radio(
+        "Situação de ocupação:",
+        ["Desocupado", "Ocupado"],
+        help="Se ocupado, analise a possibilidade de acordo amigável ou ação judicial.",
+        key="ocupado"
+    )
+
+    acordo_amigavel = "Não se aplica"
+    valor_acordo = 0.0
+    if ocupado == "Ocupado":
+        st.write("""
+        **4.2 - Acordo Amigável**  
+        Tente negociar (ex.: pagar ajuda mudança) se o ocupante aceitar sair sem briga.
+        """)
+        acordo_amigavel = st.radio(
+            "Haverá acordo amigável?",
+            ["Sim", "Não"],
+            help="Se não, avalie se deseja encarar ação de despejo ou desistir do leilão.",
+            key="acordo_amigavel"
+        )
+        if acordo_amigavel == "Sim":
+            valor_acordo = st.number_input(
+                "Valor de compensação (R$):",
+                min_value=0.0, step=1000.0, format="%.2f",
+                help="Ex.: 5.000 para mudança.",
+                key="valor_acordo"
+            )
+
+    st.write("""
+    **4.3 - Contrato de Locação Vigente?**  
+    Se houver inquilino com contrato em vigor, a Lei do Inquilinato permite ao novo dono 
+    rescindir (denúncia) em 90 dias.
+    """)
+
+    verificou_locacao = st.checkbox(
+        "Verifiquei se há contrato de locação em vigor?",
+        help="Pode ser que o inquilino tenha que ficar por 90 dias pagando aluguel ao novo dono.",
+        key="verificou_locacao"
+    )
+
+    # ================================================================================
+    # PASSO 5: CADASTRO NO LEILOEIRO E PARTICIPAÇÃO
+    # ================================================================================
+    medidor.marco("PASSO 5")
+    st.header("PASSO 5: Cadastro no Leiloeiro e Participação no Leilão")
+
+    st.write("""
+    **5.1 - Cadastro no Site / Habilitação**  
+    - Preencher dados (RG, CPF, comprovante de residência).
+    - Alguns leilões pedem caução (sinal) para se habilitar.
+    """)
+
+    cadastro_feito = st.checkbox(
+        "Fiz ou vou fazer o cadastro no site do leiloeiro / portal do tribunal?",
+        help="Sem cadastro/habilitação, você não pode dar lances, principalmente nos online.",
+        key="cadastro_feito"
+    )
+
+    st.write("""
+    **5.2 - Data e Hora do Leilão**  
+    - Anotar no calendário.
+    - Conferir se houve adiamento/suspensão (ex.: pagamento de dívida de última hora).
+    """)
+
+    verifica_data_leilao = st.checkbox(
+        "Verifiquei a data/hora e me programei para estar presente ou online?",
+        help="É comum haver mudança de data se o devedor paga a dívida.",
+        key="verifica_data_leilao"
+    )
+
+    calculo = secao_custos(local_imovel, valor_mercado, valor_acordo, valor_orcamento_max, medidor)
+
+    # ================================================================================
+    # PASSO 11: DOCUMENTOS COMPLEMENTARES E CONCLUSÃO
+    # (NOVO - ADICIONADO SEM RETIRAR NADA DO SCRIPT)
+    # ================================================================================
+    medidor.marco("PASSO 11")
+    st.header("PASSO 11: Documentos Complementares e Conclusão")
+
+    st.write("""
+    **11.1 - Guarde todos os documentos**:  
+    - Edital, comprovantes de depósito do lance, comissão, ITBI.  
+    - Matrícula atualizada pós-registro em seu nome.  
+    - Contrato/Escritura (extrajudicial) ou Carta de Arrematação (judicial).  
+    - Notas fiscais de material de construção (caso reforme).  
+    """)
+
+    st.write("""
+    **11.2 - Finalização**  
+    - Ao concluir a reforma (se houver), faça nova vistoria.  
+    - Se for morar, transfira serviços (luz, água, IPTU) para seu nome.  
+    - Se for vender/alugar, divulgue o imóvel com as características atualizadas (fotos, 
+      documentação em dia).
+    """)
+
+    st.write("**11.3 - Guarde também os valores calculados** (lance, custos, totais e financiamento):")
+    calculo_atual = st.session_state["_calculo_atual"]
+    col_formato, col_botao = st.columns([2, 3])
+    formato_exportacao = col_formato.radio("Formato:", list(FORMATOS), horizontal=True)
+    extensao, tipo_mime = FORMATOS[formato_exportacao]
+    col_botao.download_button(
+        f"Baixar valores calculados ({formato_exportacao})",
+        data=lambda: exportar_para_download(
+            arredondar_custos(lote_para_tabela(
+                valores_lote(calculo_atual["calculo"], local_imovel, tipo_imovel, tipo_leilao, ocupado))),
+            formato_exportacao,
+        ),
+        file_name=f"custos_leilao_{datetime.date.today():%Y%m%d}.{extensao}",
+        mime=tipo_mime,
+        on_click="ignore",
+    )
+
+    # ================================================================================
+    # PASSO 12: CHECKLIST DETALHADO (ANTES, DURANTE E APÓS) - EXTRA EXPANDER
+    # ================================================================================
+    medidor.marco("PASSO 12")
+    st.header("PASSO 12: Checklist Detalhado (Antes, Durante e Depois)")
+
+    with st.expander("Ver texto completo do Passo a Passo (Antes do Leilão, Durante, Após)"):
+        st.markdown("""
+        ### Antes do Leilão (Preparação)
+
+        - **Defina seu objetivo e orçamento**: Moradia ou investimento? Quanto pode pagar no total?  
+        - **Pesquisa de mercado e plataformas confiáveis**: Consulte portais como Imóveis Caixa, TJGO, 
+          leiloeiros registrados na JUCEG.  
+        - **Selecione imóveis e avalie viabilidade**: Compare preço mínimo x valor de mercado, 
+          potencial de retorno.  
+        - **Inspeção in loco**: Verifique a construção, conservação, problemas estruturais.  
+          Converse com vizinhos, síndico.  
+        - **Verificar ocupação** (desocupado, amigável, hostil).  
+        - **Análise da documentação** (Matrícula atualizada, penhoras, hipotecas, consolidação no 
+          extrajudicial).  
+        - **Leia atentamente o edital**: Valor mínimo, comissão, responsabilidades por dívidas, 
+          forma de pagamento, etc.  
+        - **Verifique débitos** (IPTU, condomínio, água, luz).  
+        - **Analise viabilidade financeira completa** (lance + dívidas + reforma + taxas).  
+        - **Consulta a processos judiciais** (nome do devedor, usucapião, falência).  
+        - **Cadastre-se e habilite-se** (documentos, caução).  
+        - **Planeje pagamento** (à vista, parcelamento CPC 895, financiamento Caixa).  
+        - **Agende alertas** e fique atento a possíveis suspensões.
+
+        ### Durante o Leilão (Lances e Arremate)
+
+        - **Acompanhe pontualmente**: Presencial ou online, com login feito.  
+        - **Tenha informações-chave à mão**: Valor máximo, condições do edital, débitos.  
+        - **Faça lances com estratégia**, não ultrapasse seu limite, cuidado com “febre do leilão”.  
+        - **Ofertas à vista x parceladas**: À vista tem preferência sobre valor igual parcelado 
+          (judicial).  
+        - **Seja o lance vencedor**: Anote o valor final, assine o auto de arrematação (ou 
+          aguarde confirmação online).  
+        - **Solicite orientações de pagamento ao leiloeiro** (prazo, conta bancária, TED).  
+        - **Não perca os prazos** (24h, 48h).  
+        - **Registro do auto de arrematação** (judicial) e aguarde homologação.  
+        - **Prazo de impugnação** (judicial, ~10 dias). Em extrajudicial, não há homologação 
+          pelo juiz, mas ex-proprietário pode mover ação anulatória.
+
+        ### Após o Arremate (Pós-leilão e Posse)
+
+        - **Guarde comprovantes** de pagamento e taxas.  
+        - **Formalize a transferência**:
+          - Judicial: Carta/Auto de Arrematação -> Registro de Imóveis.  
+          - Extrajudicial: Escritura (à vista) ou Contrato de Financiamento, depois registre.  
+        - **Pague ITBI** e apresente comprovante para registrar.  
+        - **Posse do imóvel**:
+          - Desocupado: troque fechaduras.  
+          - Ocupado: Se acordo amigável, cumpra os termos. Caso contrário, ação de imissão na 
+            posse ou mandado judicial.  
+          - Inquilino: Lei do Inquilinato (90 dias).  
+        - **Quite dívidas remanescentes** (IPTU, condomínio).  
+        - **Remova ônus na matrícula** (ofícios judiciais ou documentos do banco).  
+        - **Use FGTS ou finalize financiamento** se aplicável.  
+        - **Providências extras**: seguro, documentar condição do imóvel, guardar todos os papéis.
+        """)
+
+    # ================================================================================
+    # PASSO 13: DIFERENÇAS E CUIDADOS - EXTRA EXPANDER
+    # ================================================================================
+    medidor.marco("PASSO 13")
+    st.header("PASSO 13: Diferenças e Cuidados - Leilão Judicial vs Extrajudicial")
+
+    with st.expander("Clique para ver detalhes do Judicial x Extrajudicial"):
+        st.markdown("""
+        - **Origem**:
+          - Judicial: Bem penhorado em processo de execução (cível, trabalhista, fiscal).  
+          - Extrajudicial: Alienação fiduciária (Lei 9.514/97) ou execução privada por bancos.
+
+        - **Legislação aplicada**:
+          - Judicial: CPC (arts. 879-903), com supervisão do juiz.  
+          - Extrajudicial: Lei 9.514/97, normas contratuais, leiloeiro público, sem ação judicial 
+            (a princípio).
+
+        - **Publicidades e intimações**:
+          - Judicial: Citação do devedor, edital publicado em diário oficial.  
+          - Extrajudicial: Notificação cartorária, edital em jornal de grande circulação.
+
+        - **Primeira e segunda praça/leilão**:
+          - Judicial: 1ª praça >= avaliação, 2ª >= 50% (ou mínimo estipulado).  
+          - Extrajudicial: 1º leilão >= dívida ou valor de avaliação; 2º leilão pode ser menor.
+
+        - **Pagamento e financiamento**:
+          - Judicial: Parcelamento (CPC 895) é possível, mas não financiamento bancário direto.  
+          - Extrajudicial: Bancos costumam oferecer financiamento (ex.: Caixa).
+
+        - **Regularização de dívidas**:
+          - Judicial: Normalmente as dívidas propter rem ficam para o arrematante, salvo se 
+            o valor arrecadado for suficiente e o juiz destinar para quitar.  
+          - Extrajudicial (bancos): Muitos pagam IPTU/condomínio em atraso até a data do leilão, 
+            liberando o imóvel de débitos.
+
+        - **Posse e desocupação**:
+          - Judicial: Você obtém mandado de imissão na posse após a homologação, caso necessário.  
+          - Extrajudicial: Se ocupado, precisa entrar com ação de imissão na posse na justiça 
+            comum, pois não há ordem judicial direta do leilão.
+
+        - **Conclusão do negócio**:
+          - Judicial: Carta de arrematação substitui escritura pública, mas precisa registro.  
+          - Extrajudicial: Escritura ou contrato do banco + registro no cartório.
+        """)
+
+    # ================================================================================
+    # PASSO 14: REFERÊNCIAS ÚTEIS E FONTES DE CONSULTA
+    # ================================================================================
+    medidor.marco("PASSO 14")
+    st.header("PASSO 14: Referências Úteis e Fontes de Consulta")
+
+    with st.expander("Clique para ver Referências"):
+        st.markdown("""
+        - **Tribunal de Justiça de Goiás (TJGO)**:
+          - Site oficial para leilões judiciais, consulta processual.
+        - **Caixa Econômica Federal – Imóveis à Venda**:
+          - [venda-imoveis.caixa.gov.br](https://venda-imoveis.caixa.gov.br)  
+          - Filtros por cidade e modalidade (leilão, licitação, venda direta).
+        - **Cartórios de Registro de Imóveis (Goiás)**:
+          - Central Registradores de Imóveis (ONR) ou cartório local para certidões.
+        - **Legislação básica**:
+          - CPC (Lei 13.105/2015), arts. 879-903 (leilão judicial).
+          - Lei 9.514/97 (alienação fiduciária).
+          - Lei do Inquilinato (8.245/91, art. 8º).
+        - **Materiais de apoio**:
+          - Checklist de Arrematação D1Lance, artigos de especialistas, jurisprudência.
+        """)
+
+    # BOTÃO FINAL PARA EXIBIR O RELATÓRIO COMPLETO
+    medidor.marco("Relatório")
+    if st.button("Gerar Relatório Completo"):
+        retorno = None
+        if valor_mercado > 0 and calculo.custo_total_avancado > 0:
+            retorno = {campo: float(getattr(calculo.retorno, campo)) for campo in ("lucro", "roi", "tir_anual", "vpl")}
+
+        documento = relatorio_cache(json.dumps({
+            "data_atual": data_atual, "nome_comprador": nome_comprador,
+            "objetivo": objetivo, "valor_orcamento_max": valor_orcamento_max,
+            "lance_max_orcamento": calculo.lance_max_orcamento, "verificou_financiamento": verificou_financiamento,
+            "local_imovel": local_imovel, "tipo_imovel": tipo_imovel, "visitou": visitou,
+            "conversou_corretores": conversou_corretores, "valor_mercado": valor_mercado,
+            "verificou_averbacoes": verificou_averbacoes,
+            "tipo_leilao": tipo_leilao, "edital_lido": edital_lido, "matricula_conf": matricula_conf,
+            "notificacao_ok": notificacao_ok, "verificou_processos": verificou_processos,
+            "ocupado": ocupado, "acordo_amigavel": acordo_amigavel, "valor_acordo": valor_acordo,
+            "verificou_locacao": verificou_locacao,
+            "cadastro_feito": cadastro_feito, "verifica_data_leilao": verifica_data_leilao,
+            "valor_lance": calculo.valor_lance, "forma_pagamento": calculo.forma_pagamento,
+            "perc_entrada": calculo.perc_entrada, "valor_entrada": calculo.valor_entrada,
+            "valor_financiado": calculo.valor_financiado, "financiamento": calculo.financiamento,
+            "parcelamento": calculo.parcelamento, "taxa_desconto_anual": calculo.taxa_desconto_anual,
+            "valor_pago": calculo.valor_pago,
+            "perc_comissao": calculo.perc_comissao, "comissao_leiloeiro": calculo.comissao_leiloeiro,
+            "perc_itbi": calculo.perc_itbi, "itbi": calculo.itbi,
+            "perc_registro": calculo.perc_registro, "emolumentos": calculo.emolumentos,
+            "registro_cartorio": calculo.registro_cartorio,
+            "debitos_passados": calculo.debitos_passados, "custo_aquisicao_bruto": calculo.custo_aquisicao_bruto,
+            "depositou_valor": calculo.depositou_valor, "pagou_comissao": calculo.pagou_comissao,
+            "judicial_homologacao": calculo.judicial_homologacao,
+            "extrajudicial_assinou": calculo.extrajudicial_assinou, "pagou_itbi": calculo.pagou_itbi,
+            "registrou_imovel": calculo.registrou_imovel, "acao_posse": calculo.acao_posse,
+            "custo_reforma": calculo.custo_reforma, "investimento_total": calculo.investimento_total,
+            "prazo_venda": calculo.prazo_venda, "retorno": retorno,
+            "honorarios_adv": calculo.honorarios_adv, "seguro_imovel": calculo.seguro_imovel,
+            "total_geral_avancado": calculo.custo_total_avancado,
+        }, default=float))
+        relatorio_completo(documento, calculo.custo_total_avancado)
@@ -0,0 +1,313 @@
+import tempfile
+
+import pandas as pd
+import streamlit as st
+
+from nucleo import centavos
+from nucleo.banco_lotes import BancoLotes
+from nucleo.exportacao import FORMATOS, exportar_para_download
+from nucleo.importador_caixa import ler_lista_caixa
+from nucleo.parcelamento import PARCELAS_MAXIMAS, PERC_ENTRADA_MINIMA, aplicar_cpc895
+from nucleo.pdf import pdf_portfolio
+from nucleo.portfolio import (COLUNAS_CUSTOS, arredondar_custos, calcular_lance_maximo, calcular_portfolio,
+                              calcular_retorno_portfolio, ler_portfolio_csv, normalizar_portfolio, resumir_portfolio)
+from nucleo.retorno import PERC_CUSTOS_VENDA, PRAZO_VENDA_MESES
+from nucleo.simulacao import Incerteza, simular_portfolio
+from nucleo.tarifas import TAXAS_DA_TABELA, aplicar_tarifas
+from paginas.recursos import carregar_tabela_tarifas
+
+# Modelo de CSV oferecido para download
+MODELO_CSV = (
+    "cidade;tipo;tipo_leilao;ocupado;lance;debitos;acordo;reforma;honorarios;seguro;mercado\n"
+    "Goiânia - Setor Bueno;Apartamento;Extrajudicial;Desocupado;180.000,00;3.500,00;0;25.000,00;4.000,00;900,00;290.000,00\n"
+    "Anápolis - Jundiaí;Casa;Judicial;Ocupado;95.000,00;0;5.000,00;15.000,00;3.000,00;600,00;160.000,00\n"
+)
+
+# Lotes da lista da Caixa mantidos para a tabela, o PDF, a exportação e a simulação
+LOTES_EXIBIDOS_CAIXA = 1000
+
+
+@st.cache_resource
+def abrir_banco_lotes() -> BancoLotes:
+    """
+    Conexão única com o banco local de lotes, compartilhada entre sessões.
+    """
+    return BancoLotes()
+
+
+def consultar_banco(banco: BancoLotes):
+    """
+    Filtros do banco local de lotes; devolve os lotes encontrados, com as
+    taxas não informadas em branco (ver ``preencher_taxas``).
+    """
+    col1, col2, col3 = st.columns(3)
+    cidade = col1.text_input("Cidade", help="Ex.: Goiânia (acentos e maiúsculas são ignorados).")
+    tipo_imovel = col2.selectbox("Tipo de imóvel", ["(Todos)"] + banco.valores_distintos("tipo_imovel"))
+    tipo_leilao = col3.selectbox("Tipo de leilão", ["(Todos)"] + banco.valores_distintos("tipo_leilao"))
+    col4, col5, col6 = st.columns(3)
+    ocupado = col4.selectbox("Ocupação", ["(Todos)"] + banco.valores_distintos("ocupado"))
+    lance_min = col5.number_input("Lance mínimo (R$)", min_value=0.0, step=10000.0, format="%.2f")
+    lance_max = col6.number_input("Lance abaixo de (R$)", min_value=0.0, step=10000.0, format="%.2f",
+                                  help="Deixe 0 para não limitar.")
+
+    return normalizar_portfolio(banco.consultar(
+        cidade=cidade or None,
+        tipo_imovel=None if tipo_imovel == "(Todos)" else tipo_imovel,
+        tipo_leilao=None if tipo_leilao == "(Todos)" else tipo_leilao,
+        ocupado=None if ocupado == "(Todos)" else ocupado,
+        lance_min=lance_min or None,
+        lance_max=lance_max or None,
+    ), TAXAS_DA_TABELA)
+
+
+def preencher_taxas(lotes: pd.DataFrame, padroes: dict, tarifas) -> pd.DataFrame:
+    """
+    ITBI e registro que o arquivo não informou (em branco): pela tabela de
+    tarifas, se ligada, ou pelos percentuais da barra lateral. Os informados
+    no arquivo prevalecem.
+    """
+    if tarifas is not None:
+        return aplicar_tarifas(lotes, tarifas, padroes)
+    return lotes.fillna({coluna: padroes[coluna] for coluna in TAXAS_DA_TABELA})
+
+
+def portfolio_pdf(resultado: pd.DataFrame):
+    """
+    Relatório em PDF de todos os lotes, gerado só quando o usuário clica em
+    baixar. As páginas vão para um arquivo temporário em disco conforme ficam
+    prontas; só o arquivo pronto é lido para o download.
+    """
+    with tempfile.TemporaryFile() as destino:
+        pdf_portfolio(resultado, destino)
+        destino.seek(0)
+        return destino.read()
+
+
+def secao_simulacao(resultado: pd.DataFrame):
+    """
+    Simulação de Monte Carlo das entradas incertas de todos os lotes.
+    """
+    st.header("Simulação de Risco (Monte Carlo)")
+    st.write("""
+    Dívidas, acordo, reforma e valor de mercado raramente saem exatamente como estimado.
+    A simulação sorteia cada um dentro de uma faixa (a estimativa é o valor mais provável)
+    e mostra os percentis do custo total e da margem sobre o valor de mercado.
+    """)
+
+    padrao = Incerteza()
+    col1, col2 = st.columns(2)
+    faixa_debitos = col1.slider("Dívidas passadas (% da estimativa)", 50, 300,
+                                tuple(int(v * 100) for v in padrao.debitos_passados), 5)
+    faixa_acordo = col1.slider("Acordo com ocupante (% da estimativa)", 50, 300,
+                               tuple(int(v * 100) for v in padrao.valor_acordo), 5)
+    faixa_reforma = col2.slider("Reforma (% da estimativa)", 50, 300,
+                                tuple(int(v * 100) for v in padrao.custo_reforma), 5)
+    faixa_mercado = col2.slider("Valor de mercado (% da estimativa)", 50, 150,
+                                tuple(int(v * 100) for v in padrao.valor_mercado), 5)
+    n_amostras = st.select_slider("Sorteios por lote", [10_000, 50_000, 100_000], value=100_000)
+
+    if st.button("Rodar simulação"):
+        incerteza = Incerteza(
+            debitos_passados=tuple(v / 100 for v in faixa_debitos),
+            valor_acordo=tuple(v / 100 for v in faixa_acordo),
+            custo_reforma=tuple(v / 100 for v in faixa_reforma),
+            valor_mercado=tuple(v / 100 for v in faixa_mercado),
+        )
+        with st.spinner("Simulando todos os lotes..."):
+            simulado = simular_portfolio(resultado, n_amostras=n_amostras, incerteza=incerteza)
+        tabela = pd.concat([resultado[["local_imovel", "tipo_imovel", "valor_lance"]], simulado], axis=1)
+        configuracao = {
+            coluna: st.column_config.NumberColumn(format="R$ %.2f")
+            for coluna in tabela.columns if coluna.startswith(("custo_", "margem_", "valor_"))
+        }
+        configuracao["prob_prejuizo"] = st.column_config.ProgressColumn(
+            "Prob. de prejuízo", format="percent", min_value=0.0, max_value=1.0)
+        st.dataframe(tabela, column_config=configuracao, hide_index=True, width="stretch")
+
+
+def main():
+    st.set_page_config(page_title="Portfólio de Lotes - Leilão de Imóveis", layout="wide")
+    st.title("Portfólio de Lotes - Custos de Vários Imóveis de Uma Vez")
+
+    st.write("""
+    Envie um **arquivo CSV** com os lotes que você está analisando (um imóvel por linha) e veja,
+    para todos eles, o detalhamento de custos dos **PASSOS 6, 8 e 10** do checklist:
+    comissão do leiloeiro, ITBI, registro, dívidas, acordo, reforma, honorários e seguro.
+    """)
+
+    with st.expander("Formato do arquivo"):
+        st.markdown("""
+        - Separador `;` ou `,` (detectado automaticamente). Valores podem estar no formato
+          brasileiro (`180.000,00`) ou simples (`180000.00`).
+        - Coluna obrigatória: **lance** (ou `valor_lance`).
+        - Colunas opcionais: `cidade`, `tipo`, `tipo_leilao`, `ocupado`, `itbi`, `registro`,
+          `debitos`, `acordo`, `reforma`, `honorarios`, `seguro`, `mercado`, `pagamento`.
+        - Lotes com `pagamento` "CPC 895" (parcelamento judicial) entram no custo pelo valor
+          presente do parcelamento, com as condições da barra lateral.
+        - Se `itbi` ou `registro` não existirem (ou estiverem em branco), são usados os percentuais
+          da barra lateral.
+        - Com a tabela de tarifas ligada, o ITBI em branco sai do município (texto antes de " - " em
+          `cidade`), o registro em branco é o emolumento da faixa do lance e a comissão vem da coluna
+          opcional `leiloeiro`. Os valores informados no arquivo continuam valendo.
+        - Também é aceita a **Lista de Imóveis** baixada em venda-imoveis.caixa.gov.br
+          (arquivo `Lista_imoveis_UF.csv`), sem nenhuma alteração.
+        """)
+        st.download_button("Baixar modelo de CSV", MODELO_CSV, file_name="modelo_portfolio.csv", mime="text/csv")
+
+    st.sidebar.subheader("Orçamento")
+    valor_orcamento_max = st.sidebar.number_input(
+        "Orçamento máximo global por lote (R$)",
+        min_value=0.0, step=10000.0, format="%.2f",
+        help="Com um orçamento, cada lote ganha o lance máximo que cabe nele e a folga sobre o lance."
+    )
+
+    taxa_desconto_anual = st.sidebar.number_input(
+        "Custo de oportunidade (% ao ano)", min_value=0.0, max_value=50.0, value=10.0, step=0.5, format="%.2f",
+        help="Usado no VPL da revenda e no valor presente do parcelamento judicial."
+    )
+
+    st.sidebar.subheader("Percentuais padrão")
+    perc_itbi = st.sidebar.slider(
+        "Taxa de ITBI (%)",
+        1.0, 5.0, 2.5, 0.5,
+        help="Usada nos lotes sem coluna de ITBI."
+    )
+    perc_registro = st.sidebar.slider(
+        "Porcentagem de registro em cartório (%)",
+        0.5, 2.0, 1.2, 0.1,
+        help="Usada nos lotes sem coluna de registro."
+    )
+    usar_tarifas = st.sidebar.checkbox(
+        "Usar a tabela de tarifas",
+        help="ITBI por município, emolumentos de registro de GO por faixa de valor e comissão por leiloeiro "
+             "(valores ilustrativos em nucleo/dados; confira com a prefeitura, o cartório e o edital)."
+    )
+
+    st.sidebar.subheader("Parcelamento judicial (CPC 895)")
+    cpc_perc_entrada = st.sidebar.slider(
+        "Entrada (%)", PERC_ENTRADA_MINIMA, 90.0, PERC_ENTRADA_MINIMA, 5.0,
+    )
+    cpc_parcelas = st.sidebar.slider("Número de parcelas", 1, PARCELAS_MAXIMAS, PARCELAS_MAXIMAS, 1)
+    cpc_correcao = st.sidebar.number_input(
+        "Correção mensal projetada (%)", min_value=0.0, max_value=5.0, value=0.4, step=0.05, format="%.2f",
+    )
+
+    st.sidebar.subheader("Revenda")
+    prazo_venda = st.sidebar.number_input(
+        "Prazo até a venda (meses)", min_value=1, max_value=120, value=PRAZO_VENDA_MESES, step=1,
+    )
+    perc_custos_venda = st.sidebar.number_input(
+        "Custos de venda (% do preço)", min_value=0.0, max_value=20.0, value=PERC_CUSTOS_VENDA,
+        step=0.5, format="%.1f",
+    )
+    custo_mensal = st.sidebar.number_input(
+        "Manutenção até a venda (R$/mês por lote)", min_value=0.0, step=100.0, format="%.2f",
+    )
+
+    formato = st.radio(
+        "Origem dos lotes:",
+        ["CSV de lotes", "Lista de imóveis da Caixa", "Banco de lotes local"],
+        horizontal=True,
+        help="A lista da Caixa é lida em blocos, então arquivos grandes (todas as UFs) também funcionam."
+    )
+    padroes = {"perc_itbi": perc_itbi, "perc_registro": perc_registro}
+    tarifas = carregar_tabela_tarifas() if usar_tarifas else None
+    banco = abrir_banco_lotes()
+
+    ordenacao = {"Folga sobre o lance máximo": "folga_lance"} if valor_orcamento_max > 0 else {}
+    ordenacao.update({"TIR (ao ano)": "tir_anual", "VPL": "vpl", "ROI": "roi"})
+    criterio = st.selectbox("Ordenar lotes por:", list(ordenacao),
+                            help="Retorno da revenda pelo valor de mercado, com as premissas da barra lateral.")
+
+    def custear(lotes: pd.DataFrame) -> pd.DataFrame:
+        resultado = calcular_portfolio(preencher_taxas(lotes, padroes, tarifas), tarifas)
+        if valor_orcamento_max > 0:
+            resultado = calcular_lance_maximo(resultado, valor_orcamento_max, tarifas)
+        return calcular_retorno_portfolio(resultado, prazo_venda, perc_custos_venda, custo_mensal,
+                                          taxa_desconto_anual)
+
+    if formato == "Banco de lotes local":
+        resumo = resumir_portfolio([custear(consultar_banco(banco))], ordenacao[criterio])
+        if resumo.melhores.empty:
+            st.info("Nenhum lote encontrado. Importe arquivos para o banco ou ajuste os filtros.")
+            return
+    else:
+        arquivo = st.file_uploader("Arquivo CSV de lotes", type=["csv", "txt"])
+        if arquivo is None:
+            st.info("Envie um arquivo para calcular os custos do portfólio.")
+            return
+
+        # As taxas que o arquivo não trouxer ficam em branco: é assim que os lotes vão para o banco
+        try:
+            if formato == "Lista de imóveis da Caixa":
+                # Bloco a bloco: só os totais e os melhores lotes ficam em memória
+                blocos = (custear(normalizar_portfolio(bloco, TAXAS_DA_TABELA))
+                          for bloco in ler_lista_caixa(arquivo))
+                resumo = resumir_portfolio(blocos, ordenacao[criterio], LOTES_EXIBIDOS_CAIXA)
+                if resumo.quantidade == 0:
+                    st.info("A lista da Caixa não tem imóveis com preço.")
+                    return
+            else:
+                lotes = aplicar_cpc895(ler_portfolio_csv(arquivo, TAXAS_DA_TABELA), cpc_perc_entrada,
+                                       cpc_parcelas, cpc_correcao, taxa_desconto_anual)
+                resumo = resumir_portfolio([custear(lotes)], ordenacao[criterio])
+        except ValueError as erro:
+            st.error(str(erro))
+            return
+
+        if st.button("Guardar estes lotes no banco local"):
+            if formato == "Lista de imóveis da Caixa":
+                # Segunda leitura do arquivo, também em blocos, direto para o banco
+                arquivo.seek(0)
+                quantidade = banco.importar(ler_lista_caixa(arquivo), arquivo.name)
+            else:
+                quantidade = banco.importar([lotes], arquivo.name, reindexar=False)
+            st.success(f"{quantidade} lotes gravados no banco local (os que já estavam lá foram atualizados).")
+
+    resultado = resumo.melhores
+
+    st.header("Resumo do Portfólio")
+    # Totais exatos em centavos, com cada taxa arredondada por lote como nas guias
+    totais = resumo.totais
+    soma_lances, custo_total = centavos.formatar([totais["valor_lance"], totais["custo_total_avancado"]])
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Lotes", f"{resumo.quantidade}")
+    col2.metric("Soma dos lances", f"R$ {soma_lances}")
+    col3.metric("Custo total (c/ honorários e seguro)", f"R$ {custo_total}")
+
+    st.header("Detalhamento por Lote")
+    if len(resultado) < resumo.quantidade:
+        st.caption(f"Os {len(resultado)} primeiros de {resumo.quantidade} lotes pelo critério de ordenação; "
+                   "a tabela, o PDF, a exportação e a simulação usam só estes. Guarde a lista no banco local "
+                   "para filtrar os demais.")
+    colunas_monetarias = ["valor_lance", "debitos_passados", "valor_acordo", "custo_reforma",
+                          "honorarios_adv", "seguro_imovel", "valor_mercado", "margem_mercado",
+                          "lance_maximo", "folga_lance", "valor_pago", "lucro_revenda", "vpl", "emolumentos"]
+    configuracao = {
+        coluna: st.column_config.NumberColumn(format="R$ %.2f")
+        for coluna in colunas_monetarias + COLUNAS_CUSTOS
+    }
+    configuracao["roi"] = st.column_config.NumberColumn("ROI", format="percent")
+    configuracao["tir_anual"] = st.column_config.NumberColumn("TIR (a.a.)", format="percent")
+    st.dataframe(resultado, column_config=configuracao, hide_index=True, width="stretch")
+    st.download_button(
+        "Baixar relatório do portfólio em PDF",
+        data=lambda: portfolio_pdf(resultado),
+        file_name="portfolio_lotes.pdf",
+        mime="application/pdf",
+        on_click="ignore",
+        help="Resumo e detalhamento de custos e retorno de cada lote, na ordem da tabela."
+    )
+    col_formato, col_botao = st.columns([2, 3])
+    formato_exportacao = col_formato.radio("Exportar como:", list(FORMATOS), horizontal=True)
+    extensao, tipo_mime = FORMATOS[formato_exportacao]
+    col_botao.download_button(
+        f"Baixar custos de todos os lotes ({formato_exportacao})",
+        data=lambda: exportar_para_download(arredondar_custos(resultado), formato_exportacao),
+        file_name=f"portfolio_custos.{extensao}",
+        mime=tipo_mime,
+        on_click="ignore",
+        help="Todos os valores calculados de cada lote; o CSV pode ser reenviado como portfólio."
+    )
+
+    secao_simulacao(resultado)
@@ -0,0 +1,26 @@
+"""
+Recursos compartilhados entre as páginas e entre as sessões
+(``st.cache_resource``): cada um é aberto uma vez por processo, não uma vez
+por página que o usa.
+"""
+import streamlit as st
+
+from nucleo.estado import BancoChecklists
+from nucleo.tarifas import Tarifas, carregar_tarifas
+
+
+@st.cache_resource
+def abrir_banco_checklists() -> BancoChecklists:
+    """
+    Conexão única com o banco de checklists salvos, compartilhada entre sessões.
+    """
+    return BancoChecklists()
+
+
+@st.cache_resource
+def carregar_tabela_tarifas() -> Tarifas:
+    """
+    Tabela de tarifas (ITBI, emolumentos e comissões) lida uma vez e
+    compartilhada, só para leitura, entre sessões.
+    """
+    return carregar_tarifas()
@@ -1,14 +1,7 @@
 import streamlit as st
 import datetime
 
-# Função auxiliar para formatar valores em estilo brasileiro, ex: 120.000,00
-def format_brl(value: float) -> str:
-    """
-    Formata valor float no estilo brasileiro: 1.234.567,89
-    """
-    if value is None:
-        return ""
-    return f"{value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+from nucleo.formatacao import format_brl
 
 def main():
     st.set_page_config(page_title="Checklist Passo a Passo - Leilão Imóveis", layout="wide")
@@ -354,6 +347,3 @@ def main():
         st.write(f"**Total Geral (Compra + Reforma)**: R$ {total_formatado}")
 
         st.success("Checklist finalizado com sucesso! Guarde este relatório para referência.")
-
-if __name__ == "__main__":
-    main()
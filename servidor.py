@@ -0,0 +1,87 @@
+"""
+Sobe o servidor do aplicativo já aquecido.
+
+    python servidor.py [opções do streamlit run]
+
+Antes de abrir a porta, o processo importa todas as páginas (pandas, NumPy,
+Altair e o pacote ``nucleo``), passa uma vez pelos caminhos que a primeira
+renderização usa (grade de sensibilidade, gráfico do Altair, conversão de
+tabelas para Arrow), abre os bancos locais de lotes e de checklists salvos
+e lê a tabela de tarifas e o índice de cidades/bairros.
+Depois entrega o mesmo processo ao ``streamlit run app.py``: os módulos
+continuam em ``sys.modules``, então o primeiro usuário não paga esse custo.
+
+É o comando do ``postAttachCommand`` do devcontainer. O orçamento de partida
+a frio é medido por ``python -m benchmarks.bench_partida``.
+"""
+import importlib
+import logging
+import sys
+import time
+from pathlib import Path
+
+APP = Path(__file__).resolve().parent / "app.py"
+
+
+def aquecer() -> dict:
+    """
+    Importa as páginas e exercita os caminhos da primeira renderização.
+    Devolve o tempo de cada etapa, em ms.
+    """
+    tempos = {}
+    inicio = time.perf_counter()
+
+    import app
+
+    for modulo, *_ in app.PAGINAS:
+        importlib.import_module(modulo)
+    tempos["importacao_ms"] = (time.perf_counter() - inicio) * 1000
+
+    # Chama as funções do nucleo direto, e não as versões com st.cache_data:
+    # fora do servidor o cache seria criado sem o gerenciador de armazenamento
+    # do runtime.
+    marco = time.perf_counter()
+    from streamlit import dataframe_util
+
+    from nucleo.formatacao import format_brl_array
+    from nucleo.sensibilidade import faixa_lances, grade_sensibilidade, tabela_sensibilidade
+    from paginas.completo import carregar_indice_localidades, grafico_calor
+    from paginas.portfolio import abrir_banco_lotes
+    from paginas.recursos import abrir_banco_checklists, carregar_tabela_tarifas
+
+    lances = faixa_lances(300_000.0)
+    tabela = tabela_sensibilidade(lances, grade_sensibilidade(lances))
+    tabela["custo_formatado"] = format_brl_array(tabela["custo_total_avancado"].to_numpy())
+    grafico_calor(tabela[tabela["valor_lance"] == lances[0]], "perc_itbi", "perc_registro", "ITBI", "Registro").to_dict()
+    dataframe_util.convert_pandas_df_to_arrow_bytes(tabela)
+    tempos["caminhos_ms"] = (time.perf_counter() - marco) * 1000
+
+    # Conexões compartilhadas (st.cache_resource): a primeira sessão já as encontra abertas
+    marco = time.perf_counter()
+    abrir_banco_lotes()
+    abrir_banco_checklists()
+    carregar_tabela_tarifas()
+    carregar_indice_localidades()
+    tempos["tabelas_ms"] = (time.perf_counter() - marco) * 1000
+
+    tempos["total_ms"] = (time.perf_counter() - inicio) * 1000
+    return tempos
+
+
+def main(argv=None):
+    from streamlit.web import cli
+
+    # Fora do servidor o Streamlit avisa que não há runtime nem contexto de
+    # execução; aqui isso é esperado.
+    logging.disable(logging.WARNING)
+    try:
+        tempos = aquecer()
+    finally:
+        logging.disable(logging.NOTSET)
+    print(f"Aquecimento: {tempos['total_ms']:.0f} ms (importação {tempos['importacao_ms']:.0f} ms)", flush=True)
+    sys.argv = ["streamlit", "run", str(APP), *(sys.argv[1:] if argv is None else argv)]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main()
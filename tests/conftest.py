@@ -0,0 +1,2 @@
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: testes demorados (processos novos); pule com -m 'not slow'")
@@ -0,0 +1,68 @@
+import threading
+
+import pandas as pd
+
+from nucleo.banco_lotes import BancoLotes
+
+
+def _lotes(lances=(180_000.0, 95_000.0), numeros=None):
+    lotes = pd.DataFrame({
+        "cidade": ["Goiânia - Setor Bueno", "Anápolis - Jundiaí"],
+        "tipo": ["Apartamento", "Casa"],
+        "lance": list(lances),
+        "mercado": [290_000.0, 160_000.0],
+    })
+    if numeros is not None:
+        lotes["numero_imovel"] = numeros
+    return lotes
+
+
+def _contar(banco):
+    return banco.conexao.execute("SELECT COUNT(*) FROM lotes").fetchone()[0]
+
+
+def test_guardar_de_novo_nao_duplica():
+    with BancoLotes(":memory:") as banco:
+        banco.importar([_lotes()], "portfolio.csv", reindexar=False)
+        banco.importar([_lotes()], "portfolio.csv")
+        assert _contar(banco) == 2
+
+        # Com número do imóvel, o lote repetido é atualizado
+        banco.inserir(_lotes(numeros=["101", "102"]), "Lista_imoveis_GO.csv")
+        banco.inserir(_lotes(lances=(170_000.0, 95_000.0), numeros=["101", "102"]), "Lista_imoveis_GO.csv")
+        assert _contar(banco) == 4
+        assert banco.consultar(lance_max=175_000.0, tipo_imovel="Apartamento")["numero_imovel"].tolist() == ["101"]
+
+
+def test_lote_corrigido_atualiza_e_lotes_iguais_nao_se_fundem():
+    with BancoLotes(":memory:") as banco:
+        banco.importar([_lotes()], "portfolio.csv")
+        # O mesmo arquivo com o lance corrigido: a linha continua sendo o mesmo lote
+        banco.importar([_lotes(lances=(175_000.0, 95_000.0))], "portfolio.csv")
+        assert sorted(banco.consultar()["valor_lance"].tolist()) == [95_000.0, 175_000.0]
+
+        # Dois imóveis idênticos em linhas diferentes são dois lotes
+        iguais = pd.concat([_lotes().head(1)] * 2, ignore_index=True)
+        banco.importar([iguais.head(1), iguais.tail(1)], "iguais.csv")
+        assert _contar(banco) == 4
+
+
+def test_sessoes_simultaneas(tmp_path):
+    erros = []
+    with BancoLotes(str(tmp_path / "lotes.sqlite3")) as banco:
+        def sessao(i):
+            try:
+                for _ in range(10):
+                    banco.inserir(_lotes(lances=(100_000.0 + i, 50_000.0 + i)), f"sessao_{i}.csv")
+                    banco.custear(cidade="Goiânia")
+                    banco.valores_distintos("tipo_imovel")
+            except Exception as erro:
+                erros.append(erro)
+
+        threads = [threading.Thread(target=sessao, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not erros
+        assert _contar(banco) == 16
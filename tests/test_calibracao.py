@@ -0,0 +1,20 @@
+import json
+
+import pytest
+
+from benchmarks.calibracao import carregar_base, gravar_base
+
+
+def test_base_gravada_sem_milissegundos_e_convertida_pela_referencia(tmp_path):
+    caminho = tmp_path / "base.json"
+    gravar_base(caminho, {"completo": {"reexecucoes": 115, "p50_ms": 40.0, "pico_mb": 2.1}}, referencia=20.0)
+    assert json.loads(caminho.read_text(encoding="utf-8")) == {
+        "completo": {"reexecucoes": 115, "p50_ref": 2.0, "pico_mb": 2.1},
+    }
+    # Numa máquina com a metade da velocidade a base dobra em ms
+    base = carregar_base(caminho, referencia=40.0)
+    assert base == {"completo": {"reexecucoes": 115, "p50_ms": pytest.approx(80.0), "pico_mb": 2.1}}
+
+
+def test_base_ausente(tmp_path):
+    assert carregar_base(tmp_path / "nao_existe.json", referencia=10.0) == {}
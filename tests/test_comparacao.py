@@ -0,0 +1,16 @@
+import numpy as np
+import pandas as pd
+
+from nucleo.comparacao import Comparacao
+from nucleo.portfolio import calcular_portfolio, normalizar_portfolio
+
+
+def test_comissao_do_lote_entra_no_custo():
+    lotes = [{"valor_lance": 200_000.0, "perc_comissao": 2.5}, {"valor_lance": 200_000.0}]
+    comparacao = Comparacao(lotes)
+    esperado = calcular_portfolio(normalizar_portfolio(pd.DataFrame({"lance": [200_000.0] * 2}))
+                                  .assign(perc_comissao=[2.5, 5.0]))
+    np.testing.assert_allclose(comparacao.derivados["custo_total_avancado"], esperado["custo_total_avancado"])
+
+    comparacao.alterar(1, "perc_comissao", 2.5)
+    assert comparacao.derivados["comissao_leiloeiro"].tolist() == [5_000.0, 5_000.0]
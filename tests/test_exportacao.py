@@ -0,0 +1,36 @@
+import io
+import math
+import zipfile
+from xml.etree import ElementTree
+
+import pandas as pd
+
+from nucleo.exportacao import gerar_xlsx
+
+_NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def _celulas(df):
+    with zipfile.ZipFile(io.BytesIO(b"".join(gerar_xlsx(df)))) as arquivo:
+        planilha = ElementTree.fromstring(arquivo.read("xl/worksheets/sheet1.xml"))
+    return [[c.findtext("x:v", namespaces=_NS) for c in linha] for linha in planilha.iter(f"{{{_NS['x']}}}row")][1:]
+
+
+def test_xlsx_deixa_valores_nao_finitos_em_branco():
+    df = pd.DataFrame({
+        "valor_lance": [100_000.0, 200_000.0, 300_000.0, 400_000.0],
+        "roi": [0.12, math.inf, -math.inf, math.nan],
+        "tir_anual": [0.15, math.nan, math.inf, 0.02],
+    })
+    assert _celulas(df) == [
+        ["100000.0", "0.12", "0.15"],
+        ["200000.0", None, None],
+        ["300000.0", None, None],
+        ["400000.0", None, "0.02"],
+    ]
+
+
+def test_xlsx_texto_nao_finito_em_branco():
+    df = pd.DataFrame({"local_imovel": ["Goiânia", math.inf], "valor_lance": [1.0, 2.0]})
+    with zipfile.ZipFile(io.BytesIO(b"".join(gerar_xlsx(df)))) as arquivo:
+        assert b">inf<" not in arquivo.read("xl/worksheets/sheet1.xml")
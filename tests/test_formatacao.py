@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nucleo.formatacao import parse_brl, parse_brl_array
+from nucleo.portfolio import normalizar_portfolio
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("180.000", 180_000.0),
+    ("R$ 1.500", 1_500.0),
+    ("1.234.567", 1_234_567.0),
+    ("-2.500", -2_500.0),
+    ("1.234.567,89", 1_234_567.89),
+    ("R$ 1.500,00", 1_500.0),
+    ("180000", 180_000.0),
+    ("1234.56", 1_234.56),
+    ("2.5", 2.5),
+    ("0,35", 0.35),
+])
+def test_parse_brl(texto, esperado):
+    assert parse_brl(texto) == esperado
+    assert parse_brl_array([texto]).tolist() == [esperado]
+
+
+@pytest.mark.parametrize("texto", ["", "   ", None])
+def test_parse_brl_vazio_e_nan(texto):
+    assert math.isnan(parse_brl(texto))
+
+
+@pytest.mark.parametrize("texto", ["12.34.5", "1.23.456", "abc", "R$ 1.5OO", "180 mil"])
+def test_parse_brl_invalido_levanta_erro(texto):
+    with pytest.raises(ValueError, match="inválido"):
+        parse_brl(texto)
+    with pytest.raises(ValueError):
+        parse_brl_array(["1.000,00", texto])
+
+
+def test_normalizar_portfolio_le_milhar_sem_virgula():
+    lotes = normalizar_portfolio(pd.DataFrame({"lance": ["180.000", "R$ 1.500", "1.234.567", "95.000,00"]}))
+    np.testing.assert_array_equal(lotes["valor_lance"], [180_000.0, 1_500.0, 1_234_567.0, 95_000.0])
+
+
+def test_normalizar_portfolio_rejeita_valor_invalido():
+    with pytest.raises(ValueError, match="valor_lance.*12.34.5"):
+        normalizar_portfolio(pd.DataFrame({"lance": ["180.000", "12.34.5"]}))
@@ -0,0 +1,18 @@
+import pytest
+
+from nucleo.localidades import Localidades, carregar_localidades
+
+
+@pytest.mark.parametrize("texto", ["s", "se", "set s", "goiania s", "sul setor"])
+def test_sugestoes_sem_repeticao(texto):
+    indice = carregar_localidades()
+    sugestoes = indice.sugerir(texto, limite=len(indice))
+    assert sugestoes
+    assert len(sugestoes) == len(set(sugestoes))
+
+
+def test_palavras_com_o_mesmo_prefixo_contam_uma_vez():
+    indice = Localidades(["Goiânia - Setor Sul", "Goiânia - Setor Bueno", "Anápolis - Vila Santa Isabel"])
+    assert indice.sugerir("s", limite=8) == ["Goiânia - Setor Sul", "Goiânia - Setor Bueno",
+                                              "Anápolis - Vila Santa Isabel"]
+    assert indice.sugerir("goi se", limite=8) == ["Goiânia - Setor Sul", "Goiânia - Setor Bueno"]
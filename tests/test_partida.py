@@ -0,0 +1,15 @@
+import pytest
+
+from benchmarks.bench_partida import BASE, comparar, medir
+from benchmarks.calibracao import carregar_base, referencia_ms
+
+# Uma repetição só, para o teste não demorar; a folga maior cobre o ruído
+TOLERANCIA = 0.5
+
+
+@pytest.mark.slow
+def test_partida_dentro_do_orcamento():
+    referencia = referencia_ms()
+    base = carregar_base(BASE, referencia)
+    assert base, f"orçamento não encontrado em {BASE}"
+    assert comparar(medir(repeticoes=1), base, TOLERANCIA) == []
@@ -0,0 +1,47 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from nucleo import centavos
+from nucleo.exportacao import exportar_para_download
+from nucleo.portfolio import (COLUNAS_CUSTOS, arredondar_custos, calcular_portfolio, normalizar_portfolio,
+                              resumir_portfolio, totais_centavos)
+
+
+def _portfolio(lotes=2000):
+    rng = np.random.default_rng(7)
+    return calcular_portfolio(normalizar_portfolio(pd.DataFrame({
+        "lance": np.round(rng.uniform(50_000, 900_000, lotes), 2),
+        "itbi": rng.choice([2.0, 2.5, 3.0], lotes),
+        "registro": rng.choice([0.7, 1.2, 1.35], lotes),
+        "debitos": np.round(rng.uniform(0, 9_000, lotes), 2),
+        "mercado": np.round(rng.uniform(80_000, 1_200_000, lotes), 2),
+    })))
+
+
+def test_linhas_arredondadas_somam_os_totais_exatos():
+    resultado = _portfolio()
+    arredondado = arredondar_custos(resultado)
+    totais = totais_centavos(resultado)
+    for coluna in COLUNAS_CUSTOS:
+        assert centavos.somar(centavos.de_reais(arredondado[coluna].to_numpy())) == totais[coluna]
+    np.testing.assert_allclose(arredondado["custo_total_avancado"], resultado["custo_total_avancado"], atol=0.02)
+
+
+def test_csv_exportado_bate_com_os_totais():
+    resultado = _portfolio(50)
+    csv = exportar_para_download(arredondar_custos(resultado), "CSV").decode("utf-8-sig")
+    lido = pd.read_csv(io.StringIO(csv), sep=";", decimal=",")
+    total = centavos.somar(centavos.de_reais(lido["custo_total_avancado"].to_numpy()))
+    assert total == totais_centavos(resultado)["custo_total_avancado"]
+
+
+def test_resumo_em_blocos_bate_com_o_portfolio_inteiro():
+    resultado = _portfolio()
+    blocos = (resultado.iloc[inicio:inicio + 300] for inicio in range(0, len(resultado), 300))
+    resumo = resumir_portfolio(blocos, "margem_mercado", limite=25)
+    assert resumo.quantidade == len(resultado)
+    assert resumo.totais == totais_centavos(resultado)
+    esperado = resultado.sort_values("margem_mercado", ascending=False).head(25)
+    np.testing.assert_array_equal(resumo.melhores["margem_mercado"], esperado["margem_mercado"])
@@ -0,0 +1,37 @@
+import io
+import math
+import re
+import zlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.bench_relatorio import DADOS
+from nucleo.pdf import _percentual, pdf_portfolio
+from nucleo.portfolio import calcular_portfolio, normalizar_portfolio
+from nucleo.relatorio import montar_relatorio
+
+
+@pytest.mark.parametrize("tir_anual", [math.nan, math.inf, -math.inf])
+def test_tir_inexistente_aparece_como_nd(tir_anual):
+    documento = montar_relatorio({**DADOS, "retorno": {**DADOS["retorno"], "tir_anual": tir_anual}})
+    assert "TIR de n/d a.a." in documento
+    assert "nan%" not in documento and "inf%" not in documento
+
+
+def test_percentuais_do_pdf():
+    assert _percentual(np.array([0.0318, np.nan, np.inf])) == ["3,2%", "n/d", "n/d"]
+
+
+def test_pdf_do_portfolio_sem_valores_nan():
+    # Só o primeiro lote tem orçamento: o lance máximo do segundo é NaN
+    resultado = calcular_portfolio(normalizar_portfolio(pd.DataFrame({
+        "lance": [180_000.0, 95_000.0], "orcamento": [300_000.0, np.nan], "mercado": [290_000.0, 160_000.0],
+    })))
+    destino = io.BytesIO()
+    pdf_portfolio(resultado, destino)
+    fluxos = re.findall(rb"stream\n(.*?)\nendstream", destino.getvalue(), re.S)
+    texto = b"".join(zlib.decompress(fluxo) for fluxo in fluxos).decode("cp1252")
+    assert "Lance máximo no orçamento: n/d" in texto
+    assert "nan" not in texto.lower().replace("financ", "")
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from nucleo.retorno import tir_mensal
+
+
+def _vpl(taxa, custo_total, receita_liquida, meses, custo_mensal):
+    parcelas = (1.0 + taxa) ** -np.arange(1, meses + 1)
+    return -custo_total - custo_mensal * parcelas.sum() + receita_liquida * parcelas[-1]
+
+
+@pytest.mark.parametrize("custo_total, receita_liquida, meses, custo_mensal", [
+    (100_000.0, 110_000.0, 12, -500.0),
+    (100_000.0, 95_000.0, 12, -500.0),
+    (100_000.0, 110_000.0, 12, -20_000.0),
+    (100_000.0, 110_000.0, 12, 500.0),
+    (250_000.0, 400_000.0, 120, 1_200.0),
+])
+def test_tir_zera_o_vpl(custo_total, receita_liquida, meses, custo_mensal):
+    taxa = tir_mensal(custo_total, receita_liquida, meses, custo_mensal)[0]
+    assert _vpl(taxa, custo_total, receita_liquida, meses, custo_mensal) == pytest.approx(0.0, abs=1e-4)
+
+
+def test_custo_mensal_negativo_eleva_a_tir():
+    # Receita mensal (ex.: aluguel) até a venda: a raiz fica acima da TIR sem custos mensais
+    tir = tir_mensal([100_000.0] * 3, [110_000.0] * 3, 12, [-500.0, 0.0, 500.0])
+    assert tir[0] == pytest.approx(0.01276, abs=1e-5)
+    assert tir[0] > tir[1] > tir[2]
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from nucleo.parcelamento import aplicar_cpc895
+from nucleo.portfolio import calcular_portfolio, normalizar_portfolio
+from nucleo.simulacao import Incerteza, simular_portfolio
+from nucleo.tarifas import aplicar_tarifas, carregar_tarifas
+
+# Faixas sem largura: cada sorteio repete a estimativa
+SEM_INCERTEZA = Incerteza(*[(1.0, 1.0)] * len(Incerteza._fields))
+
+
+def _portfolio():
+    return normalizar_portfolio(pd.DataFrame({
+        "cidade": ["Goiânia - Setor Bueno", "Anápolis - Jundiaí"],
+        "lance": [180_000.0, 95_000.0],
+        "debitos": [3_500.0, 0.0],
+        "acordo": [0.0, 5_000.0],
+        "reforma": [25_000.0, 15_000.0],
+        "honorarios": [4_000.0, 3_000.0],
+        "seguro": [900.0, 600.0],
+        "mercado": [290_000.0, 160_000.0],
+        "pagamento": ["CPC 895", "À vista"],
+    }))
+
+
+def _confere(lotes):
+    esperado = calcular_portfolio(lotes)
+    simulado = simular_portfolio(lotes, n_amostras=100, incerteza=SEM_INCERTEZA, processos=1, semente=1)
+    np.testing.assert_allclose(simulado["custo_p50"], esperado["custo_total_avancado"], rtol=0, atol=1e-6)
+    np.testing.assert_allclose(simulado["margem_p50"], esperado["margem_mercado"], rtol=0, atol=1e-6)
+
+
+def test_sem_incerteza_reproduz_calcular_portfolio():
+    _confere(_portfolio())
+
+
+def test_sem_incerteza_reproduz_calcular_portfolio_com_cpc895():
+    lotes = aplicar_cpc895(_portfolio(), 25.0, 30, 0.4, 10.0)
+    assert (lotes["valor_pago"] != lotes["valor_lance"]).any()
+    _confere(lotes)
+
+
+def test_sem_incerteza_reproduz_calcular_portfolio_com_tarifas():
+    lotes = _portfolio()
+    lotes["leiloeiro"] = ["Leiloeiro Exemplo B", ""]
+    lotes = aplicar_tarifas(lotes, carregar_tarifas())
+    assert lotes["perc_comissao"].tolist() == [2.5, 5.0]
+    _confere(lotes)
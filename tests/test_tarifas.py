@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from nucleo.custos import calcular_custos, lance_maximo
+from nucleo.portfolio import calcular_lance_maximo, calcular_portfolio, normalizar_portfolio
+from nucleo.tarifas import TAXAS_DA_TABELA, aplicar_tarifas, carregar_tarifas
+
+TARIFAS = carregar_tarifas()
+
+
+def _custo(lance, emolumento, perc_itbi=2.0):
+    return float(calcular_custos(lance, perc_itbi, 0.0, debitos_passados=3_000.0, emolumentos=emolumento)
+                 .custo_total_avancado)
+
+
+@pytest.mark.parametrize("orcamento", [50_000.0, 104_400.0, 180_000.0, 212_345.67, 9_000_000.0])
+def test_lance_maximo_pelas_faixas_cabe_no_orcamento(orcamento):
+    lance = float(lance_maximo(orcamento, 2.0, 0.0, debitos_passados=3_000.0, faixas_registro=TARIFAS))
+    assert _custo(lance, TARIFAS.emolumento(lance)) <= orcamento + 1e-6
+    # Um centavo a mais já passa do orçamento (ou cai numa faixa mais cara que não cabe)
+    acima = lance + 0.01
+    assert _custo(acima, TARIFAS.emolumento(acima)) > orcamento
+
+
+def test_lance_maximo_no_limite_da_faixa():
+    # Entre duas faixas: o lance para no teto da faixa mais barata
+    teto = 100_000.0
+    orcamento = _custo(teto, TARIFAS.emolumento(teto)) + 50.0
+    assert float(lance_maximo(orcamento, 2.0, 0.0, debitos_passados=3_000.0, faixas_registro=TARIFAS)) == teto
+
+
+def test_portfolio_com_tabela_usa_emolumento_fixo():
+    lotes = normalizar_portfolio(pd.DataFrame({"cidade": ["Goiânia", "Anápolis"], "lance": [180_000.0, 95_000.0]}),
+                                 TAXAS_DA_TABELA)
+    lotes = aplicar_tarifas(lotes, TARIFAS)
+    assert lotes["perc_registro"].tolist() == [0.0, 0.0]
+    resultado = calcular_portfolio(lotes)
+    np.testing.assert_allclose(resultado["registro_cartorio"], [TARIFAS.emolumento(180_000.0),
+                                                                TARIFAS.emolumento(95_000.0)])
+
+    resultado = calcular_lance_maximo(resultado, 150_000.0, tarifas=TARIFAS)
+    for lance, perc_itbi in zip(resultado["lance_maximo"], resultado["perc_itbi"]):
+        custo = calcular_custos(lance, perc_itbi, 0.0, emolumentos=TARIFAS.emolumento(lance)).custo_total_avancado
+        assert float(custo) == pytest.approx(150_000.0, abs=0.01) or lance in TARIFAS.limites
+
+
+def test_taxas_do_arquivo_prevalecem_sobre_a_tabela():
+    lotes = normalizar_portfolio(pd.DataFrame({
+        "cidade": ["Goiânia - Setor Bueno", "Goiânia - Centro", "Município fora da tabela"],
+        "lance": ["180.000,00", "95.000,00", "120.000,00"],
+        "itbi": ["4,0", "", ""],
+        "registro": ["", "1,5", ""],
+    }), TAXAS_DA_TABELA)
+    lotes = aplicar_tarifas(lotes, TARIFAS, {"perc_itbi": 3.5})
+    assert lotes["perc_itbi"].tolist() == [4.0, TARIFAS.itbi["goiania"], 3.5]
+    assert lotes["perc_registro"].tolist() == [0.0, 1.5, 0.0]
+    assert lotes["emolumentos"].tolist() == [TARIFAS.emolumento(180_000.0), 0.0, TARIFAS.emolumento(120_000.0)]